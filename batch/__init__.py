@@ -0,0 +1,14 @@
+"""
+Módulo de ejecución por lotes (sin interfaz gráfica)
+Permite correr el modelo en servidores sin PyQt6
+
+El barrido paralelo vive en batch.barrido (python -m batch.barrido).
+"""
+
+from .runner import (cargar_entrada, generar_entrada, construir_simulador,
+                     ejecutar_escenario, calcular_curva, aplanar_estadisticas)
+
+__all__ = [
+    'cargar_entrada', 'generar_entrada', 'construir_simulador',
+    'ejecutar_escenario', 'calcular_curva', 'aplanar_estadisticas'
+]
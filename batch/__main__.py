@@ -0,0 +1,10 @@
+"""
+Punto de entrada: python -m batch
+"""
+
+import sys
+
+from .runner import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Barrido de parámetros en paralelo: algoritmos × marcos × trazas
+
+Uso:
+    python -m batch.barrido traza1.txt traza2.txt -a FIFO LRU OPT -m 4 8 16
+    python -m batch.barrido escenario.json -m 8 16 32 64 --formato csv
+
+Cada combinación es una ejecución independiente de Simulador que se
+reparte en un ProcessPoolExecutor. Las trazas se publican una sola vez en
+memoria compartida (uint32) y los trabajadores las leen sin copiarlas.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+from models import (Simulador, Proceso, ALGORITMOS, MODO_CONTADORES,
+                    crear_algoritmo)
+from .runner import (cargar_entrada, aplanar_estadisticas, escribir_resultado,
+                     contar_paginas)
+
+
+# Trazas visibles en cada proceso trabajador: nombre -> (memoryview, páginas)
+_TRAZAS_TRABAJADOR: Dict[str, tuple] = {}
+_MEMORIAS_TRABAJADOR: List[shared_memory.SharedMemory] = []
+
+
+def _inicializar_trabajador(publicadas: dict):
+    """Se conecta a los bloques de memoria compartida de cada traza"""
+    for nombre, (bloque, longitud, paginas) in publicadas.items():
+        memoria = shared_memory.SharedMemory(name=bloque)
+        _MEMORIAS_TRABAJADOR.append(memoria)
+        vista = memoria.buf[:longitud * 4].cast('I')
+        _TRAZAS_TRABAJADOR[nombre] = (vista, paginas)
+
+
+def ejecutar_tarea(tarea: tuple) -> dict:
+    """
+    Ejecuta una combinación (traza, algoritmo, marcos) y retorna una fila
+
+    Se ejecuta dentro de un proceso trabajador.
+    """
+    nombre_traza, nombre_algoritmo, num_marcos = tarea
+    secuencia, paginas = _TRAZAS_TRABAJADOR[nombre_traza]
+
+    simulador = Simulador(num_marcos, crear_algoritmo(nombre_algoritmo),
+                          modo_eventos=MODO_CONTADORES)
+    proceso = Proceso(1, paginas)
+    proceso.establecer_secuencia(secuencia)
+    simulador.agregar_proceso(proceso)
+    simulador.ejecutar_todo()
+
+    fila = {"traza": nombre_traza, "marcos": num_marcos}
+    fila.update(aplanar_estadisticas(simulador.obtener_estadisticas()))
+    return fila
+
+
+def ejecutar_barrido(trazas: Dict[str, list], algoritmos: List[str],
+                     marcos: List[int],
+                     max_trabajadores: Optional[int] = None) -> list:
+    """
+    Ejecuta todas las combinaciones algoritmo × marcos × traza en paralelo
+
+    Args:
+        trazas: Nombre de la traza -> secuencia de páginas
+        algoritmos: Nombres de algoritmos (ver models.ALGORITMOS)
+        marcos: Cantidades de marcos físicos a evaluar
+        max_trabajadores: Procesos del pool (por defecto, los núcleos)
+
+    Returns:
+        Una fila de estadísticas por combinación, en el orden de la grilla
+    """
+    for nombre in algoritmos:
+        if nombre.upper() not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {nombre}")
+
+    bloques = []
+    publicadas = {}
+    try:
+        for nombre, secuencia in trazas.items():
+            # uint32: las escrituras llevan el bit alto encendido
+            datos = array('I', secuencia)
+            bloque = shared_memory.SharedMemory(
+                create=True, size=max(1, len(datos) * datos.itemsize)
+            )
+            bloques.append(bloque)
+            bloque.buf[:len(datos) * datos.itemsize] = datos.tobytes()
+            paginas = contar_paginas(datos)
+            publicadas[nombre] = (bloque.name, len(datos), paginas)
+
+        tareas = list(itertools.product(trazas, algoritmos, marcos))
+        trabajadores = max_trabajadores or os.cpu_count() or 1
+        trabajadores = max(1, min(trabajadores, len(tareas)))
+        lote = max(1, len(tareas) // (trabajadores * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=trabajadores,
+            initializer=_inicializar_trabajador,
+            initargs=(publicadas,)
+        ) as pool:
+            return list(pool.map(ejecutar_tarea, tareas, chunksize=lote))
+    finally:
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.barrido",
+        description="Barrido paralelo de algoritmos, marcos y trazas"
+    )
+    parser.add_argument("trazas", nargs="+",
+                        help="Escenarios JSON o trazas de texto")
+    parser.add_argument("-a", "--algoritmos", nargs="+",
+                        choices=list(ALGORITMOS), default=list(ALGORITMOS),
+                        help="Algoritmos a comparar (por defecto, todos)")
+    parser.add_argument("-m", "--marcos", nargs="+", type=int, required=True,
+                        help="Cantidades de marcos físicos")
+    parser.add_argument("-j", "--trabajadores", type=int,
+                        help="Procesos en paralelo (por defecto, los núcleos)")
+    parser.add_argument("-f", "--formato", choices=["json", "csv"],
+                        default="csv", help="Formato de salida")
+    return parser
+
+
+def main(argv=None) -> int:
+    """Función principal del barrido"""
+    args = crear_parser().parse_args(argv)
+
+    try:
+        trazas = {
+            ruta: cargar_entrada(ruta)["secuencia"] for ruta in args.trazas
+        }
+        filas = ejecutar_barrido(trazas, args.algoritmos, args.marcos,
+                                 args.trabajadores)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    escribir_resultado(filas, args.formato)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
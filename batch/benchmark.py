@@ -0,0 +1,122 @@
+"""
+Comparación de tiempos y memoria de los modos de registro de eventos
+
+Uso:
+    python -m batch.benchmark
+    python -m batch.benchmark -n 500000 -m 64 -p 1024 -a LRU
+
+Genera una traza aleatoria reproducible y la simula una vez por modo
+(ninguno, contadores, columnar, completo), midiendo el tiempo de pared y
+el pico de memoria asignada con tracemalloc (en una segunda ejecución).
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from models import Simulador, Proceso, ALGORITMOS, MODOS_EVENTOS, crear_algoritmo
+
+
+def generar_traza(longitud: int, paginas: int, semilla: int = 0) -> array:
+    """
+    Genera una traza con localidad: ráfagas sobre un conjunto de trabajo
+    que se desplaza, mezcladas con accesos aleatorios
+    """
+    generador = random.Random(semilla)
+    traza = array('i')
+    base = 0
+    ventana = max(1, paginas // 16)
+    for i in range(longitud):
+        if i % 1000 == 0:
+            base = generador.randrange(paginas)
+        if generador.random() < 0.9:
+            traza.append((base + generador.randrange(ventana)) % paginas)
+        else:
+            traza.append(generador.randrange(paginas))
+    return traza
+
+
+def _simular(traza, paginas: int, num_marcos: int, algoritmo: str,
+             modo: str) -> Simulador:
+    simulador = Simulador(num_marcos, crear_algoritmo(algoritmo),
+                          modo_eventos=modo)
+    proceso = Proceso(1, paginas)
+    proceso.establecer_secuencia(traza)
+    simulador.agregar_proceso(proceso)
+    simulador.ejecutar_todo()
+    return simulador
+
+
+def medir_modo(traza, paginas: int, num_marcos: int, algoritmo: str,
+               modo: str) -> dict:
+    """
+    Simula la traza en un modo y retorna tiempo y memoria pico
+
+    El tiempo se mide sin tracemalloc (que lo distorsiona) y la memoria
+    en una segunda ejecución; el simulador sigue vivo al leer el pico, así
+    que incluye los eventos retenidos.
+    """
+    inicio = time.perf_counter()
+    simulador = _simular(traza, paginas, num_marcos, algoritmo, modo)
+    segundos = time.perf_counter() - inicio
+    page_faults = simulador.procesos[1].page_faults
+    del simulador
+
+    tracemalloc.start()
+    simulador = _simular(traza, paginas, num_marcos, algoritmo, modo)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del simulador
+
+    return {
+        "modo": modo,
+        "segundos": round(segundos, 3),
+        "pico_mb": round(pico / (1024 * 1024), 2),
+        "page_faults": page_faults
+    }
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.benchmark",
+        description="Compara los modos de registro de eventos del simulador"
+    )
+    parser.add_argument("-n", "--referencias", type=int, default=200000,
+                        help="Longitud de la traza generada")
+    parser.add_argument("-p", "--paginas", type=int, default=512,
+                        help="Páginas virtuales del proceso")
+    parser.add_argument("-m", "--marcos", type=int, default=32,
+                        help="Número de marcos físicos")
+    parser.add_argument("-a", "--algoritmo", choices=list(ALGORITMOS),
+                        default="FIFO", help="Algoritmo de reemplazo")
+    parser.add_argument("--semilla", type=int, default=0,
+                        help="Semilla de la traza generada")
+    return parser
+
+
+def main(argv=None) -> int:
+    """Función principal del benchmark"""
+    args = crear_parser().parse_args(argv)
+    traza = generar_traza(args.referencias, args.paginas, args.semilla)
+
+    resultados = [
+        medir_modo(traza, args.paginas, args.marcos, args.algoritmo, modo)
+        for modo in MODOS_EVENTOS
+    ]
+
+    referencia = resultados[-1]["segundos"] or 1e-9
+    print(f"{args.referencias} referencias, {args.marcos} marcos, "
+          f"{args.algoritmo}")
+    print(f"{'modo':<12}{'segundos':>10}{'pico MB':>10}{'aceleración':>13}")
+    for fila in resultados:
+        aceleracion = referencia / (fila["segundos"] or 1e-9)
+        print(f"{fila['modo']:<12}{fila['segundos']:>10.3f}"
+              f"{fila['pico_mb']:>10.2f}{aceleracion:>12.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
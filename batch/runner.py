@@ -0,0 +1,558 @@
+"""
+Ejecución por lotes de un escenario o una traza
+
+Uso:
+    python -m batch escenario.json
+    python -m batch traza.txt --algoritmo LRU --marcos 64 --formato csv
+    python -m batch traza.txt --curva OPT --marcos 128
+    python -m batch traza_enorme.txt --flujo --marcos 256 --paginas 65536
+    python -m batch direcciones.u64 --direcciones u64 --tamano-pagina 4096 -m 64
+    python -m batch --generar zipf --longitud 100000000 --paginas 65536 -m 512
+
+Este módulo no importa PyQt6: solo depende de models y utils.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import Optional
+
+from models import (Simulador, Proceso, FlujoReferencias, ALGORITMOS,
+                    MODOS_EVENTOS, MODO_CONTADORES, TABLAS_PAGINAS,
+                    TablaPaginasInvertida, TLB, REEMPLAZOS_TLB,
+                    ModeloCostos, AlmacenRespaldo, BIT_ESCRITURA,
+                    MASCARA_PAGINA, PRECARGAS, GeneradorCarga, MODELOS_CARGA,
+                    PLANIFICADORES, ASIGNACIONES, ALCANCES_REEMPLAZO,
+                    ALCANCE_LOCAL, crear_algoritmo, crear_precarga,
+                    crear_planificador, crear_asignador,
+                    crear_tabla_paginas, calcular_curva_fallos)
+from utils import (cargar_escenario, cargar_traza, iterar_traza,
+                   mapear_traza_binaria, es_traza_binaria,
+                   cargar_traza_direcciones, EXTENSION_DIRECCIONES,
+                   FORMATOS_DIRECCIONES)
+
+
+def cargar_entrada(ruta: str, flujo: bool = False,
+                   direcciones: Optional[str] = None,
+                   tamano_pagina: int = 4096) -> dict:
+    """
+    Carga un escenario JSON, una traza de texto o una traza binaria
+    
+    Args:
+        ruta: Escenario .json, traza binaria .mvt, arreglo uint32 crudo
+            .bin (mapeado en memoria) o texto con números de página
+        flujo: Si es True, la traza de texto se lee línea por línea
+            durante la simulación en lugar de cargarse completa
+        direcciones: Formato de una traza de direcciones virtuales
+            (ver FORMATOS_DIRECCIONES); los archivos .addr se leen como
+            texto. Las páginas virtuales salen de la huella de la traza
+        tamano_pagina: Bytes por página al dividir las direcciones
+    
+    Returns:
+        Diccionario con las mismas claves que un escenario JSON
+        (marcos_fisicos, algoritmo, paginas_virtuales, secuencia);
+        las que la traza no define quedan en None
+    """
+    if direcciones is None and ruta.lower().endswith(EXTENSION_DIRECCIONES):
+        direcciones = "texto"
+    if direcciones is not None:
+        return cargar_traza_direcciones(ruta, tamano_pagina, direcciones)
+    
+    if ruta.lower().endswith(".json") or es_traza_binaria(ruta):
+        return cargar_escenario(ruta)
+    
+    if ruta.lower().endswith(".bin"):
+        secuencia = mapear_traza_binaria(ruta)
+    elif flujo:
+        secuencia = FlujoReferencias(lambda: iterar_traza(ruta))
+    else:
+        secuencia = cargar_traza(ruta)
+    return {
+        "marcos_fisicos": None,
+        "algoritmo": None,
+        "paginas_virtuales": None,
+        "secuencia": secuencia
+    }
+
+
+def generar_entrada(modelo: str, longitud: int, num_paginas: int,
+                    semilla: Optional[int] = None, flujo: bool = False,
+                    num_procesos: int = 1, **parametros) -> dict:
+    """
+    Escenario con una carga sintética (ver GeneradorCarga)
+    
+    Con flujo, las secuencias se generan por bloques durante la
+    simulación en lugar de materializarse completas. Con varios procesos,
+    el proceso i usa la semilla + i - 1. La clave 'carga' guarda el
+    modelo y la semilla usados.
+    """
+    procesos = {}
+    info = None
+    for proceso_id in range(1, num_procesos + 1):
+        generador = GeneradorCarga(num_paginas, modelo, semilla, **parametros)
+        if info is None:
+            info = dict(generador.obtener_info(), procesos=num_procesos)
+        semilla = generador.semilla + 1
+        if flujo:
+            procesos[proceso_id] = generador.flujo(longitud)
+        else:
+            procesos[proceso_id] = generador.secuencia(longitud)
+    return {
+        "marcos_fisicos": None,
+        "algoritmo": None,
+        "paginas_virtuales": num_paginas,
+        "procesos": procesos,
+        "secuencia": procesos[1],
+        "carga": info
+    }
+
+
+def contar_paginas(secuencia) -> int:
+    """Páginas virtuales que cubre una secuencia (ignora el bit de escritura)"""
+    if not len(secuencia):
+        return 1
+    maxima = max(secuencia)
+    if maxima & BIT_ESCRITURA:
+        maxima = max(referencia & MASCARA_PAGINA for referencia in secuencia)
+    return maxima + 1
+
+
+def construir_simulador(escenario: dict, algoritmo: Optional[str] = None,
+                        num_marcos: Optional[int] = None,
+                        num_paginas: Optional[int] = None,
+                        periodo_reset_referencia: int = 0,
+                        modo_eventos: str = MODO_CONTADORES,
+                        tabla: str = "lineal", niveles: int = 2,
+                        tlb_entradas: int = 0, tlb_asociatividad: int = 0,
+                        tlb_reemplazo: str = "LRU",
+                        costos: Optional[dict] = None,
+                        preferir_limpias: bool = False,
+                        almacen: Optional[dict] = None,
+                        precarga: Optional[str] = None,
+                        ventana_precarga: int = 0,
+                        planificador: Optional[str] = None,
+                        quantum: int = 10, ceder_en_fallo: bool = False,
+                        semilla_planificador: Optional[int] = None,
+                        asignacion: Optional[str] = None,
+                        minimo_marcos: int = 1,
+                        alcance_reemplazo: str = ALCANCE_LOCAL,
+                        prioridades: Optional[dict] = None,
+                        ventana_conjunto: int = 0,
+                        control_carga: bool = False,
+                        intervalos_pff: tuple = (10, 100),
+                        ventana_wsclock: int = 1000,
+                        avances_wsclock: int = 0) -> Simulador:
+    """
+    Crea un Simulador a partir de un escenario
+    
+    Los argumentos explícitos tienen prioridad sobre el escenario. Por
+    defecto solo se cuentan los eventos: en lotes nadie lee los mensajes.
+    'tabla' elige la tabla de páginas: lineal, multinivel (con 'niveles'),
+    hash o invertida. Con tlb_entradas > 0 se agrega una TLB. 'costos'
+    (argumentos de ModeloCostos, puede ser {}) activa el modelo de latencias.
+    Con preferir_limpias el algoritmo evita desalojar páginas modificadas.
+    'almacen' (argumentos de AlmacenRespaldo) simula la E/S de los fallos.
+    'precarga' nombra un precargador de PRECARGAS; ventana_precarga > 0
+    fija su ventana inicial (o el grado, en la detección de zancadas).
+    'planificador' nombra una política de PLANIFICADORES; las marcas de
+    tiempo del escenario ('marcas_tiempo', id -> marcas) ordenan "marcas".
+    'asignacion' nombra una política de ASIGNACIONES (cuotas de al menos
+    minimo_marcos por proceso); las prioridades (id -> prioridad) pueden
+    venir también del escenario ('prioridades'). ventana_conjunto (Δ)
+    sigue los conjuntos de trabajo, que usan la asignación
+    "conjunto_trabajo" y control_carga; intervalos_pff son los intervalos
+    entre fallos (mínimo, máximo) de la asignación "pff".
+    ventana_wsclock (Δ) y avances_wsclock (avances de la manecilla por
+    fallo; 0 = una vuelta) configuran el algoritmo WSCLOCK.
+    Si el escenario trae varias secuencias en 'procesos' (trazas .mvt), se
+    crea un proceso por cada una; si no, un único proceso 1.
+    """
+    nombre = algoritmo or escenario.get("algoritmo") or "FIFO"
+    marcos = num_marcos or escenario.get("marcos_fisicos")
+    if not marcos:
+        raise ValueError("Debe indicar el número de marcos (--marcos)")
+    
+    secuencias = escenario.get("procesos") or {1: escenario["secuencia"]}
+    paginas = num_paginas or escenario.get("paginas_virtuales")
+    if not paginas:
+        if any(isinstance(secuencia, FlujoReferencias)
+               for secuencia in secuencias.values()):
+            raise ValueError(
+                "Al leer en flujo debe indicar las páginas virtuales (--paginas)"
+            )
+        paginas = max(contar_paginas(secuencia)
+                      for secuencia in secuencias.values())
+    
+    tlb = None
+    if tlb_entradas:
+        tlb = TLB(tlb_entradas, tlb_asociatividad, tlb_reemplazo)
+    opciones_algoritmo = {"preferir_limpias": preferir_limpias}
+    if nombre.upper() == "WSCLOCK":
+        opciones_algoritmo["ventana"] = ventana_wsclock
+        opciones_algoritmo["max_avances"] = avances_wsclock
+    algoritmo_reemplazo = crear_algoritmo(nombre, **opciones_algoritmo)
+    simulador = Simulador(marcos, algoritmo_reemplazo,
+                          periodo_reset_referencia, modo_eventos, tlb=tlb,
+                          costos=None if costos is None else ModeloCostos(**costos),
+                          almacen=None if almacen is None else AlmacenRespaldo(**almacen),
+                          precarga=_crear_precarga(precarga, ventana_precarga),
+                          planificador=_crear_planificador(
+                              planificador, quantum, ceder_en_fallo,
+                              semilla_planificador
+                          ),
+                          asignador=_crear_asignador(asignacion, minimo_marcos,
+                                                     ventana_conjunto,
+                                                     intervalos_pff),
+                          alcance_reemplazo=alcance_reemplazo,
+                          ventana_conjunto=ventana_conjunto,
+                          control_carga=control_carga)
+    marcas_tiempo = escenario.get("marcas_tiempo") or {}
+    if prioridades is None:
+        prioridades = escenario.get("prioridades") or {}
+    invertida = TablaPaginasInvertida(marcos) if tabla == "invertida" else None
+    for proceso_id, secuencia in secuencias.items():
+        if invertida is not None:
+            tabla_paginas = invertida.para_proceso(proceso_id, paginas)
+        elif tabla == "multinivel":
+            tabla_paginas = crear_tabla_paginas(tabla, paginas, niveles=niveles)
+        else:
+            tabla_paginas = crear_tabla_paginas(tabla, paginas)
+        proceso = Proceso(proceso_id, paginas, tabla_paginas=tabla_paginas,
+                          prioridad=prioridades.get(proceso_id, 1))
+        proceso.establecer_secuencia(secuencia, marcas_tiempo.get(proceso_id))
+        simulador.agregar_proceso(proceso)
+    return simulador
+
+
+def _crear_precarga(nombre: Optional[str], ventana: int):
+    """Precargador pedido por línea de comandos (None si no hay)"""
+    if not nombre:
+        return None
+    if ventana <= 0:
+        return crear_precarga(nombre)
+    if nombre == "zancada":
+        return crear_precarga(nombre, grado=ventana)
+    return crear_precarga(nombre, ventana=ventana)
+
+
+def _crear_asignador(nombre: Optional[str], minimo: int, ventana: int,
+                     intervalos_pff: tuple):
+    """Política de asignación pedida por línea de comandos (None = ninguna)"""
+    if not nombre:
+        return None
+    if nombre == "conjunto_trabajo" and ventana:
+        return crear_asignador(nombre, minimo=minimo, ventana=ventana)
+    if nombre == "pff":
+        return crear_asignador(nombre, minimo=minimo,
+                               intervalo_minimo=intervalos_pff[0],
+                               intervalo_maximo=intervalos_pff[1])
+    return crear_asignador(nombre, minimo=minimo)
+
+
+def _crear_planificador(nombre: Optional[str], quantum: int,
+                        ceder_en_fallo: bool, semilla: Optional[int]):
+    """Planificador pedido por línea de comandos (None = por defecto)"""
+    if not nombre:
+        return None
+    if nombre == "rr":
+        return crear_planificador(nombre, quantum=quantum,
+                                  ceder_en_fallo=ceder_en_fallo)
+    if nombre == "aleatorio":
+        return crear_planificador(nombre, semilla=semilla)
+    return crear_planificador(nombre)
+
+
+def ejecutar_escenario(escenario: dict, **opciones) -> dict:
+    """
+    Ejecuta la simulación completa y retorna las estadísticas
+    
+    Args:
+        escenario: Diccionario devuelto por cargar_entrada
+        **opciones: Argumentos de construir_simulador
+    """
+    simulador = construir_simulador(escenario, **opciones)
+    simulador.ejecutar_todo()
+    
+    estadisticas = simulador.obtener_estadisticas()
+    estadisticas["procesos"] = [
+        proceso.obtener_estadisticas()
+        for proceso in simulador.procesos.values()
+    ]
+    if "huella" in escenario:
+        # Páginas distintas de una traza de direcciones
+        estadisticas["huella"] = escenario["huella"]
+    if "carga" in escenario:
+        estadisticas["carga"] = escenario["carga"]
+    return estadisticas
+
+
+def calcular_curva(escenario: dict, algoritmo: str = "LRU",
+                   num_marcos: Optional[int] = None) -> list:
+    """
+    Fallos para 1..num_marcos marcos en una sola pasada (LRU u OPT)
+    
+    Returns:
+        Una fila por tamaño de memoria: marcos, page_faults, tasa_fallos
+    """
+    secuencia = escenario["secuencia"]
+    curva = calcular_curva_fallos(secuencia, algoritmo,
+                                  num_marcos or escenario.get("marcos_fisicos"))
+    if isinstance(secuencia, FlujoReferencias):
+        total = secuencia.consumidas
+    else:
+        total = len(secuencia)
+    return [
+        {
+            "marcos": k,
+            "page_faults": fallos,
+            "tasa_fallos": (fallos / total * 100) if total > 0 else 0
+        }
+        for k, fallos in enumerate(curva, start=1)
+    ]
+
+
+def aplanar_estadisticas(estadisticas: dict, prefijo: str = "") -> dict:
+    """
+    Aplana diccionarios anidados (clave.subclave) para exportar a CSV
+    
+    Las listas (estadísticas por proceso) se omiten.
+    """
+    plano = {}
+    for clave, valor in estadisticas.items():
+        nombre = f"{prefijo}{clave}"
+        if isinstance(valor, dict):
+            plano.update(aplanar_estadisticas(valor, f"{nombre}."))
+        elif not isinstance(valor, list):
+            plano[nombre] = valor
+    return plano
+
+
+def escribir_resultado(resultado, formato: str, salida=None):
+    """Escribe las estadísticas (un diccionario o una lista de filas) en JSON o CSV"""
+    salida = salida or sys.stdout
+    if formato == "csv":
+        filas = resultado if isinstance(resultado, list) else [resultado]
+        filas = [aplanar_estadisticas(fila) for fila in filas]
+        columnas = list(dict.fromkeys(c for fila in filas for c in fila))
+        escritor = csv.DictWriter(salida, fieldnames=columnas, restval="")
+        escritor.writeheader()
+        escritor.writerows(filas)
+    else:
+        json.dump(resultado, salida, indent=4)
+        salida.write("\n")
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch",
+        description="Ejecuta el simulador de memoria virtual sin interfaz"
+    )
+    parser.add_argument("entrada", nargs="?",
+                        help="Escenario JSON, traza de texto o de direcciones")
+    parser.add_argument("-a", "--algoritmo", choices=list(ALGORITMOS),
+                        help="Algoritmo de reemplazo")
+    parser.add_argument("-m", "--marcos", type=int,
+                        help="Número de marcos físicos")
+    parser.add_argument("-p", "--paginas", type=int,
+                        help="Número de páginas virtuales")
+    parser.add_argument("--flujo", action="store_true",
+                        help="Lee la traza de texto o genera la carga en flujo "
+                             "(memoria constante)")
+    parser.add_argument("--direcciones", choices=list(FORMATOS_DIRECCIONES),
+                        help="La entrada es una traza de direcciones virtuales "
+                             "(texto hex/decimal o arreglo crudo u32/u64)")
+    parser.add_argument("--tamano-pagina", type=int, default=4096,
+                        help="Bytes por página al dividir direcciones")
+    parser.add_argument("--generar", choices=list(MODELOS_CARGA),
+                        help="Simula una carga sintética en lugar de una "
+                             "entrada (requiere --paginas)")
+    parser.add_argument("--longitud", type=int, default=100_000,
+                        help="Referencias de la carga sintética")
+    parser.add_argument("--semilla", type=int,
+                        help="Semilla de la carga sintética (al azar si falta)")
+    parser.add_argument("--escrituras", type=float, default=0.0,
+                        help="Fracción de escrituras de la carga sintética")
+    parser.add_argument("--alfa", type=float, default=1.0,
+                        help="Exponente de Zipf de la carga sintética")
+    parser.add_argument("--procesos", type=int, default=1,
+                        help="Procesos de la carga sintética (semillas "
+                             "consecutivas)")
+    parser.add_argument("--curva", choices=["LRU", "OPT"],
+                        help="Calcula los fallos para 1..--marcos marcos en "
+                             "una sola pasada en lugar de simular")
+    parser.add_argument("--periodo-reset", type=int, default=0,
+                        help="Ticks entre limpiezas del bit R (0 = nunca)")
+    parser.add_argument("--tabla", choices=list(TABLAS_PAGINAS) + ["invertida"],
+                        default="lineal", help="Tabla de páginas del proceso")
+    parser.add_argument("--niveles", type=int, choices=[2, 3], default=2,
+                        help="Niveles de la tabla multinivel")
+    parser.add_argument("--tlb", type=int, default=0,
+                        help="Entradas de la TLB (0 = sin TLB)")
+    parser.add_argument("--tlb-vias", type=int, default=0,
+                        help="Asociatividad de la TLB (0 = totalmente asociativa)")
+    parser.add_argument("--tlb-reemplazo", choices=list(REEMPLAZOS_TLB),
+                        default="LRU", help="Reemplazo dentro de cada conjunto")
+    parser.add_argument("--preferir-limpias", action="store_true",
+                        help="El algoritmo evita desalojar páginas modificadas")
+    parser.add_argument("--costos", action="store_true",
+                        help="Reporta tiempo efectivo de acceso y latencias")
+    parser.add_argument("--latencia-memoria", type=float, default=100,
+                        help="Latencia de un acceso a memoria (ns)")
+    parser.add_argument("--latencia-tlb", type=float, default=20,
+                        help="Latencia de una consulta a la TLB (ns)")
+    parser.add_argument("--servicio-fallo", type=float, default=8_000_000,
+                        help="Tiempo de servicio de un fallo de página (ns)")
+    parser.add_argument("--costo-escritura", type=float, default=8_000_000,
+                        help="Costo extra de desalojar una página modificada (ns)")
+    parser.add_argument("--almacen", action="store_true",
+                        help="Simula la E/S de los fallos: los procesos se "
+                             "bloquean mientras los demás ejecutan")
+    parser.add_argument("--cola", type=int, default=1,
+                        help="Solicitudes que el almacén atiende en paralelo")
+    parser.add_argument("--servicio-almacen", type=float, default=100_000,
+                        help="Latencia fija de cada solicitud de E/S (ns)")
+    parser.add_argument("--ancho-banda", type=float, default=500,
+                        help="Ancho de banda del almacén (MB/s)")
+    parser.add_argument("--tiempo-referencia", type=float, default=100,
+                        help="Tiempo de CPU de cada referencia (ns)")
+    parser.add_argument("--precarga", choices=list(PRECARGAS),
+                        help="Precarga páginas predichas en cada fallo")
+    parser.add_argument("--ventana-precarga", type=int, default=0,
+                        help="Ventana inicial de la precarga (o grado de "
+                             "la zancada; 0 = valor por defecto)")
+    parser.add_argument("--planificador", choices=list(PLANIFICADORES),
+                        help="Política que intercala los procesos (por "
+                             "defecto, uno tras otro)")
+    parser.add_argument("--quantum", type=int, default=10,
+                        help="Referencias por turno del planificador rr")
+    parser.add_argument("--ceder-en-fallo", action="store_true",
+                        help="Con rr, un fallo de página termina el turno")
+    parser.add_argument("--semilla-planificador", type=int,
+                        help="Semilla del planificador aleatorio")
+    parser.add_argument("--asignacion", choices=list(ASIGNACIONES),
+                        help="Política de asignación de marcos por proceso "
+                             "(por defecto, marcos libres por orden de llegada)")
+    parser.add_argument("--minimo-marcos", type=int, default=1,
+                        help="Cuota mínima de marcos de cada proceso")
+    parser.add_argument("--prioridades",
+                        help="Prioridades de los procesos 1, 2, ... separadas "
+                             "por comas (asignación por prioridad)")
+    parser.add_argument("--reemplazo", choices=list(ALCANCES_REEMPLAZO),
+                        default=ALCANCE_LOCAL,
+                        help="Reemplazo local (entre las páginas del proceso) "
+                             "o global")
+    parser.add_argument("--ventana-conjunto", type=int, default=0,
+                        help="Ventana Δ (referencias) de los conjuntos de "
+                             "trabajo; 0 = no seguirlos")
+    parser.add_argument("--control-carga", action="store_true",
+                        help="Suspende procesos mientras sus conjuntos de "
+                             "trabajo no quepan en memoria")
+    parser.add_argument("--intervalos-pff", type=int, nargs=2,
+                        default=(10, 100), metavar=("MINIMO", "MAXIMO"),
+                        help="Referencias entre fallos por debajo de las que "
+                             "la asignación pff crece y por encima de las que "
+                             "se achica")
+    parser.add_argument("--ventana-wsclock", type=int, default=1000,
+                        help="Edad (referencias del proceso) a partir de la "
+                             "que WSCLOCK considera una página fuera del "
+                             "conjunto de trabajo")
+    parser.add_argument("--avances-wsclock", type=int, default=0,
+                        help="Marcos que WSCLOCK recorre como máximo por "
+                             "fallo; 0 = una vuelta completa")
+    parser.add_argument("--eventos", choices=list(MODOS_EVENTOS),
+                        default=MODO_CONTADORES,
+                        help="Registro de eventos durante la simulación")
+    parser.add_argument("-f", "--formato", choices=["json", "csv"],
+                        default="json", help="Formato de salida")
+    return parser
+
+
+def _parsear_prioridades(texto: Optional[str]) -> Optional[dict]:
+    """Prioridades "3,1,1" -> {1: 3, 2: 1, 3: 1}"""
+    if not texto:
+        return None
+    try:
+        return {proceso_id: int(valor)
+                for proceso_id, valor in enumerate(texto.split(","), 1)}
+    except ValueError:
+        raise ValueError(f"Prioridades inválidas: {texto}") from None
+
+
+def main(argv=None) -> int:
+    """Función principal de la ejecución por lotes"""
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if (args.entrada is None) == (args.generar is None):
+        parser.error("indique una entrada o --generar, pero no ambas")
+    if args.generar and not args.paginas:
+        parser.error("--generar requiere --paginas")
+    
+    costos = None
+    if args.costos:
+        costos = {
+            "latencia_memoria_ns": args.latencia_memoria,
+            "latencia_tlb_ns": args.latencia_tlb,
+            "servicio_fallo_ns": args.servicio_fallo,
+            "escritura_ns": args.costo_escritura
+        }
+    
+    almacen = None
+    if args.almacen:
+        almacen = {
+            "profundidad_cola": args.cola,
+            "tiempo_servicio_ns": args.servicio_almacen,
+            "ancho_banda_mb_s": args.ancho_banda,
+            "tiempo_referencia_ns": args.tiempo_referencia
+        }
+    
+    try:
+        if args.generar:
+            escenario = generar_entrada(
+                args.generar, args.longitud, args.paginas, args.semilla,
+                args.flujo, args.procesos,
+                fraccion_escrituras=args.escrituras, alfa=args.alfa
+            )
+        else:
+            escenario = cargar_entrada(args.entrada, args.flujo,
+                                       args.direcciones, args.tamano_pagina)
+        if args.curva:
+            resultado = calcular_curva(escenario, args.curva, args.marcos)
+        else:
+            resultado = ejecutar_escenario(
+                escenario,
+                algoritmo=args.algoritmo,
+                num_marcos=args.marcos,
+                num_paginas=args.paginas,
+                periodo_reset_referencia=args.periodo_reset,
+                modo_eventos=args.eventos,
+                tabla=args.tabla,
+                niveles=args.niveles,
+                tlb_entradas=args.tlb,
+                tlb_asociatividad=args.tlb_vias,
+                tlb_reemplazo=args.tlb_reemplazo,
+                costos=costos,
+                preferir_limpias=args.preferir_limpias,
+                almacen=almacen,
+                precarga=args.precarga,
+                ventana_precarga=args.ventana_precarga,
+                planificador=args.planificador,
+                quantum=args.quantum,
+                ceder_en_fallo=args.ceder_en_fallo,
+                semilla_planificador=args.semilla_planificador,
+                asignacion=args.asignacion,
+                minimo_marcos=args.minimo_marcos,
+                alcance_reemplazo=args.reemplazo,
+                prioridades=_parsear_prioridades(args.prioridades),
+                ventana_conjunto=args.ventana_conjunto,
+                control_carga=args.control_carga,
+                intervalos_pff=tuple(args.intervalos_pff),
+                ventana_wsclock=args.ventana_wsclock,
+                avances_wsclock=args.avances_wsclock
+            )
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    
+    escribir_resultado(resultado, args.formato)
+    return 0
@@ -6,9 +6,12 @@ Conecta el modelo con la vista
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
 
-from models import (Simulador, Proceso, FIFO, LRU, NRU, CLOCK, OPT)
+from models import (Simulador, Proceso, FIFO, ALGORITMOS, MASCARA_PAGINA,
+                    MODO_COLUMNAR, crear_algoritmo)
 from views import MainView
-from utils import guardar_escenario, cargar_escenario
+from utils import (guardar_escenario, cargar_escenario, parsear_referencia,
+                   cargar_traza_direcciones, es_traza_binaria,
+                   EXTENSION_BINARIA, EXTENSION_DIRECCIONES)
 
 
 class MainController:
@@ -63,15 +66,25 @@ class MainController:
         controles['btn_guardar_json'].clicked.connect(self.guardar_escenario_json)
         controles['btn_cargar_json'].clicked.connect(self.cargar_escenario_json)
     
-    def inicializar_modelo(self):
-        """Inicializa el modelo de datos"""
+    def inicializar_modelo(self, num_paginas=None):
+        """
+        Inicializa el modelo de datos
+        
+        Args:
+            num_paginas: Páginas virtuales del proceso (por defecto, las
+                         del control de la vista)
+        """
         num_marcos = self.vista.obtener_spin_marcos().value()
         algoritmo = self.obtener_algoritmo()
         
-        self.simulador = Simulador(num_marcos, algoritmo)
+        # La vista solo lee el evento de cada paso: el historial se guarda
+        # compacto en columnas
+        self.simulador = Simulador(num_marcos, algoritmo,
+                                   modo_eventos=MODO_COLUMNAR)
         
-        sim_view = self.vista.obtener_simulacion_view()
-        num_paginas = sim_view.obtener_controles()['spin_paginas'].value()
+        if num_paginas is None:
+            sim_view = self.vista.obtener_simulacion_view()
+            num_paginas = sim_view.obtener_controles()['spin_paginas'].value()
         self.proceso_actual = Proceso(1, num_paginas, "#3498db")
         self.simulador.agregar_proceso(self.proceso_actual)
         
@@ -84,14 +97,9 @@ class MainController:
     def obtener_algoritmo(self):
         """Retorna la instancia del algoritmo seleccionado"""
         nombre = self.vista.obtener_combo_algoritmo().currentText()
-        algoritmos = {
-            "FIFO": FIFO(),
-            "LRU": LRU(),
-            "NRU": NRU(),
-            "CLOCK": CLOCK(),
-            "OPT": OPT()
-        }
-        return algoritmos.get(nombre, FIFO())
+        if nombre not in ALGORITMOS:
+            return FIFO()
+        return crear_algoritmo(nombre)
     
     # ========== ACTUALIZACIÓN DE VISTA ==========
     
@@ -139,12 +147,18 @@ class MainController:
         if self.ejecutando:
             return
         
-        self.proceso_actual.generar_secuencia_aleatoria(20)
         controles = self.vista.obtener_simulacion_view().obtener_controles()
+        modelo = controles['combo_modelo'].currentText()
+        # 0 es el valor especial "Semilla al azar"
+        semilla = controles['spin_semilla'].value() or None
+        semilla = self.proceso_actual.generar_secuencia_aleatoria(
+            controles['spin_longitud'].value(), modelo, semilla
+        )
         sec = ",".join(map(str, self.proceso_actual.secuencia_accesos))
         controles['txt_secuencia'].setText(sec)
         controles['log'].agregar_evento(
-            f"Secuencia aleatoria generada: {sec[:50]}...", "INFO"
+            f"Secuencia {modelo} generada (semilla {semilla}): {sec[:50]}...",
+            "INFO"
         )
     
     def cargar_secuencia(self):
@@ -162,10 +176,11 @@ class MainController:
             return
         
         try:
-            secuencia = [int(x.strip()) for x in texto.split(",")]
             max_pagina = self.proceso_actual.num_paginas_virtuales - 1
+            # "5w" marca una escritura (ver parsear_referencia)
+            secuencia = [parsear_referencia(x.strip()) for x in texto.split(",")]
             
-            if any(p < 0 or p > max_pagina for p in secuencia):
+            if any(p < 0 or p & MASCARA_PAGINA > max_pagina for p in secuencia):
                 raise ValueError
             
             self.proceso_actual.establecer_secuencia(secuencia)
@@ -255,7 +270,8 @@ class MainController:
     
     def guardar_escenario_json(self):
         ruta, _ = QFileDialog.getSaveFileName(
-            self.vista, "Guardar escenario", "", "JSON (*.json)"
+            self.vista, "Guardar escenario", "",
+            "JSON (*.json);;Traza binaria (*.mvt)"
         )
         if not ruta:
             return
@@ -268,24 +284,47 @@ class MainController:
         }
         
         guardar_escenario(ruta, datos)
+        # guardar_escenario elige el formato por la extensión
+        if ruta.lower().endswith(EXTENSION_BINARIA):
+            formato = "traza binaria"
+        else:
+            formato = "JSON"
         self.vista.obtener_simulacion_view().obtener_controles()['log'] \
-            .agregar_evento("💾 Escenario guardado en JSON", "INFO")
+            .agregar_evento(f"💾 Escenario guardado en {formato}", "INFO")
     
     def cargar_escenario_json(self):
         ruta, _ = QFileDialog.getOpenFileName(
-            self.vista, "Cargar escenario", "", "JSON (*.json)"
+            self.vista, "Cargar escenario", "",
+            "Escenarios (*.json *.mvt *.addr);;JSON (*.json);;"
+            "Traza binaria (*.mvt);;Traza de direcciones (*.addr)"
         )
         if not ruta:
             return
         
-        datos = cargar_escenario(ruta)
-        
-        self.vista.obtener_spin_marcos().setValue(datos["marcos_fisicos"])
-        self.vista.obtener_combo_algoritmo().setCurrentText(datos["algoritmo"])
-        self.proceso_actual.num_paginas_virtuales = datos["paginas_virtuales"]
+        if ruta.lower().endswith(EXTENSION_DIRECCIONES):
+            # Páginas de 4 KiB; las páginas virtuales salen de la huella
+            datos = cargar_traza_direcciones(ruta)
+            formato = "traza de direcciones"
+        else:
+            datos = cargar_escenario(ruta)
+            # cargar_escenario detecta la traza binaria por su firma
+            formato = "traza binaria" if es_traza_binaria(ruta) else "JSON"
+        
+        # Una traza binaria puede no definir la configuración
+        if datos.get("marcos_fisicos"):
+            self.vista.obtener_spin_marcos().setValue(datos["marcos_fisicos"])
+        if datos.get("algoritmo"):
+            self.vista.obtener_combo_algoritmo().setCurrentText(datos["algoritmo"])
+        paginas = datos.get("paginas_virtuales")
+        if paginas and paginas != self.proceso_actual.num_paginas_virtuales:
+            # La tabla de páginas se dimensiona al crear el proceso: se
+            # recrea el modelo con el nuevo espacio virtual
+            controles = self.vista.obtener_simulacion_view().obtener_controles()
+            controles['spin_paginas'].setValue(paginas)
+            self.inicializar_modelo(paginas)
         self.proceso_actual.establecer_secuencia(datos["secuencia"])
         
         self.actualizar_vista_completa()
         
         self.vista.obtener_simulacion_view().obtener_controles()['log'] \
-            .agregar_evento("📂 Escenario cargado desde JSON", "INFO")
+            .agregar_evento(f"📂 Escenario cargado desde {formato}", "INFO")
@@ -3,15 +3,62 @@ Módulo de modelos (MODELO en MVC)
 Contiene toda la lógica de negocio
 """
 
-from .memoria_model import MemoriaFisica, Marco, Pagina
-from .proceso_model import Proceso, TablaPaginas, EntradaTablaPaginas
+from .memoria_model import MemoriaFisica, Marco, Pagina, PaginaResidente
+from .proceso_model import (Proceso, FlujoReferencias, BIT_ESCRITURA,
+                            MASCARA_PAGINA)
+from .tabla_paginas_model import (EntradaTablaPaginas, TablaPaginasBase,
+                                  TablaPaginas, TablaPaginasMultinivel,
+                                  TablaPaginasHash, TablaPaginasInvertida,
+                                  VistaTablaInvertida, TABLAS_PAGINAS,
+                                  crear_tabla_paginas)
 from .algoritmos_model import (AlgoritmoReemplazo, FIFO, LRU, 
-                               NRU, CLOCK, OPT)
-from .simulador_model import Simulador, EventoSimulacion
+                               NRU, CLOCK, WSClock, OPT, ALGORITMOS,
+                               crear_algoritmo)
+from .simulador_model import (Simulador, EventoSimulacion, RegistroEventos,
+                              MODOS_EVENTOS, MODO_NINGUNO, MODO_CONTADORES,
+                              MODO_COLUMNAR, MODO_COMPLETO)
+from .tlb_model import TLB, REEMPLAZOS_TLB
+from .costos_model import ModeloCostos
+from .almacen_model import AlmacenRespaldo, BucleVirtual
+from .generador_model import GeneradorCarga, MODELOS_CARGA
+from .planificador_model import (PlanificadorBase, PlanificadorSecuencial,
+                                 PlanificadorRoundRobin, PlanificadorAleatorio,
+                                 PlanificadorMarcas, PLANIFICADORES,
+                                 crear_planificador)
+from .conjunto_trabajo_model import ConjuntoTrabajo
+from .asignacion_model import (AsignadorMarcos, AsignacionIgualitaria,
+                               AsignacionProporcional, AsignacionPrioridad,
+                               AsignacionConjuntoTrabajo, AsignacionPFF,
+                               ASIGNACIONES, ALCANCES_REEMPLAZO,
+                               ALCANCE_LOCAL, ALCANCE_GLOBAL, crear_asignador)
+from .precarga_model import (PrecargaBase, PrecargaSecuencial,
+                             PrecargaAdaptativa, PrecargaZancada, PRECARGAS,
+                             crear_precarga)
+from .distancia_pila_model import (DistanciaPilaLRU, DistanciaPilaOPT,
+                                   calcular_curva_fallos)
 
 __all__ = [
-    'MemoriaFisica', 'Marco', 'Pagina',
-    'Proceso', 'TablaPaginas', 'EntradaTablaPaginas',
-    'AlgoritmoReemplazo', 'FIFO', 'LRU', 'NRU', 'CLOCK', 'OPT',
-    'Simulador', 'EventoSimulacion'
+    'MemoriaFisica', 'Marco', 'Pagina', 'PaginaResidente',
+    'Proceso', 'FlujoReferencias', 'BIT_ESCRITURA', 'MASCARA_PAGINA',
+    'EntradaTablaPaginas', 'TablaPaginasBase', 'TablaPaginas',
+    'TablaPaginasMultinivel', 'TablaPaginasHash', 'TablaPaginasInvertida',
+    'VistaTablaInvertida', 'TABLAS_PAGINAS', 'crear_tabla_paginas',
+    'AlgoritmoReemplazo', 'FIFO', 'LRU', 'NRU', 'CLOCK', 'WSClock', 'OPT',
+    'ALGORITMOS', 'crear_algoritmo',
+    'Simulador', 'EventoSimulacion', 'RegistroEventos',
+    'MODOS_EVENTOS', 'MODO_NINGUNO', 'MODO_CONTADORES', 'MODO_COLUMNAR',
+    'MODO_COMPLETO',
+    'TLB', 'REEMPLAZOS_TLB', 'ModeloCostos',
+    'AlmacenRespaldo', 'BucleVirtual',
+    'PrecargaBase', 'PrecargaSecuencial', 'PrecargaAdaptativa',
+    'PrecargaZancada', 'PRECARGAS', 'crear_precarga',
+    'GeneradorCarga', 'MODELOS_CARGA',
+    'PlanificadorBase', 'PlanificadorSecuencial', 'PlanificadorRoundRobin',
+    'PlanificadorAleatorio', 'PlanificadorMarcas', 'PLANIFICADORES',
+    'crear_planificador',
+    'AsignadorMarcos', 'AsignacionIgualitaria', 'AsignacionProporcional',
+    'AsignacionPrioridad', 'AsignacionConjuntoTrabajo', 'AsignacionPFF',
+    'ConjuntoTrabajo', 'ASIGNACIONES', 'ALCANCES_REEMPLAZO',
+    'ALCANCE_LOCAL', 'ALCANCE_GLOBAL', 'crear_asignador',
+    'DistanciaPilaLRU', 'DistanciaPilaOPT', 'calcular_curva_fallos'
 ]
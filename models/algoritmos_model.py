@@ -3,14 +3,35 @@ MODELO: Algoritmos de reemplazo de páginas
 Lógica de negocio para algoritmos
 """
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import Optional
+from array import array
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Optional, Dict
+from .memoria_model import SIN_PROCESO, BIT_REFERENCIADO, BIT_MODIFICADO
+from .proceso_model import MASCARA_PAGINA
 
 class AlgoritmoReemplazo(ABC):
-    """Clase base para algoritmos de reemplazo"""
+    """
+    Clase base para algoritmos de reemplazo
     
-    def __init__(self):
+    Con preferir_limpias=True el algoritmo elige, entre sus primeras
+    ventana_limpias candidatas (en su propio orden de preferencia), la
+    primera sin bit M, para evitar escribir la víctima en disco; si todas
+    están modificadas, elige la primera. ventana_limpias=0 no pone límite.
+    """
+    
+    # Páginas modificadas que el algoritmo mandó a escribir en segundo
+    # plano al elegir víctimas (ver WSClock)
+    escrituras_programadas = 0
+    
+    def __init__(self, preferir_limpias: bool = False,
+                 ventana_limpias: int = 16):
         self.nombre = "Base"
+        self.memoria = None
+        self.preferir_limpias = preferir_limpias
+        self.ventana_limpias = ventana_limpias
         
     @abstractmethod
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
@@ -20,140 +41,964 @@ class AlgoritmoReemplazo(ABC):
     def resetear(self):
         """Resetea el estado del algoritmo"""
         pass
+    
+    def _elegir_limpia(self, memoria, numeros) -> Optional[int]:
+        """
+        Primer marco limpio de 'numeros' (en orden de preferencia) dentro
+        de la ventana; si no hay, el primero. None si no hay candidatos.
+        """
+        bits = memoria.bits
+        primero = None
+        for numero in islice(numeros, self.ventana_limpias or None):
+            if not bits[numero] & BIT_MODIFICADO:
+                return numero
+            if primero is None:
+                primero = numero
+        return primero
+    
+    def obtener_estadisticas(self) -> dict:
+        """Retorna métricas de costo propias del algoritmo"""
+        return {}
+    
+    # ========== SEGUIMIENTO INCREMENTAL ==========
+    
+    def vincular(self, memoria):
+        """Se suscribe a los cambios de la memoria y sincroniza el estado"""
+        if self.memoria is memoria:
+            return
+        self.desvincular()
+        self.memoria = memoria
+        memoria.agregar_observador(self)
+        self.sincronizar(memoria)
+    
+    def desvincular(self):
+        """Deja de observar la memoria vinculada"""
+        if self.memoria is not None:
+            self.memoria.quitar_observador(self)
+            self.memoria = None
+    
+    def sincronizar(self, memoria):
+        """Reconstruye el estado interno a partir de la memoria actual"""
+        pass
+    
+    def notificar_referencia(self, proceso, indice: int, num_pagina: int):
+        """Notificación del simulador: el proceso referencia su acceso 'indice'"""
+        pass
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        """Notificación: se cargó una página en el marco"""
+        pass
+    
+    def al_acceder(self, marco):
+        """Notificación: se accedió a la página del marco"""
+        pass
+    
+    def al_liberar(self, marco, pagina_anterior):
+        """Notificación: se liberó el marco"""
+        pass
+    
+    def al_cambiar_bits(self, marco):
+        """Notificación: se cambió un bit R o M sin acceder al marco"""
+        pass
+    
+    def al_limpiar_referencias(self):
+        """Notificación: se limpiaron en bloque los bits R"""
+        pass
 
 class FIFO(AlgoritmoReemplazo):
-    """First In, First Out - Reemplaza la página más antigua"""
+    """First In, First Out - Reemplaza la página más antigua
+
+    Mantiene colas de carga (global y por proceso) ordenadas por
+    (tiempo_carga, número de marco), alimentadas por las notificaciones
+    de la memoria, de modo que la víctima es siempre el primer elemento.
+    """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
         self.nombre = "FIFO"
+        self.cola: OrderedDict = OrderedDict()
+        self.cola_proceso: Dict[int, OrderedDict] = {}
         
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
-        marcos_candidatos = memoria.obtener_marcos_ocupados()
+        self.vincular(memoria)
         
         if proceso_id is not None:
-            marcos_candidatos = [m for m in marcos_candidatos 
-                               if m.pagina.proceso_id == proceso_id]
+            cola = self.cola_proceso.get(proceso_id)
+        else:
+            cola = self.cola
         
-        victima = min(marcos_candidatos, key=lambda m: m.tiempo_carga)
-        return victima
+        if not cola:
+            raise ValueError("No hay marcos candidatos para reemplazo")
+        if self.preferir_limpias:
+            return cola[self._elegir_limpia(memoria, iter(cola))]
+        return cola[next(iter(cola))]
+    
+    @staticmethod
+    def _encolar(cola: OrderedDict, marco):
+        """
+        Agrega el marco respetando el orden (tiempo_carga, número): las
+        cargas llegan en orden de tiempo, así que casi siempre va al final
+        """
+        clave = (marco.tiempo_carga, marco.numero)
+        posteriores = []
+        for numero in reversed(cola):
+            otro = cola[numero]
+            if (otro.tiempo_carga, otro.numero) < clave:
+                break
+            posteriores.append(numero)
+        cola[marco.numero] = marco
+        for numero in reversed(posteriores):
+            cola.move_to_end(numero)
+    
+    def _quitar(self, marco, proceso_id: int):
+        self.cola.pop(marco.numero, None)
+        cola = self.cola_proceso.get(proceso_id)
+        if cola is not None:
+            cola.pop(marco.numero, None)
+            if not cola:
+                del self.cola_proceso[proceso_id]
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        if pagina_anterior is not None:
+            self._quitar(marco, pagina_anterior.proceso_id)
+        self._encolar(self.cola, marco)
+        self._encolar(
+            self.cola_proceso.setdefault(marco.proceso_id, OrderedDict()),
+            marco
+        )
+    
+    def al_liberar(self, marco, pagina_anterior):
+        self._quitar(marco, pagina_anterior.proceso_id)
+    
+    def sincronizar(self, memoria):
+        self.cola = OrderedDict()
+        self.cola_proceso = {}
+        ocupados = sorted(memoria.obtener_marcos_ocupados(),
+                          key=lambda m: (m.tiempo_carga, m.numero))
+        for marco in ocupados:
+            self.cola[marco.numero] = marco
+            self.cola_proceso.setdefault(
+                marco.proceso_id, OrderedDict()
+            )[marco.numero] = marco
+    
+    def resetear(self):
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
+        else:
+            self.cola = OrderedDict()
+            self.cola_proceso = {}
 
 class LRU(AlgoritmoReemplazo):
-    """Least Recently Used - Reemplaza la página menos recientemente usada"""
+    """Least Recently Used - Reemplaza la página menos recientemente usada
+
+    Mantiene listas de recencia (global y por proceso) ordenadas por
+    (tiempo_acceso, número de marco), alimentadas por las notificaciones
+    de la memoria, de modo que la víctima es siempre el primer elemento.
+    """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
         self.nombre = "LRU"
+        self.recientes: OrderedDict = OrderedDict()
+        self.recientes_proceso: Dict[int, OrderedDict] = {}
         
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
-        marcos_candidatos = memoria.obtener_marcos_ocupados()
+        self.vincular(memoria)
         
         if proceso_id is not None:
-            marcos_candidatos = [m for m in marcos_candidatos 
-                               if m.pagina.proceso_id == proceso_id]
+            lista = self.recientes_proceso.get(proceso_id)
+        else:
+            lista = self.recientes
         
-        victima = min(marcos_candidatos, key=lambda m: m.tiempo_acceso)
-        return victima
+        if not lista:
+            raise ValueError("No hay marcos candidatos para reemplazo")
+        if self.preferir_limpias:
+            return lista[self._elegir_limpia(memoria, iter(lista))]
+        return lista[next(iter(lista))]
+    
+    @staticmethod
+    def _insertar(lista: OrderedDict, marco):
+        """Inserta el marco respetando el orden (tiempo_acceso, número)"""
+        clave = (marco.tiempo_acceso, marco.numero)
+        posteriores = []
+        for numero in reversed(lista):
+            otro = lista[numero]
+            if (otro.tiempo_acceso, otro.numero) < clave:
+                break
+            posteriores.append(numero)
+        lista[marco.numero] = marco
+        for numero in reversed(posteriores):
+            lista.move_to_end(numero)
+    
+    def _quitar(self, marco, proceso_id: int):
+        self.recientes.pop(marco.numero, None)
+        lista = self.recientes_proceso.get(proceso_id)
+        if lista is not None:
+            lista.pop(marco.numero, None)
+            if not lista:
+                del self.recientes_proceso[proceso_id]
+    
+    def _tocar(self, marco):
+        proceso_id = marco.proceso_id
+        self.recientes.pop(marco.numero, None)
+        self._insertar(self.recientes, marco)
+        lista = self.recientes_proceso.setdefault(proceso_id, OrderedDict())
+        lista.pop(marco.numero, None)
+        self._insertar(lista, marco)
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        if pagina_anterior is not None:
+            self._quitar(marco, pagina_anterior.proceso_id)
+        self._tocar(marco)
+    
+    def al_acceder(self, marco):
+        if not marco.esta_libre():
+            self._tocar(marco)
+    
+    def al_liberar(self, marco, pagina_anterior):
+        self._quitar(marco, pagina_anterior.proceso_id)
+    
+    def sincronizar(self, memoria):
+        self.recientes = OrderedDict()
+        self.recientes_proceso = {}
+        ocupados = sorted(memoria.obtener_marcos_ocupados(),
+                          key=lambda m: (m.tiempo_acceso, m.numero))
+        for marco in ocupados:
+            self.recientes[marco.numero] = marco
+            self.recientes_proceso.setdefault(
+                marco.proceso_id, OrderedDict()
+            )[marco.numero] = marco
+    
+    def resetear(self):
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
+        else:
+            self.recientes = OrderedDict()
+            self.recientes_proceso = {}
 
 class NRU(AlgoritmoReemplazo):
-    """Not Recently Used - Usa bits de referencia y modificación"""
+    """Not Recently Used - Usa bits de referencia y modificación
+
+    Mantiene los marcos en cuatro cubetas por clase (R*2 + M), global y por
+    proceso, actualizadas al cargar, acceder o limpiar bits R. La víctima
+    es el marco más antiguo de la clase no vacía más baja. Con
+    preferir_limpias las clases limpias (0 y 2) van antes que las
+    modificadas (1 y 3).
+    """
+    
+    ORDEN_CLASES = (0, 1, 2, 3)
+    ORDEN_LIMPIAS = (0, 2, 1, 3)
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
         self.nombre = "NRU"
+        self.clases = [OrderedDict() for _ in range(4)]
+        self.clases_proceso: Dict[int, list] = {}
+        self.ubicacion: Dict[int, tuple] = {}
+    
+    @staticmethod
+    def obtener_clase(pagina) -> int:
+        r = 1 if pagina.referenciada else 0
+        m = 1 if pagina.modificada else 0
+        return r * 2 + m
         
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
-        marcos_candidatos = memoria.obtener_marcos_ocupados()
+        self.vincular(memoria)
         
-        if proceso_id is not None:
-            marcos_candidatos = [m for m in marcos_candidatos 
-                               if m.pagina.proceso_id == proceso_id]
-        
-        def obtener_clase(marco) -> int:
-            r = 1 if marco.pagina.referenciada else 0
-            m = 1 if marco.pagina.modificada else 0
-            return r * 2 + m
-        
-        victima = min(marcos_candidatos, key=obtener_clase)
-        return victima
+        orden = self.ORDEN_LIMPIAS if self.preferir_limpias else self.ORDEN_CLASES
+        while True:
+            # _ubicar puede borrar y recrear las cubetas del proceso
+            if proceso_id is not None:
+                cubetas = self.clases_proceso.get(proceso_id)
+                if cubetas is None:
+                    break
+            else:
+                cubetas = self.clases
+            for clase in orden:
+                cubeta = cubetas[clase]
+                if cubeta:
+                    break
+            else:
+                break
+            marco = cubeta[next(iter(cubeta))]
+            if self.obtener_clase(marco.pagina) == clase:
+                return marco
+            # Los bits cambiaron sin notificación (p. ej. otro algoritmo)
+            self._ubicar(marco)
+        raise ValueError("No hay marcos candidatos para reemplazo")
+    
+    def _quitar(self, numero: int):
+        ubicacion = self.ubicacion.pop(numero, None)
+        if ubicacion is None:
+            return
+        clase, proceso_id = ubicacion
+        del self.clases[clase][numero]
+        cubetas = self.clases_proceso[proceso_id]
+        del cubetas[clase][numero]
+        if not any(cubetas):
+            del self.clases_proceso[proceso_id]
+    
+    def _ubicar(self, marco):
+        """Coloca el marco en la cubeta de su clase actual"""
+        proceso_id = marco.proceso_id
+        clase = self.obtener_clase(marco.pagina)
+        if self.ubicacion.get(marco.numero) == (clase, proceso_id):
+            return
+        self._quitar(marco.numero)
+        self.clases[clase][marco.numero] = marco
+        cubetas = self.clases_proceso.get(proceso_id)
+        if cubetas is None:
+            cubetas = [OrderedDict() for _ in range(4)]
+            self.clases_proceso[proceso_id] = cubetas
+        cubetas[clase][marco.numero] = marco
+        self.ubicacion[marco.numero] = (clase, proceso_id)
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        self._quitar(marco.numero)
+        self._ubicar(marco)
+    
+    def al_acceder(self, marco):
+        if not marco.esta_libre():
+            self._ubicar(marco)
+    
+    def al_liberar(self, marco, pagina_anterior):
+        self._quitar(marco.numero)
+    
+    def al_cambiar_bits(self, marco):
+        self._ubicar(marco)
+    
+    def al_limpiar_referencias(self):
+        """Mueve las clases 2 y 3 a las clases 0 y 1"""
+        for origen in (2, 3):
+            destino = self.clases[origen - 2]
+            for numero, marco in self.clases[origen].items():
+                destino[numero] = marco
+                self.ubicacion[numero] = (origen - 2, marco.proceso_id)
+            self.clases[origen].clear()
+        for cubetas in self.clases_proceso.values():
+            for origen in (2, 3):
+                cubetas[origen - 2].update(cubetas[origen])
+                cubetas[origen].clear()
+    
+    def sincronizar(self, memoria):
+        self.clases = [OrderedDict() for _ in range(4)]
+        self.clases_proceso = {}
+        self.ubicacion = {}
+        for marco in memoria.obtener_marcos_ocupados():
+            self._ubicar(marco)
+    
+    def resetear(self):
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
+        else:
+            self.clases = [OrderedDict() for _ in range(4)]
+            self.clases_proceso = {}
+            self.ubicacion = {}
 
 class CLOCK(AlgoritmoReemplazo):
-    """Algoritmo del reloj - Variante eficiente de LRU"""
+    """Algoritmo del reloj - Variante eficiente de LRU
+
+    La manecilla recorre memoria.marcos como un anillo circular y conserva
+    su posición entre fallos. Con manecilla_por_proceso=True cada proceso
+    tiene su propio anillo (sus marcos residentes) y su propia manecilla,
+    útil para reemplazo local.
+    """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, manecilla_por_proceso: bool = False, **opciones):
+        super().__init__(**opciones)
         self.nombre = "CLOCK"
+        self.manecilla_por_proceso = manecilla_por_proceso
         self.puntero = 0
+        self.anillos: Dict[int, dict] = {}
+        
+        # Costo: avances de la manecilla
+        self.fallos_atendidos = 0
+        self.avances_totales = 0
+        self.avances_ultimo_fallo = 0
         
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
-        marcos_candidatos = memoria.marcos
+        self.vincular(memoria)
         
-        if proceso_id is not None:
-            marcos_candidatos = [m for m in marcos_candidatos 
-                               if not m.esta_libre() and m.pagina.proceso_id == proceso_id]
+        if (self.manecilla_por_proceso and proceso_id is not None
+                and proceso_id in self.anillos):
+            victima, avances = self._barrer_anillo(memoria, proceso_id)
+        else:
+            victima, avances = self._barrer_memoria(memoria, proceso_id)
+            if victima is None and proceso_id is not None:
+                # El proceso no tiene marcos propios: reemplazo global
+                victima, extra = self._barrer_memoria(memoria, None)
+                avances += extra
+        
+        if victima is None:
+            raise ValueError("No hay marcos candidatos para reemplazo")
+        
+        self.fallos_atendidos += 1
+        self.avances_totales += avances
+        self.avances_ultimo_fallo = avances
+        return victima
+    
+    def _barrer_memoria(self, memoria, proceso_id: Optional[int]):
+        """Avanza la manecilla global sobre las columnas de la tabla de marcos"""
+        procesos = memoria.procesos
+        bits = memoria.bits
+        n = memoria.num_marcos
+        avances = 0
+        sucia = None
+        saltadas = 0
+        
+        # Dos vueltas bastan: la primera limpia bits R, la segunda elige
+        while avances < 2 * n:
+            numero = self.puntero
+            self.puntero = (numero + 1) % n
+            avances += 1
+            
+            dueno = procesos[numero]
+            if dueno == SIN_PROCESO:
+                continue
+            if proceso_id is not None and dueno != proceso_id:
+                continue
+            if bits[numero] & BIT_REFERENCIADO:
+                bits[numero] &= ~BIT_REFERENCIADO
+                continue
+            if self.preferir_limpias and bits[numero] & BIT_MODIFICADO:
+                # Se saltea la página sucia mientras quede ventana
+                if sucia is None:
+                    sucia = numero
+                saltadas += 1
+                if not self.ventana_limpias or saltadas < self.ventana_limpias:
+                    continue
+                return memoria.marcos[sucia], avances
+            return memoria.marcos[numero], avances
+        if sucia is not None:
+            return memoria.marcos[sucia], avances
+        return None, avances
+    
+    def _barrer_anillo(self, memoria, proceso_id: int):
+        """Avanza la manecilla del proceso sobre su anillo de marcos"""
+        anillo = self.anillos[proceso_id]
+        siguiente = anillo['siguiente']
+        bits = memoria.bits
+        avances = 0
+        sucia = None
+        saltadas = 0
+        
+        while avances < 2 * len(siguiente) or sucia is None:
+            numero = anillo['mano']
+            anillo['mano'] = siguiente[numero]
+            avances += 1
+            
+            if bits[numero] & BIT_REFERENCIADO:
+                bits[numero] &= ~BIT_REFERENCIADO
+                continue
+            if self.preferir_limpias and bits[numero] & BIT_MODIFICADO:
+                if sucia is None:
+                    sucia = numero
+                saltadas += 1
+                if not self.ventana_limpias or saltadas < self.ventana_limpias:
+                    continue
+                break
+            return memoria.marcos[numero], avances
+        return memoria.marcos[sucia], avances
+    
+    # ========== ANILLOS POR PROCESO ==========
+    
+    def _insertar_en_anillo(self, proceso_id: int, numero: int):
+        """Inserta el marco justo detrás de la manecilla del proceso"""
+        anillo = self.anillos.get(proceso_id)
+        if anillo is None:
+            self.anillos[proceso_id] = {
+                'siguiente': {numero: numero},
+                'anterior': {numero: numero},
+                'mano': numero
+            }
+            return
+        siguiente, anterior = anillo['siguiente'], anillo['anterior']
+        mano = anillo['mano']
+        previo = anterior[mano]
+        siguiente[previo] = numero
+        anterior[numero] = previo
+        siguiente[numero] = mano
+        anterior[mano] = numero
+    
+    def _quitar_de_anillo(self, proceso_id: int, numero: int):
+        """Quita el marco del anillo del proceso"""
+        anillo = self.anillos.get(proceso_id)
+        if anillo is None or numero not in anillo['siguiente']:
+            return
+        siguiente, anterior = anillo['siguiente'], anillo['anterior']
+        posterior = siguiente.pop(numero)
+        previo = anterior.pop(numero)
+        if posterior == numero:
+            del self.anillos[proceso_id]
+            return
+        siguiente[previo] = posterior
+        anterior[posterior] = previo
+        if anillo['mano'] == numero:
+            anillo['mano'] = posterior
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        if not self.manecilla_por_proceso:
+            return
+        if pagina_anterior is not None:
+            self._quitar_de_anillo(pagina_anterior.proceso_id, marco.numero)
+        self._insertar_en_anillo(marco.proceso_id, marco.numero)
+    
+    def al_liberar(self, marco, pagina_anterior):
+        if self.manecilla_por_proceso:
+            self._quitar_de_anillo(pagina_anterior.proceso_id, marco.numero)
+    
+    def sincronizar(self, memoria):
+        self.anillos = {}
+        if memoria.num_marcos:
+            self.puntero %= memoria.num_marcos
+        if self.manecilla_por_proceso:
+            for marco in memoria.obtener_marcos_ocupados():
+                self._insertar_en_anillo(marco.proceso_id, marco.numero)
+    
+    def obtener_estadisticas(self) -> dict:
+        promedio = (self.avances_totales / self.fallos_atendidos
+                    if self.fallos_atendidos else 0.0)
+        return {
+            'fallos_atendidos': self.fallos_atendidos,
+            'avances_totales': self.avances_totales,
+            'avances_ultimo_fallo': self.avances_ultimo_fallo,
+            'avances_por_fallo': promedio
+        }
+    
+    def resetear(self):
+        self.puntero = 0
+        self.fallos_atendidos = 0
+        self.avances_totales = 0
+        self.avances_ultimo_fallo = 0
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
         else:
-            marcos_candidatos = memoria.obtener_marcos_ocupados()
+            self.anillos = {}
+
+class WSClock(AlgoritmoReemplazo):
+    """WSClock - Reloj sobre el conjunto de trabajo (Carr y Hennessy)
+
+    La manecilla recorre memoria.marcos como un anillo circular. Cada
+    marco guarda el tiempo virtual de su último uso: la cantidad de
+    referencias que había hecho su proceso (ver notificar_referencia).
+    Al pasar por un marco con bit R, lo apaga y actualiza ese tiempo; uno
+    sin R cuya edad supera 'ventana' (Δ) está fuera del conjunto de
+    trabajo: si está limpio es la víctima y, si está modificado, se
+    programa su escritura (se apaga M y se cuenta en
+    escrituras_programadas) y la manecilla sigue.
+
+    Cada fallo avanza a lo sumo max_avances marcos (0 = una vuelta), de
+    modo que el costo por fallo está acotado aunque la memoria sea
+    grande. Si no aparece una víctima vieja y limpia se elige, en orden,
+    la primera cuya escritura se programó (ya está limpia), la más vieja
+    sin R (entre las limpias, con preferir_limpias) o la primera visitada.
+    Las páginas de un proceso que terminó quedan fuera de todo conjunto
+    de trabajo.
+    """
+    
+    def __init__(self, ventana: int = 1000, max_avances: int = 0,
+                 **opciones):
+        super().__init__(**opciones)
+        self.nombre = "WSCLOCK"
+        self.ventana = ventana
+        self.max_avances = max_avances
+        self.puntero = 0
+        self.ultimo_uso = array('q')
+        self.tiempo_virtual: Dict[int, int] = {}
+        self.terminados = set()
         
-        if not marcos_candidatos:
-            return memoria.marcos[0]
+        # Costo: avances de la manecilla y escrituras programadas
+        self.fallos_atendidos = 0
+        self.avances_totales = 0
+        self.avances_ultimo_fallo = 0
+        self.avances_maximos = 0
+        self.victimas_fuera_conjunto = 0
+    
+    def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
+        self.vincular(memoria)
         
-        intentos = 0
-        max_intentos = len(marcos_candidatos) * 2
+        procesos = memoria.procesos
+        bits = memoria.bits
+        ultimo_uso = self.ultimo_uso
+        virtual = self.tiempo_virtual
+        terminados = self.terminados
+        ventana = self.ventana
+        n = memoria.num_marcos
+        limite = min(self.max_avances or n, n)
+        avances = 0
+        victima = None
+        programada = None
+        limpia = None
+        vieja = None
+        visitada = None
+        edad_limpia = edad_vieja = -1
         
-        while intentos < max_intentos:
-            marco_actual = marcos_candidatos[self.puntero % len(marcos_candidatos)]
+        # Con reemplazo local se sigue hasta ver algún marco del proceso
+        while avances < limite or (visitada is None and avances < n):
+            numero = self.puntero
+            self.puntero = (numero + 1) % n
+            avances += 1
             
-            if not marco_actual.pagina.referenciada:
-                victima = marco_actual
-                self.puntero = (self.puntero + 1) % len(marcos_candidatos)
-                return victima
+            dueno = procesos[numero]
+            if dueno == SIN_PROCESO:
+                continue
+            if proceso_id is not None and dueno != proceso_id:
+                continue
+            if visitada is None:
+                visitada = numero
+            if bits[numero] & BIT_REFERENCIADO:
+                bits[numero] &= ~BIT_REFERENCIADO
+                ultimo_uso[numero] = virtual.get(dueno, 0)
+                continue
+            if dueno in terminados:
+                edad = ventana + 1
             else:
-                marco_actual.pagina.referenciada = False
-                self.puntero = (self.puntero + 1) % len(marcos_candidatos)
-            
-            intentos += 1
+                edad = virtual.get(dueno, 0) - ultimo_uso[numero]
+            if edad > ventana:
+                if not bits[numero] & BIT_MODIFICADO:
+                    victima = numero
+                    self.victimas_fuera_conjunto += 1
+                    break
+                # Fuera del conjunto pero sucia: se escribe en segundo plano
+                bits[numero] &= ~BIT_MODIFICADO
+                self.escrituras_programadas += 1
+                if programada is None:
+                    programada = numero
+            else:
+                if edad > edad_vieja:
+                    vieja, edad_vieja = numero, edad
+                if edad > edad_limpia and not bits[numero] & BIT_MODIFICADO:
+                    limpia, edad_limpia = numero, edad
         
-        victima = marcos_candidatos[self.puntero % len(marcos_candidatos)]
-        self.puntero = (self.puntero + 1) % len(marcos_candidatos)
-        return victima
+        if victima is None:
+            if not self.preferir_limpias:
+                limpia = None
+            for candidata in (programada, limpia, vieja, visitada):
+                if candidata is not None:
+                    victima = candidata
+                    break
+            else:
+                raise ValueError("No hay marcos candidatos para reemplazo")
+        
+        self.fallos_atendidos += 1
+        self.avances_totales += avances
+        self.avances_ultimo_fallo = avances
+        if avances > self.avances_maximos:
+            self.avances_maximos = avances
+        return memoria.marcos[victima]
+    
+    def notificar_referencia(self, proceso, indice: int, num_pagina: int):
+        # El tiempo virtual del proceso es su cantidad de referencias; al
+        # terminar, ninguna de sus páginas sigue en un conjunto de trabajo
+        self.tiempo_virtual[proceso.id] = indice + 1
+        if not proceso.tiene_mas_accesos():
+            self.terminados.add(proceso.id)
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        self.ultimo_uso[marco.numero] = self.tiempo_virtual.get(
+            marco.proceso_id, 0
+        )
+    
+    def al_acceder(self, marco):
+        proceso_id = marco.proceso_id
+        if proceso_id is not None:
+            self.ultimo_uso[marco.numero] = self.tiempo_virtual.get(
+                proceso_id, 0
+            )
+    
+    def sincronizar(self, memoria):
+        n = memoria.num_marcos
+        self.ultimo_uso = array('q', [0]) * n
+        if n:
+            self.puntero %= n
+        procesos = memoria.procesos
+        for numero in range(n):
+            if procesos[numero] != SIN_PROCESO:
+                self.ultimo_uso[numero] = self.tiempo_virtual.get(
+                    procesos[numero], 0
+                )
+    
+    def obtener_estadisticas(self) -> dict:
+        promedio = (self.avances_totales / self.fallos_atendidos
+                    if self.fallos_atendidos else 0.0)
+        return {
+            'ventana': self.ventana,
+            'limite_avances': self.max_avances,
+            'fallos_atendidos': self.fallos_atendidos,
+            'avances_totales': self.avances_totales,
+            'avances_ultimo_fallo': self.avances_ultimo_fallo,
+            'avances_maximos': self.avances_maximos,
+            'avances_por_fallo': promedio,
+            'victimas_fuera_conjunto': self.victimas_fuera_conjunto,
+            'escrituras_programadas': self.escrituras_programadas
+        }
     
     def resetear(self):
         self.puntero = 0
+        self.tiempo_virtual = {}
+        self.terminados = set()
+        self.fallos_atendidos = 0
+        self.avances_totales = 0
+        self.avances_ultimo_fallo = 0
+        self.avances_maximos = 0
+        self.victimas_fuera_conjunto = 0
+        self.escrituras_programadas = 0
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
+        else:
+            self.ultimo_uso = array('q')
 
 class OPT(AlgoritmoReemplazo):
-    """Óptimo - Reemplaza la página que no se usará por más tiempo"""
+    """Óptimo - Reemplaza la página que no se usará por más tiempo
+
+    Precalcula, en una pasada hacia atrás, la siguiente aparición de cada
+    referencia de la secuencia. Cada marco queda asociado a la posición de
+    su próximo uso y las víctimas se eligen con montículos (global y por
+    proceso) en O(log marcos) por fallo.
+    
+    Si el proceso consume su traza en flujo (sin secuencia indexable), el
+    próximo uso solo se conoce dentro de la ventana de anticipación del
+    flujo; las páginas que no aparecen en ella se consideran sin uso futuro.
+    """
+    
+    INFINITO = float('inf')
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
         self.nombre = "OPT"
         self.secuencia_futura = []
         self.indice_actual = 0
+        self.secuencias: Dict[Optional[int], list] = {}
+        self.siguientes: Dict[Optional[int], list] = {}
+        self.proximas: Dict[Optional[int], dict] = {}
+        self.ventanas: Dict[int, dict] = {}
+        self.estado: Dict[int, tuple] = {}
+        self.heap_global = []
+        self.heaps_proceso: Dict[int, list] = {}
+        
+    def establecer_secuencia(self, secuencia: list, indice: int = 0,
+                             proceso_id: Optional[int] = None):
+        """
+        Establece la secuencia futura de accesos de un proceso
+        
+        Args:
+            secuencia: Lista de números de página
+            indice: Posición del próximo acceso a consumir
+            proceso_id: Proceso dueño de la secuencia (None = todos)
+        """
+        # Siguiente aparición de cada posición (-1 = no vuelve a aparecer)
+        n = len(secuencia)
+        siguiente = array('q', [-1]) * n
+        ultima = {}
+        proximas = {}
+        for i in range(n - 1, -1, -1):
+            pagina = secuencia[i] & MASCARA_PAGINA
+            siguiente[i] = ultima.get(pagina, -1)
+            ultima[pagina] = i
+            if i == indice:
+                proximas = dict(ultima)
         
-    def establecer_secuencia(self, secuencia: list, indice: int):
-        """Establece la secuencia futura de accesos"""
         self.secuencia_futura = secuencia
         self.indice_actual = indice
+        self.secuencias[proceso_id] = secuencia
+        self.siguientes[proceso_id] = siguiente
+        self.proximas[proceso_id] = proximas
+        
+        if self.memoria is not None:
+            if proceso_id is None:
+                marcos = self.memoria.obtener_marcos_ocupados()
+            else:
+                marcos = self.memoria.obtener_marcos_del_proceso(proceso_id)
+            for marco in marcos:
+                self._actualizar_marco(marco)
+    
+    def notificar_referencia(self, proceso, indice: int, num_pagina: int):
+        if proceso.flujo is not None:
+            self._avanzar_ventana(proceso, num_pagina)
+            return
+        
+        secuencia = proceso.secuencia_accesos
+        if self.secuencias.get(proceso.id) is not secuencia:
+            self.establecer_secuencia(secuencia, indice, proceso.id)
+        self.indice_actual = indice + 1
+        siguiente = self.siguientes[proceso.id][indice]
+        self.proximas[proceso.id][num_pagina] = \
+            siguiente if siguiente >= 0 else self.INFINITO
+    
+    def _avanzar_ventana(self, proceso, num_pagina: int):
+        """Actualiza los próximos usos con la ventana de anticipación del flujo"""
+        flujo = proceso.flujo
+        actual = flujo.consumidas - 1
+        ventana = self.ventanas.get(proceso.id)
+        if (ventana is None or ventana['flujo'] is not flujo
+                or ventana['apertura'] != flujo.aperturas):
+            ventana = {
+                'flujo': flujo,
+                'apertura': flujo.aperturas,
+                'vista': actual + 1,
+                'posiciones': {}
+            }
+            self.ventanas[proceso.id] = ventana
+            self.proximas[proceso.id] = {}
+        posiciones = ventana['posiciones']
+        proximas = self.proximas[proceso.id]
+        
+        # Indexar las referencias que entraron a la ventana desde el último paso
+        fin = flujo.fin_leido()
+        for posicion in range(ventana['vista'], fin):
+            pagina = flujo.obtener(posicion) & MASCARA_PAGINA
+            cola = posiciones.get(pagina)
+            if cola is None:
+                posiciones[pagina] = deque([posicion])
+                proximas[pagina] = posicion
+                if self.memoria is not None:
+                    marco = self.memoria.buscar_pagina(proceso.id, pagina)
+                    if marco is not None:
+                        self._actualizar_marco(marco)
+            else:
+                cola.append(posicion)
+        ventana['vista'] = fin
+        
+        # Consumir la referencia actual
+        cola = posiciones.get(num_pagina)
+        if cola and cola[0] == actual:
+            cola.popleft()
+        if cola:
+            proximas[num_pagina] = cola[0]
+        else:
+            posiciones.pop(num_pagina, None)
+            proximas.pop(num_pagina, None)
+        self.indice_actual = actual + 1
+    
+    def _proximo_uso(self, proceso_id: int, num_pagina: int) -> float:
+        """Posición del próximo uso de la página (INFINITO si no se usa)"""
+        proximas = self.proximas.get(proceso_id)
+        if proximas is None:
+            proximas = self.proximas.get(None)
+            if proximas is None:
+                return self.INFINITO
+        return proximas.get(num_pagina, self.INFINITO)
+    
+    def _actualizar_marco(self, marco):
+        """Asocia el marco a su próximo uso y lo encola en los montículos"""
+        proceso_id = marco.proceso_id
+        proximo = self._proximo_uso(proceso_id, marco.num_pagina)
+        self.estado[marco.numero] = (proximo, proceso_id)
+        entrada = (-proximo, marco.numero, proceso_id)
         
+        heapq.heappush(self.heap_global, entrada)
+        if len(self.heap_global) > 2 * len(self.estado) + 32:
+            self.heap_global = self._compactar(None)
+        
+        heap = self.heaps_proceso.setdefault(proceso_id, [])
+        heapq.heappush(heap, entrada)
+        if len(heap) > 2 * len(self.estado) + 32:
+            self.heaps_proceso[proceso_id] = self._compactar(proceso_id)
+    
+    def _compactar(self, proceso_id: Optional[int]) -> list:
+        """Reconstruye un montículo descartando entradas obsoletas"""
+        heap = [(-proximo, numero, dueno)
+                for numero, (proximo, dueno) in self.estado.items()
+                if proceso_id is None or dueno == proceso_id]
+        heapq.heapify(heap)
+        return heap
+    
     def seleccionar_victima(self, memoria, proceso_id: Optional[int] = None):
-        marcos_candidatos = memoria.obtener_marcos_ocupados()
+        self.vincular(memoria)
         
         if proceso_id is not None:
-            marcos_candidatos = [m for m in marcos_candidatos 
-                               if m.pagina.proceso_id == proceso_id]
-        
-        def proximo_uso(marco) -> int:
-            num_pagina = marco.pagina.numero
-            try:
-                for i in range(self.indice_actual, len(self.secuencia_futura)):
-                    if self.secuencia_futura[i] == num_pagina:
-                        return i - self.indice_actual
-                return float('inf')
-            except:
-                return float('inf')
-        
-        victima = max(marcos_candidatos, key=proximo_uso)
-        return victima
+            heap = self.heaps_proceso.get(proceso_id, [])
+        else:
+            heap = self.heap_global
+        
+        if self.preferir_limpias:
+            return self._victima_limpia(memoria, heap)
+        while heap:
+            negativo, numero, dueno = heap[0]
+            if self.estado.get(numero) == (-negativo, dueno):
+                return memoria.marcos[numero]
+            heapq.heappop(heap)
+        raise ValueError("No hay marcos candidatos para reemplazo")
+    
+    def _victima_limpia(self, memoria, heap: list):
+        """Extrae candidatas válidas del montículo en orden hasta hallar una limpia"""
+        extraidas = []
+        victima = None
+        ventana = self.ventana_limpias
+        while heap and not (ventana and len(extraidas) >= ventana):
+            entrada = heapq.heappop(heap)
+            negativo, numero, dueno = entrada
+            if self.estado.get(numero) != (-negativo, dueno):
+                continue
+            extraidas.append(entrada)
+            if not memoria.bits[numero] & BIT_MODIFICADO:
+                victima = numero
+                break
+        for entrada in extraidas:
+            heapq.heappush(heap, entrada)
+        if victima is None:
+            if not extraidas:
+                raise ValueError("No hay marcos candidatos para reemplazo")
+            victima = extraidas[0][1]
+        return memoria.marcos[victima]
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        self._actualizar_marco(marco)
+    
+    def al_acceder(self, marco):
+        if not marco.esta_libre():
+            self._actualizar_marco(marco)
+    
+    def al_liberar(self, marco, pagina_anterior):
+        self.estado.pop(marco.numero, None)
+    
+    def sincronizar(self, memoria):
+        self.estado = {}
+        self.heap_global = []
+        self.heaps_proceso = {}
+        for marco in memoria.obtener_marcos_ocupados():
+            self._actualizar_marco(marco)
     
     def resetear(self):
         self.secuencia_futura = []
         self.indice_actual = 0
+        self.secuencias = {}
+        self.siguientes = {}
+        self.proximas = {}
+        self.ventanas = {}
+        if self.memoria is not None:
+            self.sincronizar(self.memoria)
+        else:
+            self.estado = {}
+            self.heap_global = []
+            self.heaps_proceso = {}
+
+
+# Registro de algoritmos disponibles (nombre visible -> clase)
+ALGORITMOS = {
+    "FIFO": FIFO,
+    "LRU": LRU,
+    "NRU": NRU,
+    "CLOCK": CLOCK,
+    "WSCLOCK": WSClock,
+    "OPT": OPT
+}
+
+def crear_algoritmo(nombre: str, **opciones) -> AlgoritmoReemplazo:
+    """
+    Crea una instancia del algoritmo a partir de su nombre
+    
+    Args:
+        nombre: Nombre del algoritmo (FIFO, LRU, NRU, CLOCK, WSCLOCK, OPT)
+        **opciones: Parámetros propios del algoritmo
+        
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún algoritmo
+    """
+    clase = ALGORITMOS.get(nombre.upper())
+    if clase is None:
+        raise ValueError(
+            f"Algoritmo desconocido: {nombre} "
+            f"(disponibles: {', '.join(ALGORITMOS)})"
+        )
+    return clase(**opciones)
@@ -0,0 +1,184 @@
+"""
+MODELO: Almacenamiento de respaldo (swap) con cola de E/S
+Simula el dispositivo que atiende las cargas de páginas y las escrituras
+de víctimas modificadas, sobre un bucle asyncio con reloj virtual
+"""
+
+import asyncio
+import selectors
+from typing import Dict
+
+NS_POR_SEGUNDO = 1_000_000_000
+
+class _SelectorVirtual(selectors.DefaultSelector):
+    """
+    Selector que nunca bloquea: si el bucle debería esperar, adelanta el
+    reloj virtual hasta el próximo temporizador
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.reloj = 0.0
+    
+    def select(self, timeout=None):
+        eventos = super().select(0)
+        if not eventos:
+            if timeout is None:
+                raise RuntimeError(
+                    "La simulación quedó bloqueada: ninguna tarea puede avanzar"
+                )
+            self.reloj += timeout
+        return eventos
+
+class BucleVirtual(asyncio.SelectorEventLoop):
+    """
+    Bucle de eventos asyncio cuyo tiempo es simulado (en segundos)
+    
+    asyncio.sleep, los temporizadores y las primitivas de sincronización
+    funcionan igual que en un bucle real, pero el tiempo salta de un
+    evento al siguiente sin esperas reales.
+    """
+    
+    def __init__(self):
+        self._selector_virtual = _SelectorVirtual()
+        super().__init__(self._selector_virtual)
+    
+    def time(self) -> float:
+        return self._selector_virtual.reloj
+
+class AlmacenRespaldo:
+    """
+    Dispositivo de respaldo con cola de solicitudes
+    
+    Atiende hasta profundidad_cola solicitudes a la vez; cada una tarda el
+    tiempo de servicio más la transferencia de una página al ancho de
+    banda indicado. Las demás esperan en orden de llegada.
+    
+    Con un almacén, Simulador.ejecutar_todo ejecuta cada proceso como una
+    tarea de un BucleVirtual (ver atender_fallo).
+    """
+    
+    def __init__(self, profundidad_cola: int = 1,
+                 tiempo_servicio_ns: float = 100_000,
+                 ancho_banda_mb_s: float = 500,
+                 tamano_pagina: int = 4096,
+                 tiempo_referencia_ns: float = 100):
+        """
+        Args:
+            profundidad_cola: Solicitudes atendidas en paralelo
+            tiempo_servicio_ns: Latencia fija de cada solicitud
+            ancho_banda_mb_s: Velocidad de transferencia (MB/s)
+            tamano_pagina: Bytes transferidos por solicitud
+            tiempo_referencia_ns: Tiempo de CPU de cada referencia
+        """
+        if profundidad_cola < 1:
+            raise ValueError("La profundidad de cola debe ser al menos 1")
+        if ancho_banda_mb_s <= 0:
+            raise ValueError("El ancho de banda debe ser positivo")
+        self.profundidad_cola = profundidad_cola
+        self.tiempo_servicio_ns = tiempo_servicio_ns
+        self.ancho_banda_mb_s = ancho_banda_mb_s
+        self.tamano_pagina = tamano_pagina
+        self.tiempo_referencia_ns = tiempo_referencia_ns
+        self._canales = None
+        self._inicio = 0.0
+        self.resetear()
+    
+    @property
+    def duracion_solicitud_ns(self) -> float:
+        """Servicio más transferencia de una página"""
+        transferencia = self.tamano_pagina * 1000 / self.ancho_banda_mb_s
+        return self.tiempo_servicio_ns + transferencia
+    
+    def resetear(self):
+        """Descarta las estadísticas de la última ejecución"""
+        self.lecturas = 0
+        self.escrituras = 0
+        self.en_cola = 0
+        self.cola_maxima = 0
+        self.espera_total_ns = 0.0
+        self.espera_maxima_ns = 0.0
+        self.ocupado_ns = 0.0
+        self.tiempo_total_ns = 0.0
+        self.bloqueo_ns: Dict[int, float] = {}
+        self.lecturas_fondo = 0
+        self._fondo = set()
+    
+    # ========== DISPOSITIVO ==========
+    
+    async def _solicitud(self):
+        """Encola una solicitud y espera a que el dispositivo la complete"""
+        bucle = asyncio.get_running_loop()
+        llegada = bucle.time()
+        self.en_cola += 1
+        self.cola_maxima = max(self.cola_maxima, self.en_cola)
+        async with self._canales:
+            self.en_cola -= 1
+            espera = (bucle.time() - llegada) * NS_POR_SEGUNDO
+            self.espera_total_ns += espera
+            self.espera_maxima_ns = max(self.espera_maxima_ns, espera)
+            duracion = self.duracion_solicitud_ns
+            self.ocupado_ns += duracion
+            await asyncio.sleep(duracion / NS_POR_SEGUNDO)
+    
+    async def leer(self):
+        """Carga una página desde el almacén"""
+        self.lecturas += 1
+        await self._solicitud()
+    
+    async def escribir(self):
+        """Escribe una página modificada en el almacén"""
+        self.escrituras += 1
+        await self._solicitud()
+    
+    async def atender_fallo(self, proceso_id: int, victima_sucia: bool):
+        """Bloquea al proceso hasta escribir la víctima (si hace falta) y leer la página"""
+        bucle = asyncio.get_running_loop()
+        inicio = bucle.time()
+        if victima_sucia:
+            await self.escribir()
+        await self.leer()
+        bloqueo = (bucle.time() - inicio) * NS_POR_SEGUNDO
+        self.bloqueo_ns[proceso_id] = self.bloqueo_ns.get(proceso_id, 0.0) + bloqueo
+    
+    def en_segundo_plano(self, lecturas: int, escrituras: int = 0):
+        """Encola E/S que no bloquea a ningún proceso (p. ej. precarga)"""
+        for _ in range(escrituras):
+            self._fondo.add(asyncio.ensure_future(self.escribir()))
+        for _ in range(lecturas):
+            self.lecturas_fondo += 1
+            self._fondo.add(asyncio.ensure_future(self.leer()))
+    
+    async def drenar(self):
+        """Espera a que termine la E/S en segundo plano"""
+        while self._fondo:
+            pendientes, self._fondo = self._fondo, set()
+            await asyncio.gather(*pendientes)
+    
+    def iniciar(self):
+        """Prepara el dispositivo dentro del bucle en ejecución"""
+        self._canales = asyncio.Semaphore(self.profundidad_cola)
+        self._inicio = asyncio.get_running_loop().time()
+    
+    def finalizar(self):
+        """Acumula el tiempo simulado transcurrido desde iniciar()"""
+        transcurrido = asyncio.get_running_loop().time() - self._inicio
+        self.tiempo_total_ns += transcurrido * NS_POR_SEGUNDO
+    
+    def obtener_estadisticas(self) -> dict:
+        """Utilización del dispositivo, demoras de cola y bloqueos"""
+        solicitudes = self.lecturas + self.escrituras
+        capacidad = self.tiempo_total_ns * self.profundidad_cola
+        return {
+            'profundidad_cola': self.profundidad_cola,
+            'lecturas': self.lecturas,
+            'escrituras': self.escrituras,
+            'lecturas_segundo_plano': self.lecturas_fondo,
+            'tiempo_total_ns': self.tiempo_total_ns,
+            'utilizacion': (self.ocupado_ns / capacidad * 100) if capacidad else 0.0,
+            'espera_cola_promedio_ns': (self.espera_total_ns / solicitudes
+                                        if solicitudes else 0.0),
+            'espera_cola_maxima_ns': self.espera_maxima_ns,
+            'cola_maxima': self.cola_maxima,
+            'bloqueo_ns': dict(self.bloqueo_ns)
+        }
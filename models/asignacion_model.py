@@ -0,0 +1,392 @@
+"""
+MODELO: Asignación de marcos a procesos
+Reparte la memoria física en cuotas y decide de quién se reemplaza
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from .conjunto_trabajo_model import ConjuntoTrabajo
+
+# Alcance del reemplazo: local = la víctima sale de los marcos del proceso
+# que falla; global = de cualquier proceso
+ALCANCE_LOCAL = "local"
+ALCANCE_GLOBAL = "global"
+ALCANCES_REEMPLAZO = (ALCANCE_LOCAL, ALCANCE_GLOBAL)
+
+class AsignadorMarcos(ABC):
+    """
+    Clase base de las políticas de asignación de marcos
+    
+    Cada proceso recibe primero su mínimo (minimo, o el de 'minimos' por
+    proceso) y el resto de los marcos se reparte en proporción al peso de
+    la política; quien por proporción quedaría por debajo de su mínimo
+    se queda con el mínimo y sale del reparto. Las cuotas se recalculan
+    al agregar procesos, no en cada fallo.
+    
+    Con reemplazo local, un proceso que alcanzó su cuota reemplaza entre
+    sus propias páginas aunque haya marcos libres, y uno por debajo de su
+    cuota sin marcos libres le quita un marco al proceso más excedido (o,
+    si ninguno excede la suya, toma la víctima global).
+    Con reemplazo global la víctima la elige el algoritmo entre todos los
+    marcos, salvo que deje a otro proceso por debajo de su mínimo. Los
+    controles de cuota usan los contadores de residentes de la memoria
+    (O(1) por fallo); solo la búsqueda de un donante recorre los procesos.
+    """
+    
+    def __init__(self, minimo: int = 1,
+                 minimos: Optional[Dict[int, int]] = None):
+        if minimo < 0:
+            raise ValueError("El mínimo de marcos no puede ser negativo")
+        self.nombre = "Base"
+        self.minimo = minimo
+        self.minimos = dict(minimos or {})
+        self.procesos = {}
+        self.num_marcos = 0
+        self.cuotas: Dict[int, int] = {}
+        self.resetear_estadisticas()
+    
+    def resetear_estadisticas(self):
+        self.locales = 0          # Fallos resueltos dentro de la cuota
+        self.robos = 0            # Marcos quitados a procesos excedidos
+        self.protegidos = 0       # Víctimas globales desviadas por el mínimo
+    
+    @abstractmethod
+    def _peso(self, proceso) -> float:
+        """Peso del proceso en el reparto de marcos"""
+        pass
+    
+    def _orden_donante(self, proceso, exceso: int):
+        """Clave de preferencia entre donantes (mayor = se elige antes)"""
+        return exceso
+    
+    # ========== CUOTAS ==========
+    
+    def establecer_marcos(self, num_marcos: int):
+        """Fija la cantidad de marcos a repartir"""
+        self.num_marcos = num_marcos
+        self.recalcular()
+    
+    def agregar(self, proceso):
+        """Agrega un proceso al reparto"""
+        self.procesos[proceso.id] = proceso
+        self.recalcular()
+    
+    def minimo_de(self, proceso_id: int) -> int:
+        return self.minimos.get(proceso_id, self.minimo)
+    
+    def cuota(self, proceso_id: int) -> int:
+        return self.cuotas.get(proceso_id, 0)
+    
+    def recalcular(self):
+        """Reparte los marcos entre los procesos agregados"""
+        cuotas = {pid: 0 for pid in self.procesos}
+        pesos = {pid: max(self._peso(proceso), 0)
+                 for pid, proceso in self.procesos.items()}
+        disponibles = self.num_marcos
+        repartir = list(self.procesos)
+        
+        # Mínimos de quienes no llegarían a él por proporción
+        while repartir and disponibles > 0:
+            total = sum(pesos[pid] for pid in repartir)
+            fijos = [pid for pid in repartir
+                     if not total
+                     or disponibles * pesos[pid] / total < self.minimo_de(pid)]
+            if not fijos:
+                break
+            for pid in fijos:
+                cuotas[pid] = min(self.minimo_de(pid), disponibles)
+                disponibles -= cuotas[pid]
+            repartir = [pid for pid in repartir if pid not in fijos]
+        
+        # El resto, en proporción al peso (método del resto mayor)
+        total = sum(pesos[pid] for pid in repartir)
+        if total and disponibles > 0:
+            restos = []
+            for orden, pid in enumerate(repartir):
+                parte = disponibles * pesos[pid] / total
+                cuotas[pid] = int(parte)
+                restos.append((cuotas[pid] - parte, orden, pid))
+            sobrantes = disponibles - sum(cuotas[pid] for pid in repartir)
+            for _, _, pid in sorted(restos)[:sobrantes]:
+                cuotas[pid] += 1
+        self.cuotas = cuotas
+    
+    # ========== DECISIONES DEL SIMULADOR ==========
+    
+    def registrar_fallo(self, proceso):
+        """Fallo de página del proceso, antes de buscarle un marco"""
+        pass
+    
+    def admite_libre(self, proceso_id: int, memoria, alcance: str) -> bool:
+        """Si el proceso puede ocupar un marco libre en este fallo"""
+        if alcance == ALCANCE_GLOBAL:
+            return True
+        residentes = memoria.contar_marcos_del_proceso(proceso_id)
+        return residentes == 0 or residentes < self.cuota(proceso_id)
+    
+    def elegir_dueno(self, proceso_id: int, memoria,
+                     alcance: str) -> Optional[int]:
+        """
+        Proceso entre cuyos marcos se elige la víctima (None = todos)
+        """
+        if alcance == ALCANCE_GLOBAL:
+            return None
+        residentes = memoria.contar_marcos_del_proceso(proceso_id)
+        if residentes and residentes >= self.cuota(proceso_id):
+            self.locales += 1
+            return proceso_id
+        donante = self._donante(proceso_id, memoria, self.cuota)
+        if donante is None:
+            # Nadie excede su cuota (cuotas dinámicas): reemplazo global
+            return None
+        self.robos += 1
+        return donante
+    
+    def proteger(self, proceso_id: int, dueno_victima: int,
+                 memoria) -> Optional[int]:
+        """
+        Con reemplazo global, proceso del que conviene tomar la víctima
+        si la elegida deja a su dueño por debajo del mínimo (None = no
+        hace falta o no hay otro). Los procesos terminados no se protegen.
+        """
+        dueno = self.procesos.get(dueno_victima)
+        if (dueno is None or dueno_victima == proceso_id
+                or not dueno.tiene_mas_accesos()
+                or memoria.contar_marcos_del_proceso(dueno_victima)
+                > self.minimo_de(dueno_victima)):
+            return None
+        donante = self._donante(proceso_id, memoria, self.minimo_de,
+                                incluir_propio=True)
+        if donante is not None:
+            self.protegidos += 1
+        return donante
+    
+    def _donante(self, proceso_id: int, memoria, limite,
+                 incluir_propio: bool = False) -> Optional[int]:
+        """
+        Proceso con más marcos por encima de su límite (cuota o mínimo);
+        los que terminaron su secuencia ya no tienen límite
+        """
+        mejor = None
+        clave_mejor = None
+        for pid, proceso in self.procesos.items():
+            if pid == proceso_id and not incluir_propio:
+                continue
+            exceso = memoria.contar_marcos_del_proceso(pid)
+            if proceso.tiene_mas_accesos():
+                exceso -= limite(pid)
+            if exceso <= 0:
+                continue
+            clave = self._orden_donante(proceso, exceso)
+            if clave_mejor is None or clave > clave_mejor:
+                mejor, clave_mejor = pid, clave
+        return mejor
+    
+    # ========== ESTADÍSTICAS ==========
+    
+    def obtener_estadisticas(self, memoria=None) -> dict:
+        estadisticas = {
+            'nombre': self.nombre,
+            'minimo': self.minimo,
+            'cuotas': dict(self.cuotas),
+            'locales': self.locales,
+            'robos': self.robos,
+            'protegidos': self.protegidos
+        }
+        if memoria is not None:
+            estadisticas['residentes'] = {
+                pid: memoria.contar_marcos_del_proceso(pid)
+                for pid in self.procesos
+            }
+        return estadisticas
+    
+    def resetear(self):
+        self.resetear_estadisticas()
+
+class AsignacionIgualitaria(AsignadorMarcos):
+    """Reparto igualitario: la misma cuota para todos los procesos"""
+    
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
+        self.nombre = "igualitaria"
+    
+    def _peso(self, proceso) -> float:
+        return 1
+
+class AsignacionProporcional(AsignadorMarcos):
+    """Reparto proporcional al tamaño del espacio virtual de cada proceso"""
+    
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
+        self.nombre = "proporcional"
+    
+    def _peso(self, proceso) -> float:
+        return proceso.num_paginas_virtuales
+
+class AsignacionPrioridad(AsignadorMarcos):
+    """
+    Reparto proporcional a la prioridad de cada proceso (proceso.prioridad,
+    mayor = más marcos)
+    
+    Al buscar un donante se prefiere al de menor prioridad, y entre
+    iguales, al más excedido.
+    """
+    
+    def __init__(self, **opciones):
+        super().__init__(**opciones)
+        self.nombre = "prioridad"
+    
+    def _peso(self, proceso) -> float:
+        return proceso.prioridad
+    
+    def _orden_donante(self, proceso, exceso: int):
+        return (-proceso.prioridad, exceso)
+
+class AsignacionConjuntoTrabajo(AsignadorMarcos):
+    """
+    Cuota = tamaño del conjunto de trabajo de cada proceso (ver
+    ConjuntoTrabajo), al menos su mínimo
+    
+    La cuota sigue a la localidad del proceso referencia a referencia: al
+    entrar en una fase nueva toma marcos libres o de quien tiene más
+    páginas residentes que su conjunto de trabajo, y las páginas que
+    salieron de la ventana son las primeras en cederse. A los procesos
+    sin conjunto de trabajo se les crea uno con 'ventana' (Δ).
+    """
+    
+    def __init__(self, ventana: int = 1000, **opciones):
+        super().__init__(**opciones)
+        self.nombre = "conjunto_trabajo"
+        self.ventana = ventana
+    
+    def _peso(self, proceso) -> float:
+        return 1
+    
+    def agregar(self, proceso):
+        if proceso.conjunto_trabajo is None:
+            proceso.conjunto_trabajo = ConjuntoTrabajo(self.ventana)
+        super().agregar(proceso)
+    
+    def cuota(self, proceso_id: int) -> int:
+        proceso = self.procesos.get(proceso_id)
+        if proceso is None:
+            return 0
+        return max(self.minimo_de(proceso_id), len(proceso.conjunto_trabajo))
+    
+    def obtener_estadisticas(self, memoria=None) -> dict:
+        estadisticas = super().obtener_estadisticas(memoria)
+        estadisticas['cuotas'] = {pid: self.cuota(pid) for pid in self.procesos}
+        estadisticas['ventana'] = self.ventana
+        return estadisticas
+
+class AsignacionPFF(AsignadorMarcos):
+    """
+    Frecuencia de fallos de página (PFF)
+    
+    Cada proceso empieza con su mínimo. En cada fallo se mide cuántas
+    referencias pasaron desde el fallo anterior del mismo proceso: por
+    debajo de 'intervalo_minimo' (fallos demasiado frecuentes) la cuota
+    crece 'paso' marcos, tomados de los que nadie tiene asignados; por
+    encima de 'intervalo_maximo' se achica 'paso' marcos, sin bajar del
+    mínimo, y los marcos sobrantes pasan a los procesos que los piden.
+    Un crecimiento sin marcos disponibles se cuenta en 'sin_marcos':
+    la demanda supera a la memoria.
+    """
+    
+    def __init__(self, intervalo_minimo: int = 10, intervalo_maximo: int = 100,
+                 paso: int = 1, **opciones):
+        if not 0 < intervalo_minimo <= intervalo_maximo:
+            raise ValueError(
+                "Los intervalos de PFF deben cumplir 0 < mínimo <= máximo"
+            )
+        super().__init__(**opciones)
+        self.nombre = "pff"
+        self.intervalo_minimo = intervalo_minimo
+        self.intervalo_maximo = intervalo_maximo
+        self.paso = max(1, paso)
+        self.asignados = 0
+        self._ultimo_fallo: Dict[int, int] = {}
+    
+    def resetear_estadisticas(self):
+        super().resetear_estadisticas()
+        self.crecimientos = 0
+        self.reducciones = 0
+        self.sin_marcos = 0
+    
+    def _peso(self, proceso) -> float:
+        return 1
+    
+    def recalcular(self):
+        """Los procesos nuevos reciben su mínimo; el resto conserva su cuota"""
+        disponibles = self.num_marcos
+        cuotas = {}
+        for pid in self.procesos:
+            cuota = self.cuotas.get(pid, self.minimo_de(pid))
+            cuotas[pid] = min(cuota, disponibles)
+            disponibles -= cuotas[pid]
+        self.cuotas = cuotas
+        self.asignados = self.num_marcos - disponibles
+    
+    def registrar_fallo(self, proceso):
+        pid = proceso.id
+        ahora = proceso.total_accesos
+        anterior = self._ultimo_fallo.get(pid)
+        self._ultimo_fallo[pid] = ahora
+        if anterior is None or pid not in self.cuotas:
+            return
+        
+        intervalo = ahora - anterior
+        if intervalo < self.intervalo_minimo:
+            crecer = min(self.paso, self.num_marcos - self.asignados)
+            if crecer <= 0:
+                self.sin_marcos += 1
+                return
+            self.cuotas[pid] += crecer
+            self.asignados += crecer
+            self.crecimientos += 1
+        elif intervalo > self.intervalo_maximo:
+            reducir = min(self.paso, self.cuotas[pid] - self.minimo_de(pid))
+            if reducir > 0:
+                self.cuotas[pid] -= reducir
+                self.asignados -= reducir
+                self.reducciones += 1
+    
+    def obtener_estadisticas(self, memoria=None) -> dict:
+        estadisticas = super().obtener_estadisticas(memoria)
+        estadisticas['intervalo_minimo'] = self.intervalo_minimo
+        estadisticas['intervalo_maximo'] = self.intervalo_maximo
+        estadisticas['crecimientos'] = self.crecimientos
+        estadisticas['reducciones'] = self.reducciones
+        estadisticas['sin_marcos'] = self.sin_marcos
+        return estadisticas
+    
+    def resetear(self):
+        super().resetear()
+        self._ultimo_fallo = {}
+        self.cuotas = {}
+        self.recalcular()
+
+
+# Registro de políticas de asignación disponibles (nombre -> clase)
+ASIGNACIONES = {
+    "igualitaria": AsignacionIgualitaria,
+    "proporcional": AsignacionProporcional,
+    "prioridad": AsignacionPrioridad,
+    "conjunto_trabajo": AsignacionConjuntoTrabajo,
+    "pff": AsignacionPFF
+}
+
+def crear_asignador(nombre: str, **opciones) -> AsignadorMarcos:
+    """
+    Crea una política de asignación a partir de su nombre
+    
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna política
+    """
+    clase = ASIGNACIONES.get(nombre.lower())
+    if clase is None:
+        raise ValueError(
+            f"Asignación desconocida: {nombre} "
+            f"(disponibles: {', '.join(ASIGNACIONES)})"
+        )
+    return clase(**opciones)
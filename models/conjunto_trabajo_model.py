@@ -0,0 +1,77 @@
+"""
+MODELO: Conjunto de trabajo de un proceso
+Páginas distintas referenciadas en una ventana de tiempo virtual
+"""
+
+from collections import deque
+
+class ConjuntoTrabajo:
+    """
+    Conjunto de trabajo W(t, Δ): páginas distintas entre las últimas Δ
+    referencias del proceso (su tiempo virtual)
+    
+    Se mantiene en O(1) por referencia con una ventana deslizante de las
+    últimas Δ páginas y un contador de apariciones por página: la página
+    que sale de la ventana solo deja el conjunto cuando su contador llega
+    a cero. Nunca se vuelve a recorrer la historia.
+    """
+    
+    def __init__(self, ventana: int):
+        if ventana < 1:
+            raise ValueError("La ventana del conjunto de trabajo debe ser al menos 1")
+        self.ventana = ventana
+        self.resetear()
+    
+    def resetear(self):
+        """Vacía la ventana y las estadísticas"""
+        self._ultimas = deque()
+        self._apariciones = {}
+        self.referencias = 0
+        self.suma_tamanos = 0
+        self.tamano_maximo = 0
+    
+    def registrar(self, num_pagina: int) -> int:
+        """
+        Agrega una referencia y desliza la ventana
+        
+        Returns:
+            Cambio del tamaño del conjunto (-1, 0 o +1)
+        """
+        apariciones = self._apariciones
+        antes = len(apariciones)
+        ultimas = self._ultimas
+        ultimas.append(num_pagina)
+        apariciones[num_pagina] = apariciones.get(num_pagina, 0) + 1
+        if len(ultimas) > self.ventana:
+            vieja = ultimas.popleft()
+            cuenta = apariciones[vieja] - 1
+            if cuenta:
+                apariciones[vieja] = cuenta
+            else:
+                del apariciones[vieja]
+        
+        tamano = len(apariciones)
+        self.referencias += 1
+        self.suma_tamanos += tamano
+        if tamano > self.tamano_maximo:
+            self.tamano_maximo = tamano
+        return tamano - antes
+    
+    def paginas(self) -> set:
+        """Páginas del conjunto de trabajo actual"""
+        return set(self._apariciones)
+    
+    def __len__(self):
+        return len(self._apariciones)
+    
+    def __contains__(self, num_pagina):
+        return num_pagina in self._apariciones
+    
+    def obtener_estadisticas(self) -> dict:
+        return {
+            'ventana': self.ventana,
+            'tamano': len(self._apariciones),
+            'tamano_maximo': self.tamano_maximo,
+            'tamano_promedio': (self.suma_tamanos / self.referencias
+                                if self.referencias else 0.0)
+        }
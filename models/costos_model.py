@@ -0,0 +1,139 @@
+"""
+MODELO: Modelo de costos temporales
+Acumula nanosegundos simulados por tipo de acceso y calcula el tiempo
+efectivo de acceso (EAT), el tiempo de espera total y percentiles de latencia
+"""
+
+from typing import Dict, Optional
+
+# Tipos de acceso según dónde se resolvió la traducción
+ACCESO_TLB = "acierto_tlb"          # Traducción encontrada en la TLB
+ACCESO_TABLA = "acierto_tabla"      # Recorrido de la tabla de páginas
+ACCESO_FALLO = "fallo"              # Fallo de página sin escritura
+ACCESO_FALLO_SUCIO = "fallo_sucio"  # Fallo que además escribe la víctima
+TIPOS_ACCESO = (ACCESO_TLB, ACCESO_TABLA, ACCESO_FALLO, ACCESO_FALLO_SUCIO)
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+class ModeloCostos:
+    """
+    Modelo de latencias de un acceso a memoria
+    
+    latencia = TLB (si hay) + accesos de la tabla de páginas × memoria
+               + servicio del fallo (+ escritura de la víctima sucia)
+               + el acceso final a memoria
+    
+    Las latencias posibles son pocas combinaciones de los parámetros, así
+    que el histograma guarda cuentas exactas por valor y los percentiles
+    salen exactos en O(valores distintos).
+    """
+    
+    def __init__(self, latencia_memoria_ns: float = 100,
+                 latencia_tlb_ns: float = 20,
+                 servicio_fallo_ns: float = 8_000_000,
+                 escritura_ns: float = 8_000_000):
+        """
+        Args:
+            latencia_memoria_ns: Un acceso a memoria principal
+            latencia_tlb_ns: Una consulta a la TLB
+            servicio_fallo_ns: Atender un fallo (leer la página del disco)
+            escritura_ns: Costo extra de escribir una víctima modificada
+        """
+        self.latencia_memoria_ns = latencia_memoria_ns
+        self.latencia_tlb_ns = latencia_tlb_ns
+        self.servicio_fallo_ns = servicio_fallo_ns
+        self.escritura_ns = escritura_ns
+        self.resetear()
+    
+    def resetear(self):
+        """Descarta los tiempos acumulados"""
+        self.accesos = 0
+        self.tiempo_total_ns = 0.0
+        self.tiempo_tlb_ns = 0.0
+        self.tiempo_tabla_ns = 0.0
+        self.tiempo_memoria_ns = 0.0
+        self.tiempo_fallos_ns = 0.0
+        self.tiempo_escrituras_ns = 0.0
+        self.accesos_por_tipo: Dict[str, int] = dict.fromkeys(TIPOS_ACCESO, 0)
+        self.tiempo_por_tipo: Dict[str, float] = dict.fromkeys(TIPOS_ACCESO, 0.0)
+        self.histograma: Dict[float, int] = {}
+    
+    def registrar(self, fallo: bool, accesos_tabla: int, consulto_tlb: bool,
+                  victima_sucia: bool = False) -> float:
+        """
+        Cobra un acceso y retorna su latencia en nanosegundos
+        
+        Args:
+            fallo: Si el acceso produjo un fallo de página
+            accesos_tabla: Accesos a memoria del recorrido de la tabla de
+                páginas (0 si la TLB resolvió la traducción)
+            consulto_tlb: Si hay TLB (se cobra la consulta aunque falle)
+            victima_sucia: Si el fallo desalojó una página modificada
+        """
+        tlb = self.latencia_tlb_ns if consulto_tlb else 0
+        tabla = accesos_tabla * self.latencia_memoria_ns
+        memoria = self.latencia_memoria_ns
+        servicio = self.servicio_fallo_ns if fallo else 0
+        escritura = self.escritura_ns if victima_sucia else 0
+        latencia = tlb + tabla + memoria + servicio + escritura
+        
+        if fallo:
+            tipo = ACCESO_FALLO_SUCIO if victima_sucia else ACCESO_FALLO
+        elif accesos_tabla or not consulto_tlb:
+            tipo = ACCESO_TABLA
+        else:
+            tipo = ACCESO_TLB
+        
+        self.accesos += 1
+        self.tiempo_total_ns += latencia
+        self.tiempo_tlb_ns += tlb
+        self.tiempo_tabla_ns += tabla
+        self.tiempo_memoria_ns += memoria
+        self.tiempo_fallos_ns += servicio
+        self.tiempo_escrituras_ns += escritura
+        self.accesos_por_tipo[tipo] += 1
+        self.tiempo_por_tipo[tipo] += latencia
+        self.histograma[latencia] = self.histograma.get(latencia, 0) + 1
+        return latencia
+    
+    def tiempo_efectivo_acceso(self) -> float:
+        """EAT: latencia promedio por acceso (ns)"""
+        return self.tiempo_total_ns / self.accesos if self.accesos else 0.0
+    
+    def tiempo_espera(self) -> float:
+        """Tiempo total por encima del acceso a memoria ideal (ns)"""
+        return self.tiempo_total_ns - self.tiempo_memoria_ns
+    
+    def percentil(self, p: float) -> Optional[float]:
+        """Latencia por debajo de la cual cae el p% de los accesos"""
+        if not self.accesos:
+            return None
+        objetivo = p / 100 * self.accesos
+        acumulado = 0
+        for latencia in sorted(self.histograma):
+            acumulado += self.histograma[latencia]
+            if acumulado >= objetivo:
+                return latencia
+        return max(self.histograma)
+    
+    def obtener_histograma(self) -> list:
+        """Pares (latencia_ns, cantidad) ordenados por latencia"""
+        return sorted(self.histograma.items())
+    
+    def obtener_estadisticas(self) -> dict:
+        """Tiempos acumulados, EAT y percentiles de latencia"""
+        return {
+            'tiempo_efectivo_acceso_ns': self.tiempo_efectivo_acceso(),
+            'tiempo_total_ns': self.tiempo_total_ns,
+            'tiempo_espera_ns': self.tiempo_espera(),
+            'tiempo_tlb_ns': self.tiempo_tlb_ns,
+            'tiempo_tabla_ns': self.tiempo_tabla_ns,
+            'tiempo_memoria_ns': self.tiempo_memoria_ns,
+            'tiempo_fallos_ns': self.tiempo_fallos_ns,
+            'tiempo_escrituras_ns': self.tiempo_escrituras_ns,
+            'accesos_por_tipo': dict(self.accesos_por_tipo),
+            'tiempo_por_tipo_ns': dict(self.tiempo_por_tipo),
+            'percentiles_ns': {
+                f"p{p:g}": self.percentil(p) for p in PERCENTILES
+            }
+        }
@@ -0,0 +1,228 @@
+"""
+MODELO: Curvas de fallos por distancia de pila (Mattson)
+Calcula en una sola pasada los fallos de LRU y OPT para todos los tamaños
+de memoria, aprovechando que ambos son algoritmos de pila
+"""
+
+from array import array
+from typing import Optional, Dict
+from .proceso_model import MASCARA_PAGINA
+
+INFINITO = float('inf')
+
+class ArbolFenwick:
+    """Árbol de Fenwick (BIT) sobre posiciones de tiempo, ampliable"""
+    
+    def __init__(self, capacidad: int = 1024):
+        self.capacidad = max(1, capacidad)
+        self.arbol = array('i', [0]) * (self.capacidad + 1)
+        self.valores = array('b', [0]) * (self.capacidad + 1)
+    
+    def ampliar(self, minimo: int):
+        """Duplica la capacidad hasta cubrir la posición 'minimo'"""
+        capacidad = self.capacidad
+        while capacidad < minimo:
+            capacidad *= 2
+        valores = self.valores
+        self.capacidad = capacidad
+        self.arbol = array('i', [0]) * (capacidad + 1)
+        self.valores = array('b', [0]) * (capacidad + 1)
+        for i in range(1, len(valores)):
+            if valores[i]:
+                self.sumar(i, valores[i])
+    
+    def sumar(self, posicion: int, delta: int):
+        """Suma delta en la posición (1-indexada)"""
+        if posicion > self.capacidad:
+            self.ampliar(posicion)
+        self.valores[posicion] += delta
+        arbol = self.arbol
+        n = self.capacidad
+        while posicion <= n:
+            arbol[posicion] += delta
+            posicion += posicion & -posicion
+    
+    def prefijo(self, posicion: int) -> int:
+        """Suma de las posiciones 1..posicion"""
+        if posicion > self.capacidad:
+            posicion = self.capacidad
+        arbol = self.arbol
+        total = 0
+        while posicion > 0:
+            total += arbol[posicion]
+            posicion -= posicion & -posicion
+        return total
+
+class DistanciaPilaLRU:
+    """
+    Distancias de pila LRU incrementales
+    
+    Cada referencia se procesa en O(log n): el árbol de Fenwick marca la
+    última aparición de cada página, y la distancia es la cantidad de
+    páginas distintas referenciadas desde la aparición anterior.
+    """
+    
+    def __init__(self, capacidad: int = 1024):
+        self.arbol = ArbolFenwick(capacidad)
+        self.ultima_aparicion: Dict[int, int] = {}
+        self.tiempo = 0
+        self.histograma = [0]
+        self.fallos_frios = 0
+    
+    def referenciar(self, pagina: int) -> float:
+        """Procesa una referencia y retorna su distancia (INFINITO si es fría)"""
+        self.tiempo += 1
+        anterior = self.ultima_aparicion.get(pagina)
+        
+        if anterior is None:
+            distancia = INFINITO
+            self.fallos_frios += 1
+        else:
+            # Marcas posteriores a 'anterior' = páginas distintas desde entonces
+            distancia = (len(self.ultima_aparicion)
+                         - self.arbol.prefijo(anterior) + 1)
+            if distancia >= len(self.histograma):
+                self.histograma.extend([0] * (distancia + 1 - len(self.histograma)))
+            self.histograma[distancia] += 1
+            self.arbol.sumar(anterior, -1)
+        
+        self.arbol.sumar(self.tiempo, 1)
+        self.ultima_aparicion[pagina] = self.tiempo
+        return distancia
+    
+    def procesar(self, secuencia) -> "DistanciaPilaLRU":
+        """Procesa una secuencia completa de referencias (lecturas o escrituras)"""
+        for referencia in secuencia:
+            self.referenciar(referencia & MASCARA_PAGINA)
+        return self
+    
+    def obtener_curva(self, max_marcos: Optional[int] = None) -> list:
+        """Retorna curva[k - 1] = fallos con k marcos, para k = 1..max_marcos"""
+        return _curva_desde_histograma(
+            self.histograma, self.tiempo, max_marcos,
+            len(self.ultima_aparicion)
+        )
+
+class DistanciaPilaOPT:
+    """
+    Distancias de pila OPT (Mattson, prioridad por próximo uso)
+    
+    Requiere la secuencia completa para conocer el próximo uso de cada
+    referencia (una pasada hacia atrás). La pasada hacia adelante es una
+    sola, pero no O(n log n): cada referencia reacomoda las posiciones de
+    la pila por encima de la página referenciada, así que el costo es
+    O(n·D), con D la profundidad de la pila (las páginas distintas, o
+    max_marcos cuando se indica). Sigue siendo una pasada para todos los
+    tamaños en lugar de una simulación por tamaño.
+    """
+    
+    def __init__(self, secuencia: list, max_marcos: Optional[int] = None):
+        self.secuencia = secuencia
+        self.max_marcos = max_marcos
+        self.histograma = [0]
+        self.fallos_frios = 0
+        self.tiempo = 0
+    
+    def procesar(self) -> "DistanciaPilaOPT":
+        secuencia = self.secuencia
+        n = len(secuencia)
+        
+        siguiente = [INFINITO] * n
+        ultima = {}
+        for i in range(n - 1, -1, -1):
+            siguiente[i] = ultima.get(secuencia[i], INFINITO)
+            ultima[secuencia[i]] = i
+        
+        limite = self.max_marcos or len(ultima)
+        pila = []
+        posicion: Dict[int, int] = {}
+        proximo: Dict[int, float] = {}
+        histograma = self.histograma
+        
+        for t in range(n):
+            pagina = secuencia[t]
+            profundidad = posicion.get(pagina)
+            
+            if profundidad is None:
+                if pagina not in proximo:
+                    self.fallos_frios += 1
+                fin = len(pila)
+            else:
+                distancia = profundidad + 1
+                if distancia >= len(histograma):
+                    histograma.extend([0] * (distancia + 1 - len(histograma)))
+                histograma[distancia] += 1
+                fin = profundidad
+            
+            # La página referenciada pasa al tope; el resto se reacomoda
+            # conservando en cada nivel la de mayor prioridad (uso más próximo)
+            proximo[pagina] = siguiente[t]
+            if not pila:
+                pila.append(pagina)
+            else:
+                if fin > 0:
+                    llevada = pila[0]
+                    for i in range(1, fin):
+                        otra = pila[i]
+                        if proximo[otra] > proximo[llevada]:
+                            pila[i] = llevada
+                            posicion[llevada] = i
+                            llevada = otra
+                    if fin < len(pila):
+                        pila[fin] = llevada
+                        posicion[llevada] = fin
+                    elif len(pila) < limite:
+                        pila.append(llevada)
+                        posicion[llevada] = fin
+                    else:
+                        del posicion[llevada]
+                pila[0] = pagina
+            posicion[pagina] = 0
+        
+        self.tiempo = n
+        return self
+    
+    def obtener_curva(self, max_marcos: Optional[int] = None) -> list:
+        """Retorna curva[k - 1] = fallos con k marcos, para k = 1..max_marcos"""
+        return _curva_desde_histograma(
+            self.histograma, self.tiempo, max_marcos or self.max_marcos,
+            len(set(self.secuencia))
+        )
+
+def _curva_desde_histograma(histograma: list, total: int,
+                            max_marcos: Optional[int], distintas: int) -> list:
+    """Convierte un histograma de distancias en fallos por tamaño"""
+    if max_marcos is None:
+        max_marcos = max(1, distintas)
+    curva = []
+    aciertos = 0
+    for k in range(1, max_marcos + 1):
+        if k < len(histograma):
+            aciertos += histograma[k]
+        curva.append(total - aciertos)
+    return curva
+
+def calcular_curva_fallos(secuencia, algoritmo: str = "LRU",
+                          max_marcos: Optional[int] = None) -> list:
+    """
+    Calcula los fallos de página para 1..max_marcos marcos en una pasada
+    
+    Args:
+        secuencia: Secuencia de números de página de un proceso
+        algoritmo: "LRU" u "OPT"
+        max_marcos: Mayor tamaño de memoria a evaluar (por defecto, la
+            cantidad de páginas distintas)
+    
+    Returns:
+        Lista donde el elemento k - 1 es la cantidad de fallos con k marcos
+    """
+    nombre = algoritmo.upper()
+    if nombre == "LRU":
+        motor = DistanciaPilaLRU(len(secuencia) if hasattr(secuencia, "__len__")
+                                 else 1024)
+        return motor.procesar(secuencia).obtener_curva(max_marcos)
+    if nombre == "OPT":
+        paginas = [referencia & MASCARA_PAGINA for referencia in secuencia]
+        return DistanciaPilaOPT(paginas, max_marcos).procesar() \
+            .obtener_curva(max_marcos)
+    raise ValueError(f"La curva en una pasada solo admite LRU u OPT, no {algoritmo}")
@@ -0,0 +1,304 @@
+"""
+MODELO: Generador de cargas de trabajo sintéticas
+Produce secuencias de referencias con localidad, vectorizadas con NumPy
+y reproducibles a partir de una semilla
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .proceso_model import BIT_ESCRITURA, FlujoReferencias
+
+MODELO_UNIFORME = "uniforme"
+MODELO_ZIPF = "zipf"
+MODELO_FASES = "fases"
+MODELO_SECUENCIAL = "secuencial"
+MODELO_BUCLE = "bucle"
+MODELO_MIXTO = "mixto"
+MODELOS_CARGA = (MODELO_UNIFORME, MODELO_ZIPF, MODELO_FASES,
+                 MODELO_SECUENCIAL, MODELO_BUCLE, MODELO_MIXTO)
+
+# Referencias por bloque: la secuencia no depende de cómo se la consuma
+TAMANO_BLOQUE = 1 << 20
+_FASES_POR_LOTE = 1 << 12
+
+# Flujos aleatorios independientes derivados de la semilla
+_FLUJO_REFERENCIAS = 0
+_FLUJO_FASES = 1
+_FLUJO_PERMUTACION = 2
+_FLUJO_RECORRIDOS = 3
+
+class GeneradorCarga:
+    """
+    Generador de referencias sintéticas
+    
+    Modelos:
+        uniforme: todas las páginas con la misma probabilidad
+        zipf: la página de rango k con probabilidad ∝ 1/k^alfa (los
+            rangos se asignan a páginas al azar)
+        fases: conjuntos de trabajo de 'tamano_conjunto' páginas
+            contiguas que cambian cada 'duracion_fase' referencias
+        secuencial: recorridos de 'duracion_fase' páginas consecutivas,
+            cada uno desde una página al azar
+        bucle: recorre una y otra vez las primeras 'tamano_bucle' páginas
+        mixto: cada referencia sale de uno de los modelos anteriores
+            según 'pesos'; cada componente conserva su propio orden
+    
+    Cada bloque de TAMANO_BLOQUE referencias usa su propio generador
+    derivado de (semilla, bloque), así que la misma semilla produce la
+    misma traza aunque se genere completa o en flujo.
+    """
+    
+    def __init__(self, num_paginas: int, modelo: str = MODELO_ZIPF,
+                 semilla: Optional[int] = None,
+                 fraccion_escrituras: float = 0.0, alfa: float = 1.0,
+                 tamano_conjunto: int = 0, duracion_fase: int = 10_000,
+                 tamano_bucle: int = 0,
+                 pesos: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            num_paginas: Páginas virtuales del proceso
+            modelo: Uno de MODELOS_CARGA
+            semilla: Semilla explícita; si es None se elige una al azar
+                y queda en self.semilla para reproducir la traza
+            fraccion_escrituras: Probabilidad de que un acceso escriba
+            alfa: Exponente de Zipf (mayor = más concentrado)
+            tamano_conjunto: Páginas de cada fase (0 = num_paginas / 8)
+            duracion_fase: Referencias por fase o por recorrido
+            tamano_bucle: Páginas del bucle (0 = num_paginas / 2)
+            pesos: modelo -> peso, para el modelo mixto (por defecto,
+                iguales entre zipf, fases, secuencial y bucle)
+        
+        Raises:
+            ValueError: Si el modelo o los parámetros no son válidos
+        """
+        if modelo not in MODELOS_CARGA:
+            raise ValueError(
+                f"Modelo de carga desconocido: {modelo} "
+                f"(disponibles: {', '.join(MODELOS_CARGA)})"
+            )
+        if num_paginas < 1:
+            raise ValueError("Debe haber al menos una página virtual")
+        if not 0 <= fraccion_escrituras <= 1:
+            raise ValueError("La fracción de escrituras debe estar entre 0 y 1")
+        if alfa < 0 or duracion_fase < 1:
+            raise ValueError("alfa debe ser >= 0 y duracion_fase >= 1")
+        
+        self.num_paginas = num_paginas
+        self.modelo = modelo
+        if semilla is None:
+            semilla = int(np.random.SeedSequence().generate_state(1)[0])
+        self.semilla = semilla
+        self.fraccion_escrituras = fraccion_escrituras
+        self.alfa = alfa
+        self.tamano_conjunto = min(num_paginas,
+                                   tamano_conjunto or max(1, num_paginas // 8))
+        self.duracion_fase = duracion_fase
+        self.tamano_bucle = min(num_paginas,
+                                tamano_bucle or max(1, num_paginas // 2))
+        
+        if modelo == MODELO_MIXTO:
+            pesos = pesos or dict.fromkeys(
+                (MODELO_ZIPF, MODELO_FASES, MODELO_SECUENCIAL, MODELO_BUCLE), 1.0
+            )
+            if any(nombre not in MODELOS_CARGA or nombre == MODELO_MIXTO
+                   for nombre in pesos):
+                raise ValueError("Los pesos del modelo mixto deben nombrar "
+                                 "modelos simples")
+            total = sum(pesos.values())
+            if total <= 0:
+                raise ValueError("Los pesos del modelo mixto deben sumar más de 0")
+            self.componentes = list(pesos)
+            self.probabilidades = np.array(
+                [pesos[nombre] / total for nombre in self.componentes]
+            )
+        else:
+            self.componentes = [modelo]
+            self.probabilidades = np.ones(1)
+        
+        self._cdf_zipf = None
+        self._guia_zipf = None
+        self._permutacion = None
+        if MODELO_ZIPF in self.componentes:
+            rangos = np.arange(1, num_paginas + 1, dtype=np.float64)
+            cdf = np.cumsum(rangos ** -alfa)
+            self._cdf_zipf = cdf / cdf[-1]
+            self._cdf_zipf[-1] = 1.0
+            self._guia_zipf = np.searchsorted(
+                self._cdf_zipf, np.linspace(0, 1, num_paginas + 1)
+            )
+            self._permutacion = self._rng(_FLUJO_PERMUTACION).permutation(
+                num_paginas
+            ).astype(np.uint32)
+        # flujo -> (lote, páginas iniciales de sus fases)
+        self._lotes_fases: Dict[int, tuple] = {}
+    
+    def _rng(self, flujo: int, indice: int = 0) -> np.random.Generator:
+        """Generador independiente para (flujo, índice) de esta semilla"""
+        return np.random.default_rng(
+            np.random.SeedSequence(self.semilla, spawn_key=(flujo, indice))
+        )
+    
+    # ========== MODELOS ==========
+    
+    def _bases_fases(self, flujo: int, primera: int, ultima: int) -> np.ndarray:
+        """
+        Página inicial de las fases primera..ultima (inclusive)
+        
+        Cada lote de _FASES_POR_LOTE fases sale de su propio generador,
+        así que la base de una fase depende solo de su número.
+        """
+        lotes = []
+        for lote in range(primera // _FASES_POR_LOTE,
+                          ultima // _FASES_POR_LOTE + 1):
+            numero, valores = self._lotes_fases.get(flujo, (-1, None))
+            if numero != lote:
+                valores = self._rng(flujo, lote).integers(
+                    0, self.num_paginas, _FASES_POR_LOTE
+                )
+                self._lotes_fases[flujo] = (lote, valores)
+            lotes.append(valores)
+        desde = primera % _FASES_POR_LOTE
+        return np.concatenate(lotes)[desde:desde + ultima - primera + 1]
+    
+    def _rangos_zipf(self, uniformes: np.ndarray) -> np.ndarray:
+        """
+        Inversa de la CDF de Zipf con tabla guía
+        
+        La tabla da, para cada intervalo de u, el primer rango posible;
+        desde ahí casi siempre bastan uno o dos pasos, en lugar de una
+        búsqueda binaria por referencia.
+        """
+        cdf = self._cdf_zipf
+        guia = self._guia_zipf
+        rangos = guia[(uniformes * (len(guia) - 1)).astype(np.int64)]
+        pendientes = np.flatnonzero(cdf[rangos] < uniformes)
+        while len(pendientes):
+            rangos[pendientes] += 1
+            pendientes = pendientes[cdf[rangos[pendientes]] < uniformes[pendientes]]
+        return rangos
+    
+    def _componente(self, modelo: str, rng: np.random.Generator,
+                    inicio: int, cantidad: int) -> np.ndarray:
+        """
+        Páginas de un modelo simple
+        
+        Args:
+            inicio: Referencias que este componente ya generó (las fases,
+                los recorridos y el bucle continúan desde ahí)
+        """
+        paginas = self.num_paginas
+        if modelo == MODELO_UNIFORME:
+            return rng.integers(0, paginas, cantidad, dtype=np.uint32)
+        if modelo == MODELO_ZIPF:
+            return self._permutacion[self._rangos_zipf(rng.random(cantidad))]
+        
+        if cantidad == 0:
+            return np.empty(0, dtype=np.uint32)
+        if modelo == MODELO_BUCLE:
+            bucle = np.arange(self.tamano_bucle, dtype=np.uint32)
+            repeticiones = -(-(inicio % self.tamano_bucle + cantidad)
+                             // self.tamano_bucle)
+            desde = inicio % self.tamano_bucle
+            return np.tile(bucle, repeticiones)[desde:desde + cantidad]
+        
+        # Referencias de cada fase dentro de [inicio, inicio + cantidad)
+        duracion = self.duracion_fase
+        primera = inicio // duracion
+        ultima = (inicio + cantidad - 1) // duracion
+        largos = np.full(ultima - primera + 1, duracion, dtype=np.int64)
+        largos[0] -= inicio - primera * duracion
+        largos[-1] -= (ultima + 1) * duracion - (inicio + cantidad)
+        
+        if modelo == MODELO_FASES:
+            bases = np.repeat(self._bases_fases(_FLUJO_FASES, primera, ultima),
+                              largos)
+            paginas_fase = bases + rng.integers(0, self.tamano_conjunto, cantidad)
+        else:
+            bases = self._bases_fases(_FLUJO_RECORRIDOS, primera, ultima)
+            # Posición dentro del recorrido: i - (inicio de su fase)
+            comienzos = np.arange(primera, ultima + 1, dtype=np.int64) * duracion
+            paginas_fase = (np.arange(inicio, inicio + cantidad, dtype=np.int64)
+                            + np.repeat(bases - comienzos, largos))
+        paginas_fase %= paginas
+        return paginas_fase.astype(np.uint32)
+    
+    # ========== GENERACIÓN ==========
+    
+    def bloques(self, longitud: int):
+        """
+        Genera la secuencia por bloques de hasta TAMANO_BLOQUE referencias
+        
+        Yields:
+            Arreglos uint32 de referencias (BIT_ESCRITURA en las escrituras)
+        """
+        generadas = [0] * len(self.componentes)
+        for indice, inicio in enumerate(range(0, longitud, TAMANO_BLOQUE)):
+            cantidad = min(TAMANO_BLOQUE, longitud - inicio)
+            rng = self._rng(_FLUJO_REFERENCIAS, indice)
+            if len(self.componentes) == 1:
+                bloque = self._componente(self.modelo, rng, inicio, cantidad)
+            else:
+                eleccion = rng.choice(len(self.componentes), cantidad,
+                                      p=self.probabilidades)
+                bloque = np.empty(cantidad, dtype=np.uint32)
+                for numero, modelo in enumerate(self.componentes):
+                    posiciones = np.flatnonzero(eleccion == numero)
+                    bloque[posiciones] = self._componente(
+                        modelo, rng, generadas[numero], len(posiciones)
+                    )
+                    generadas[numero] += len(posiciones)
+            if self.fraccion_escrituras:
+                escrituras = rng.random(cantidad) < self.fraccion_escrituras
+                bloque[escrituras] |= np.uint32(BIT_ESCRITURA)
+            yield bloque
+    
+    def generar(self, longitud: int) -> np.ndarray:
+        """Secuencia completa como arreglo uint32"""
+        if longitud <= 0:
+            return np.empty(0, dtype=np.uint32)
+        return np.concatenate(list(self.bloques(longitud)))
+    
+    def secuencia(self, longitud: int) -> memoryview:
+        """
+        Secuencia completa indexable para Proceso.establecer_secuencia
+        
+        Al indexarla retorna enteros de Python, igual que una traza
+        binaria mapeada en memoria.
+        """
+        return memoryview(self.generar(longitud)).cast("B").cast("I")
+    
+    def iterar(self, longitud: int):
+        """Recorre la secuencia referencia por referencia"""
+        for bloque in self.bloques(longitud):
+            yield from bloque.tolist()
+    
+    def flujo(self, longitud: int, ventana: int = TAMANO_BLOQUE) -> FlujoReferencias:
+        """
+        Flujo rebobinable para procesos con trazas que no caben en memoria
+        
+        Solo se materializa un bloque a la vez.
+        """
+        return FlujoReferencias(lambda: self.iterar(longitud), ventana)
+    
+    def obtener_info(self) -> dict:
+        """Parámetros necesarios para reproducir la carga"""
+        info = {
+            'modelo': self.modelo,
+            'semilla': self.semilla,
+            'num_paginas': self.num_paginas,
+            'fraccion_escrituras': self.fraccion_escrituras
+        }
+        if MODELO_ZIPF in self.componentes:
+            info['alfa'] = self.alfa
+        if MODELO_FASES in self.componentes or MODELO_SECUENCIAL in self.componentes:
+            info['duracion_fase'] = self.duracion_fase
+        if MODELO_FASES in self.componentes:
+            info['tamano_conjunto'] = self.tamano_conjunto
+        if MODELO_BUCLE in self.componentes:
+            info['tamano_bucle'] = self.tamano_bucle
+        if self.modelo == MODELO_MIXTO:
+            info['pesos'] = dict(zip(self.componentes,
+                                     self.probabilidades.tolist()))
+        return info
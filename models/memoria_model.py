@@ -3,9 +3,16 @@ MODELO: Gestión de memoria física
 Lógica de negocio para memoria, marcos y páginas
 """
 
-from typing import Optional
+import heapq
+from array import array
+from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 
+# Valores de la tabla de marcos
+SIN_PROCESO = -1          # Dueño de un marco libre
+BIT_REFERENCIADO = 1      # Bit R
+BIT_MODIFICADO = 2        # Bit M
+
 @dataclass
 class Pagina:
     """Representa una página de memoria virtual"""
@@ -17,88 +24,375 @@ class Pagina:
     def __str__(self):
         return f"P{self.proceso_id}-Pág{self.numero}"
 
+class PaginaResidente:
+    """
+    Vista de la página cargada en un marco
+    
+    No guarda datos propios: lee y escribe la tabla de marcos de la
+    memoria, así que los cambios de bits R/M se ven desde todas partes.
+    """
+    
+    __slots__ = ('memoria', 'marco')
+    
+    def __init__(self, memoria: "MemoriaFisica", marco: int):
+        self.memoria = memoria
+        self.marco = marco
+    
+    @property
+    def numero(self) -> int:
+        return self.memoria.paginas[self.marco]
+    
+    @property
+    def proceso_id(self) -> int:
+        return self.memoria.procesos[self.marco]
+    
+    @property
+    def referenciada(self) -> bool:
+        return bool(self.memoria.bits[self.marco] & BIT_REFERENCIADO)
+    
+    @referenciada.setter
+    def referenciada(self, valor: bool):
+        self.memoria.escribir_bit(self.marco, BIT_REFERENCIADO, valor)
+    
+    @property
+    def modificada(self) -> bool:
+        return bool(self.memoria.bits[self.marco] & BIT_MODIFICADO)
+    
+    @modificada.setter
+    def modificada(self, valor: bool):
+        self.memoria.escribir_bit(self.marco, BIT_MODIFICADO, valor)
+    
+    def __str__(self):
+        return f"P{self.proceso_id}-Pág{self.numero}"
+
 class Marco:
-    """Representa un marco de página en memoria física"""
+    """
+    Representa un marco de página en memoria física
+    
+    Es una vista liviana sobre la fila 'numero' de la tabla de marcos de
+    MemoriaFisica; se crea bajo demanda y no guarda estado propio.
+    """
+    
+    __slots__ = ('numero', 'memoria')
     
-    def __init__(self, numero: int):
+    def __init__(self, numero: int, memoria: "MemoriaFisica"):
         self.numero = numero
-        self.pagina: Optional[Pagina] = None
-        self.tiempo_carga = 0
-        self.tiempo_acceso = 0
-        
+        self.memoria = memoria
+    
+    @property
+    def pagina(self) -> Optional[PaginaResidente]:
+        """Página cargada (vista) o None si el marco está libre"""
+        if self.memoria.procesos[self.numero] == SIN_PROCESO:
+            return None
+        return PaginaResidente(self.memoria, self.numero)
+    
+    @property
+    def proceso_id(self) -> Optional[int]:
+        """Dueño de la página cargada (None si el marco está libre)"""
+        proceso_id = self.memoria.procesos[self.numero]
+        return None if proceso_id == SIN_PROCESO else proceso_id
+    
+    @property
+    def num_pagina(self) -> Optional[int]:
+        """Número de la página cargada (None si el marco está libre)"""
+        if self.memoria.procesos[self.numero] == SIN_PROCESO:
+            return None
+        return self.memoria.paginas[self.numero]
+    
+    @property
+    def tiempo_carga(self) -> int:
+        return self.memoria.tiempos_carga[self.numero]
+    
+    @property
+    def tiempo_acceso(self) -> int:
+        return self.memoria.tiempos_acceso[self.numero]
+    
     def esta_libre(self) -> bool:
         """Verifica si el marco está libre"""
-        return self.pagina is None
+        return self.memoria.procesos[self.numero] == SIN_PROCESO
     
     def cargar_pagina(self, pagina: Pagina, tiempo: int):
         """Carga una página en el marco"""
-        self.pagina = pagina
-        self.tiempo_carga = tiempo
-        self.tiempo_acceso = tiempo
-        
+        self.memoria.cargar(self.numero, pagina.proceso_id, pagina.numero,
+                            tiempo, pagina.modificada, pagina.referenciada)
+    
     def liberar(self):
         """Libera el marco"""
-        self.pagina = None
-        self.tiempo_carga = 0
-        self.tiempo_acceso = 0
-        
-    def acceder(self, tiempo: int):
+        self.memoria.liberar(self.numero)
+    
+    def acceder(self, tiempo: int, escritura: bool = False):
         """Registra un acceso al marco"""
-        self.tiempo_acceso = tiempo
-        if self.pagina:
-            self.pagina.referenciada = True
-            
+        self.memoria.acceder(self.numero, tiempo, escritura)
+    
     def obtener_info(self) -> dict:
         """Retorna información del marco para la vista"""
         return {
             'numero': self.numero,
             'libre': self.esta_libre(),
-            'proceso_id': self.pagina.proceso_id if self.pagina else None,
-            'num_pagina': self.pagina.numero if self.pagina else None,
+            'proceso_id': self.proceso_id,
+            'num_pagina': self.num_pagina,
             'tiempo_carga': self.tiempo_carga,
             'tiempo_acceso': self.tiempo_acceso
         }
     
+    def __eq__(self, otro):
+        return (isinstance(otro, Marco) and otro.numero == self.numero
+                and otro.memoria is self.memoria)
+    
+    def __hash__(self):
+        return hash((id(self.memoria), self.numero))
+    
     def __str__(self):
         if self.esta_libre():
             return f"Marco {self.numero}: LIBRE"
         return f"Marco {self.numero}: {self.pagina}"
 
+class VistaMarcos:
+    """Secuencia de vistas Marco sobre la tabla de marcos (sin guardarlas)"""
+    
+    __slots__ = ('memoria',)
+    
+    def __init__(self, memoria: "MemoriaFisica"):
+        self.memoria = memoria
+    
+    def __len__(self):
+        return self.memoria.num_marcos
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [Marco(i, self.memoria)
+                    for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Número de marco fuera de rango")
+        return Marco(indice, self.memoria)
+    
+    def __iter__(self):
+        memoria = self.memoria
+        for numero in range(memoria.num_marcos):
+            yield Marco(numero, memoria)
+
 class MemoriaFisica:
-    """Gestiona la memoria física (RAM)"""
+    """Gestiona la memoria física (RAM)
+    
+    La tabla de marcos se guarda por columnas en arreglos tipados (dueño,
+    página, tiempo de carga, tiempo de acceso y bits R/M), unos 25 bytes
+    por marco; Marco y PaginaResidente son vistas sobre una fila. Un índice
+    (proceso_id, num_pagina) -> número de marco y un montículo de marcos
+    liberados evitan recorrer todos los marcos en búsquedas y cargas. Los
+    algoritmos de reemplazo pueden suscribirse como observadores para
+    mantener su propio estado de forma incremental, o recorrer las
+    columnas directamente.
+    """
     
     def __init__(self, num_marcos: int):
         self.num_marcos = num_marcos
-        self.marcos = [Marco(i) for i in range(num_marcos)]
+        self.marcos = VistaMarcos(self)
+        self.observadores = []
+        self._inicializar_tabla()
+    
+    def _inicializar_tabla(self):
+        n = self.num_marcos
+        self.procesos = array('i', [SIN_PROCESO]) * n
+        self.paginas = array('i', [-1]) * n
+        self.tiempos_carga = array('q', [0]) * n
+        self.tiempos_acceso = array('q', [0]) * n
+        self.bits = bytearray(n)
+        self.indice_paginas: Dict[Tuple[int, int], int] = {}
+        # Marcos libres: los nunca usados desde 'frontera' en adelante y
+        # un montículo con los liberados (siempre por debajo de la frontera)
+        self._frontera = 0
+        self._libres = []
+        self._en_libres = bytearray(n)
+        self._num_ocupados = 0
+        # Marcos ocupados por cada proceso (cuotas de asignación en O(1))
+        self.residentes: Dict[int, int] = {}
+        self._referenciados = set()
+    
+    # ========== OBSERVADORES ==========
+    
+    def agregar_observador(self, observador):
+        """
+        Registra un observador de cambios en los marcos.
+        
+        El observador debe implementar al_cargar(marco, pagina_anterior),
+        al_acceder(marco), al_liberar(marco, pagina_anterior),
+        al_cambiar_bits(marco) y al_limpiar_referencias().
+        """
+        if observador not in self.observadores:
+            self.observadores.append(observador)
+    
+    def quitar_observador(self, observador):
+        """Elimina un observador previamente registrado"""
+        if observador in self.observadores:
+            self.observadores.remove(observador)
+    
+    # ========== OPERACIONES SOBRE LA TABLA ==========
+    
+    def _copiar_pagina(self, numero: int) -> Pagina:
+        """Copia de la página del marco, para notificar después de cambiarla"""
+        bits = self.bits[numero]
+        return Pagina(self.paginas[numero], self.procesos[numero],
+                      bool(bits & BIT_MODIFICADO),
+                      bool(bits & BIT_REFERENCIADO))
+    
+    def cargar(self, numero: int, proceso_id: int, num_pagina: int,
+               tiempo: int, modificada: bool = False,
+               referenciada: bool = False):
+        """Carga una página en el marco 'numero' (reemplazando la anterior)"""
+        anterior = None
+        residentes = self.residentes
+        if self.procesos[numero] == SIN_PROCESO:
+            self._num_ocupados += 1
+        else:
+            anterior = self._copiar_pagina(numero)
+            clave = (anterior.proceso_id, anterior.numero)
+            if self.indice_paginas.get(clave) == numero:
+                del self.indice_paginas[clave]
+            residentes[anterior.proceso_id] -= 1
+        residentes[proceso_id] = residentes.get(proceso_id, 0) + 1
+        
+        self.procesos[numero] = proceso_id
+        self.paginas[numero] = num_pagina
+        self.tiempos_carga[numero] = tiempo
+        self.tiempos_acceso[numero] = tiempo
+        self.bits[numero] = ((BIT_MODIFICADO if modificada else 0)
+                             | (BIT_REFERENCIADO if referenciada else 0))
+        if referenciada:
+            # La interrupción de reloj solo limpia los marcos anotados
+            self._referenciados.add(numero)
+        self.indice_paginas[(proceso_id, num_pagina)] = numero
         
+        if self.observadores:
+            marco = Marco(numero, self)
+            for observador in self.observadores:
+                observador.al_cargar(marco, anterior)
+    
+    def acceder(self, numero: int, tiempo: int, escritura: bool = False):
+        """Registra un acceso al marco 'numero' (una escritura enciende M)"""
+        self.tiempos_acceso[numero] = tiempo
+        if self.procesos[numero] != SIN_PROCESO:
+            if escritura:
+                self.bits[numero] |= BIT_REFERENCIADO | BIT_MODIFICADO
+            else:
+                self.bits[numero] |= BIT_REFERENCIADO
+        self._referenciados.add(numero)
+        if self.observadores:
+            marco = Marco(numero, self)
+            for observador in self.observadores:
+                observador.al_acceder(marco)
+    
+    def liberar(self, numero: int):
+        """Libera el marco 'numero'"""
+        self.tiempos_carga[numero] = 0
+        self.tiempos_acceso[numero] = 0
+        if self.procesos[numero] == SIN_PROCESO:
+            return
+        
+        anterior = self._copiar_pagina(numero)
+        clave = (anterior.proceso_id, anterior.numero)
+        if self.indice_paginas.get(clave) == numero:
+            del self.indice_paginas[clave]
+        self.procesos[numero] = SIN_PROCESO
+        self.paginas[numero] = -1
+        self.bits[numero] = 0
+        self._num_ocupados -= 1
+        self.residentes[anterior.proceso_id] -= 1
+        if numero < self._frontera and not self._en_libres[numero]:
+            self._en_libres[numero] = 1
+            heapq.heappush(self._libres, numero)
+        
+        if self.observadores:
+            marco = Marco(numero, self)
+            for observador in self.observadores:
+                observador.al_liberar(marco, anterior)
+    
+    def escribir_bit(self, numero: int, bit: int, valor: bool):
+        """Enciende o apaga un bit (R o M) del marco"""
+        anteriores = self.bits[numero]
+        if valor:
+            self.bits[numero] |= bit
+            if bit == BIT_REFERENCIADO:
+                self._referenciados.add(numero)
+        else:
+            self.bits[numero] &= ~bit
+        if self.observadores and self.bits[numero] != anteriores:
+            marco = Marco(numero, self)
+            for observador in self.observadores:
+                observador.al_cambiar_bits(marco)
+    
+    # ========== BITS DE REFERENCIA ==========
+    
+    def limpiar_bits_referencia(self):
+        """
+        Limpia el bit R de todas las páginas residentes (interrupción de reloj)
+        
+        Solo recorre los marcos accedidos desde la última limpieza.
+        """
+        bits = self.bits
+        for numero in self._referenciados:
+            bits[numero] &= ~BIT_REFERENCIADO
+        self._referenciados.clear()
+        for observador in self.observadores:
+            observador.al_limpiar_referencias()
+    
+    # ========== CONSULTAS ==========
+    
     def obtener_marco_libre(self) -> Optional[Marco]:
-        """Busca y retorna un marco libre"""
-        for marco in self.marcos:
-            if marco.esta_libre():
-                return marco
-        return None
+        """Busca y retorna un marco libre (el de menor número)"""
+        numero = self.buscar_marco_libre()
+        return None if numero < 0 else Marco(numero, self)
+    
+    def buscar_marco_libre(self) -> int:
+        """Número del marco libre de menor número (-1 si no hay)"""
+        libres = self._libres
+        procesos = self.procesos
+        while libres:
+            numero = libres[0]
+            if procesos[numero] == SIN_PROCESO:
+                return numero
+            # Entrada obsoleta: el marco se ocupó después de liberarse
+            self._en_libres[heapq.heappop(libres)] = 0
+        
+        frontera = self._frontera
+        while frontera < self.num_marcos and procesos[frontera] != SIN_PROCESO:
+            frontera += 1
+        self._frontera = frontera
+        return frontera if frontera < self.num_marcos else -1
     
     def tiene_marcos_libres(self) -> bool:
         """Verifica si hay marcos libres"""
-        return any(marco.esta_libre() for marco in self.marcos)
+        return self._num_ocupados < self.num_marcos
     
     def buscar_pagina(self, proceso_id: int, num_pagina: int) -> Optional[Marco]:
         """Busca una página específica en memoria"""
-        for marco in self.marcos:
-            if not marco.esta_libre():
-                pagina = marco.pagina
-                if pagina.proceso_id == proceso_id and pagina.numero == num_pagina:
-                    return marco
-        return None
+        numero = self.indice_paginas.get((proceso_id, num_pagina))
+        return None if numero is None else Marco(numero, self)
+    
+    def buscar_marco(self, proceso_id: int, num_pagina: int) -> int:
+        """Número del marco que contiene la página (-1 si no está cargada)"""
+        return self.indice_paginas.get((proceso_id, num_pagina), -1)
+    
+    def contar_marcos_ocupados(self) -> int:
+        """Retorna la cantidad de marcos ocupados"""
+        return self._num_ocupados
+    
+    def contar_marcos_del_proceso(self, proceso_id: int) -> int:
+        """Cantidad de marcos ocupados por el proceso"""
+        return self.residentes.get(proceso_id, 0)
     
     def obtener_marcos_ocupados(self) -> list:
         """Retorna lista de marcos ocupados"""
-        return [m for m in self.marcos if not m.esta_libre()]
+        procesos = self.procesos
+        return [Marco(i, self) for i in range(self.num_marcos)
+                if procesos[i] != SIN_PROCESO]
     
     def obtener_marcos_del_proceso(self, proceso_id: int) -> list:
         """Retorna marcos ocupados por un proceso específico"""
-        return [m for m in self.marcos 
-                if not m.esta_libre() and m.pagina.proceso_id == proceso_id]
+        procesos = self.procesos
+        return [Marco(i, self) for i in range(self.num_marcos)
+                if procesos[i] == proceso_id]
     
     def obtener_estado_completo(self) -> list:
         """Retorna el estado completo para la vista"""
@@ -106,8 +400,12 @@ class MemoriaFisica:
     
     def resetear(self):
         """Limpia toda la memoria"""
-        for marco in self.marcos:
-            marco.liberar()
+        if self.observadores:
+            procesos = self.procesos
+            for numero in range(self.num_marcos):
+                if procesos[numero] != SIN_PROCESO:
+                    self.liberar(numero)
+        self._inicializar_tabla()
     
     def __str__(self):
         return "\n".join(str(marco) for marco in self.marcos)
@@ -0,0 +1,282 @@
+"""
+MODELO: Planificación de procesos
+Decide qué proceso ejecuta cada referencia cuando hay varios
+"""
+
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from heapq import heapify, heappush, heappop
+from typing import Dict, Optional
+
+class PlanificadorBase(ABC):
+    """
+    Clase base de los planificadores
+    
+    El simulador llama a siguiente() antes de cada referencia y a
+    despachar() con el proceso que la ejecuta, que cuenta los cambios de
+    contexto. Los procesos terminados salen de la cola de listos al
+    volver a ser elegidos.
+    """
+    
+    # Referencias por turno; 0 = sin límite (el turno termina al fallar
+    # o al acabar la secuencia)
+    quantum = 0
+    
+    def __init__(self):
+        self.nombre = "Base"
+        self.resetear_estadisticas()
+    
+    def resetear_estadisticas(self):
+        self.cambios_contexto = 0
+        self.despachos: Dict[int, int] = {}
+        self.ultimo_proceso = None
+    
+    @abstractmethod
+    def agregar(self, proceso):
+        """Agrega un proceso a la cola de listos"""
+        pass
+    
+    @abstractmethod
+    def quitar(self, proceso):
+        """Saca un proceso de la cola de listos (p. ej. al suspenderlo)"""
+        pass
+    
+    @abstractmethod
+    def siguiente(self):
+        """Proceso que ejecuta la próxima referencia (None si no hay)"""
+        pass
+    
+    def registrar_resultado(self, codigo: int):
+        """Resultado de la referencia despachada (ver CODIGO_*)"""
+        pass
+    
+    def despachar(self, proceso):
+        """Cuenta un cambio de contexto si cambia el proceso en CPU"""
+        if proceso is not self.ultimo_proceso:
+            if self.ultimo_proceso is not None:
+                self.cambios_contexto += 1
+            self.despachos[proceso.id] = self.despachos.get(proceso.id, 0) + 1
+            self.ultimo_proceso = proceso
+    
+    def _vaciar(self):
+        """Descarta la cola de listos"""
+        pass
+    
+    def resetear(self, procesos=()):
+        """Vuelve a encolar los procesos en orden, sin estadísticas"""
+        self._vaciar()
+        self.resetear_estadisticas()
+        for proceso in procesos:
+            self.agregar(proceso)
+    
+    def obtener_estadisticas(self) -> dict:
+        return {
+            'nombre': self.nombre,
+            'cambios_contexto': self.cambios_contexto,
+            'despachos': dict(self.despachos)
+        }
+
+class PlanificadorSecuencial(PlanificadorBase):
+    """
+    Orden de llegada sin expropiación: cada proceso ejecuta toda su
+    secuencia antes del siguiente
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.nombre = "secuencial"
+        self.listos = deque()
+    
+    def agregar(self, proceso):
+        self.listos.append(proceso)
+    
+    def quitar(self, proceso):
+        if proceso in self.listos:
+            self.listos.remove(proceso)
+    
+    def siguiente(self):
+        listos = self.listos
+        while listos:
+            proceso = listos[0]
+            if proceso.tiene_mas_accesos():
+                return proceso
+            listos.popleft()
+        return None
+    
+    def _vaciar(self):
+        self.listos.clear()
+
+class PlanificadorRoundRobin(PlanificadorSecuencial):
+    """
+    Turno rotativo: cada proceso ejecuta hasta 'quantum' referencias y
+    pasa al final de la cola de listos
+    
+    Con ceder_en_fallo, un fallo de página también termina el turno
+    (el proceso se bloquearía esperando la E/S).
+    """
+    
+    def __init__(self, quantum: int = 10, ceder_en_fallo: bool = False):
+        if quantum < 1:
+            raise ValueError("El quantum debe ser al menos 1")
+        super().__init__()
+        self.nombre = "rr"
+        self.quantum = quantum
+        self.ceder_en_fallo = ceder_en_fallo
+        self.restante = quantum
+    
+    def siguiente(self):
+        listos = self.listos
+        if self.restante <= 0 and listos:
+            listos.append(listos.popleft())
+            self.restante = self.quantum
+        while listos:
+            proceso = listos[0]
+            if proceso.tiene_mas_accesos():
+                self.restante -= 1
+                return proceso
+            listos.popleft()
+            self.restante = self.quantum
+        return None
+    
+    def quitar(self, proceso):
+        # El turno del proceso en ejecución termina con él
+        if self.listos and self.listos[0] is proceso:
+            self.restante = self.quantum
+        super().quitar(proceso)
+    
+    def registrar_resultado(self, codigo: int):
+        # 0 = HIT; cualquier otro código es un fallo
+        if codigo and self.ceder_en_fallo:
+            self.restante = 0
+    
+    def _vaciar(self):
+        super()._vaciar()
+        self.restante = self.quantum
+    
+    def obtener_estadisticas(self) -> dict:
+        estadisticas = super().obtener_estadisticas()
+        estadisticas['quantum'] = self.quantum
+        estadisticas['ceder_en_fallo'] = self.ceder_en_fallo
+        return estadisticas
+
+class PlanificadorAleatorio(PlanificadorBase):
+    """
+    Intercalado aleatorio: cada referencia la ejecuta un proceso listo
+    elegido al azar (reproducible con 'semilla')
+    """
+    
+    def __init__(self, semilla: Optional[int] = None):
+        super().__init__()
+        self.nombre = "aleatorio"
+        self.semilla = semilla
+        self._azar = random.Random(semilla)
+        self.listos = []
+    
+    def agregar(self, proceso):
+        self.listos.append(proceso)
+    
+    def quitar(self, proceso):
+        if proceso in self.listos:
+            self.listos.remove(proceso)
+    
+    def siguiente(self):
+        listos = self.listos
+        while listos:
+            indice = self._azar.randrange(len(listos))
+            proceso = listos[indice]
+            if proceso.tiene_mas_accesos():
+                return proceso
+            # Quitar en O(1): el último ocupa el lugar del terminado
+            listos[indice] = listos[-1]
+            listos.pop()
+        return None
+    
+    def _vaciar(self):
+        self.listos.clear()
+        self._azar = random.Random(self.semilla)
+    
+    def obtener_estadisticas(self) -> dict:
+        estadisticas = super().obtener_estadisticas()
+        estadisticas['semilla'] = self.semilla
+        return estadisticas
+
+class PlanificadorMarcas(PlanificadorBase):
+    """
+    Orden por marcas de tiempo de la traza: ejecuta siempre la referencia
+    pendiente con la marca más antigua entre todos los procesos
+    
+    Usa proceso.marcas_tiempo (una marca por referencia, no decreciente
+    dentro de cada proceso); sin marcas, la posición en la secuencia hace
+    de marca. Los empates se resuelven por orden de llegada. La cola es
+    un montículo: O(log procesos) por referencia.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.nombre = "marcas"
+        self.listos = []
+        self.orden = 0
+        self._actual = None
+    
+    @staticmethod
+    def _marca(proceso):
+        indice = proceso.indice_acceso_actual
+        marcas = getattr(proceso, "marcas_tiempo", None)
+        if marcas is not None and indice < len(marcas):
+            return marcas[indice]
+        return indice
+    
+    def agregar(self, proceso):
+        heappush(self.listos, (self._marca(proceso), self.orden, proceso))
+        self.orden += 1
+    
+    def quitar(self, proceso):
+        if self._actual is proceso:
+            self._actual = None
+            return
+        self.listos = [entrada for entrada in self.listos
+                       if entrada[2] is not proceso]
+        heapify(self.listos)
+    
+    def siguiente(self):
+        # El proceso de la referencia anterior vuelve con su nueva marca
+        if self._actual is not None:
+            self.agregar(self._actual)
+            self._actual = None
+        listos = self.listos
+        while listos:
+            _, _, proceso = heappop(listos)
+            if proceso.tiene_mas_accesos():
+                self._actual = proceso
+                return proceso
+        return None
+    
+    def _vaciar(self):
+        self.listos = []
+        self.orden = 0
+        self._actual = None
+
+
+# Registro de planificadores disponibles (nombre -> clase)
+PLANIFICADORES = {
+    "secuencial": PlanificadorSecuencial,
+    "rr": PlanificadorRoundRobin,
+    "aleatorio": PlanificadorAleatorio,
+    "marcas": PlanificadorMarcas
+}
+
+def crear_planificador(nombre: str, **opciones) -> PlanificadorBase:
+    """
+    Crea un planificador a partir de su nombre
+    
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún planificador
+    """
+    clase = PLANIFICADORES.get(nombre.lower())
+    if clase is None:
+        raise ValueError(
+            f"Planificador desconocido: {nombre} "
+            f"(disponibles: {', '.join(PLANIFICADORES)})"
+        )
+    return clase(**opciones)
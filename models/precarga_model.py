@@ -0,0 +1,253 @@
+"""
+MODELO: Precarga de páginas (readahead)
+Predice qué páginas cargar junto con la que produjo el fallo
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Set, Tuple
+
+class PrecargaBase(ABC):
+    """
+    Clase base de los precargadores
+    
+    El simulador consulta al precargador en cada fallo (al_fallar) y en el
+    primer acceso a una página precargada (al_usar), y carga las páginas
+    que retorna en marcos libres o de víctimas. El precargador observa la
+    memoria para saber qué páginas precargadas se desalojaron sin usarse.
+    
+    precisión = útiles / precargadas
+    cobertura = útiles / (útiles + fallos): fracción de los fallos que
+    habrían ocurrido y la precarga evitó
+    """
+    
+    def __init__(self):
+        self.nombre = "Base"
+        self.memoria = None
+        self.pendientes: Set[Tuple[int, int]] = set()
+        self.resetear_estadisticas()
+    
+    def resetear_estadisticas(self):
+        self.fallos = 0
+        self.precargadas = 0
+        self.utiles = 0
+        self.desperdiciadas = 0
+        self.write_backs = 0
+    
+    @abstractmethod
+    def _predecir_fallo(self, proceso_id: int, num_pagina: int) -> list:
+        """Páginas a precargar tras un fallo"""
+        pass
+    
+    @abstractmethod
+    def _predecir_uso(self, proceso_id: int, num_pagina: int) -> list:
+        """Páginas a precargar al usar por primera vez una precargada"""
+        pass
+    
+    def _olvidar(self):
+        """Descarta el estado propio del precargador"""
+        pass
+    
+    # ========== CONSULTAS DEL SIMULADOR ==========
+    
+    def al_fallar(self, proceso_id: int, num_pagina: int) -> list:
+        self.fallos += 1
+        return self._predecir_fallo(proceso_id, num_pagina)
+    
+    def al_usar(self, proceso_id: int, num_pagina: int) -> list:
+        """Acceso a una página residente; solo predice si estaba precargada"""
+        clave = (proceso_id, num_pagina)
+        if clave not in self.pendientes:
+            return []
+        self.pendientes.remove(clave)
+        self.utiles += 1
+        return self._predecir_uso(proceso_id, num_pagina)
+    
+    def registrar_carga(self, proceso_id: int, num_pagina: int):
+        """El simulador cargó una página predicha"""
+        self.pendientes.add((proceso_id, num_pagina))
+        self.precargadas += 1
+    
+    # ========== SEGUIMIENTO DE LA MEMORIA ==========
+    
+    def vincular(self, memoria):
+        """Se suscribe a la memoria para detectar precargas desalojadas"""
+        if self.memoria is memoria:
+            return
+        self.desvincular()
+        self.memoria = memoria
+        memoria.agregar_observador(self)
+        self.pendientes.clear()
+    
+    def desvincular(self):
+        if self.memoria is not None:
+            self.memoria.quitar_observador(self)
+            self.memoria = None
+    
+    def _desalojada(self, pagina_anterior):
+        clave = (pagina_anterior.proceso_id, pagina_anterior.numero)
+        if clave in self.pendientes:
+            self.pendientes.remove(clave)
+            self.desperdiciadas += 1
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        if pagina_anterior is not None and self.pendientes:
+            self._desalojada(pagina_anterior)
+    
+    def al_acceder(self, marco):
+        pass
+    
+    def al_liberar(self, marco, pagina_anterior):
+        if self.pendientes:
+            self._desalojada(pagina_anterior)
+    
+    def al_cambiar_bits(self, marco):
+        pass
+    
+    def al_limpiar_referencias(self):
+        pass
+    
+    # ========== ESTADÍSTICAS ==========
+    
+    def obtener_estadisticas(self) -> dict:
+        evitables = self.utiles + self.fallos
+        return {
+            'nombre': self.nombre,
+            'precargadas': self.precargadas,
+            'utiles': self.utiles,
+            'desperdiciadas': self.desperdiciadas,
+            'precision': (self.utiles / self.precargadas * 100
+                          if self.precargadas else 0.0),
+            'cobertura': (self.utiles / evitables * 100) if evitables else 0.0,
+            'write_backs': self.write_backs
+        }
+    
+    def resetear(self):
+        self.pendientes.clear()
+        self._olvidar()
+        self.resetear_estadisticas()
+
+class PrecargaSecuencial(PrecargaBase):
+    """
+    Lectura anticipada secuencial con ventana fija
+    
+    Un fallo en la página p precarga p+1 .. p+ventana. Cuando el proceso
+    llega a la mitad de lo precargado se lee la ventana siguiente, de modo
+    que un recorrido secuencial no vuelve a fallar.
+    """
+    
+    def __init__(self, ventana: int = 4):
+        super().__init__()
+        self.nombre = "secuencial"
+        self.ventana_inicial = max(1, ventana)
+        # proceso_id -> [ventana actual, primera página aún no precargada]
+        self.estado: Dict[int, list] = {}
+    
+    def _crecer(self, ventana: int) -> int:
+        """Ventana siguiente tras un acceso secuencial (fija en esta clase)"""
+        return ventana
+    
+    def _predecir_fallo(self, proceso_id: int, num_pagina: int) -> list:
+        estado = self.estado.get(proceso_id)
+        if estado is not None and num_pagina == estado[1]:
+            # El recorrido alcanzó el final de la precarga: sigue secuencial
+            ventana = self._crecer(estado[0])
+        else:
+            ventana = self.ventana_inicial
+        fin = num_pagina + ventana + 1
+        self.estado[proceso_id] = [ventana, fin]
+        return list(range(num_pagina + 1, fin))
+    
+    def _predecir_uso(self, proceso_id: int, num_pagina: int) -> list:
+        estado = self.estado.get(proceso_id)
+        if estado is None:
+            return []
+        ventana, fin = estado
+        if not 0 < fin - num_pagina <= (ventana + 1) // 2:
+            return []
+        ventana = self._crecer(ventana)
+        nuevo_fin = num_pagina + ventana + 1
+        estado[0] = ventana
+        estado[1] = max(fin, nuevo_fin)
+        return list(range(fin, nuevo_fin))
+    
+    def _olvidar(self):
+        self.estado = {}
+
+class PrecargaAdaptativa(PrecargaSecuencial):
+    """
+    Lectura anticipada que duplica la ventana mientras el acceso sea
+    secuencial (hasta 'maxima') y vuelve a la inicial al perder el patrón
+    """
+    
+    def __init__(self, ventana: int = 2, maxima: int = 32):
+        super().__init__(ventana)
+        self.nombre = "adaptativa"
+        self.maxima = max(self.ventana_inicial, maxima)
+    
+    def _crecer(self, ventana: int) -> int:
+        return min(ventana * 2, self.maxima)
+
+class PrecargaZancada(PrecargaBase):
+    """
+    Detección de zancadas (stride)
+    
+    Cuando dos fallos consecutivos de un proceso están separados por la
+    misma distancia d, se precargan las 'grado' páginas siguientes del
+    patrón (p+d, p+2d, ...). Cada uso de una página precargada del patrón
+    extiende la precarga un paso más.
+    """
+    
+    def __init__(self, grado: int = 4):
+        super().__init__()
+        self.nombre = "zancada"
+        self.grado = max(1, grado)
+        # proceso_id -> [última página, zancada, zancada confirmada]
+        self.estado: Dict[int, list] = {}
+    
+    def _predecir_fallo(self, proceso_id: int, num_pagina: int) -> list:
+        estado = self.estado.get(proceso_id)
+        if estado is None:
+            self.estado[proceso_id] = [num_pagina, 0, False]
+            return []
+        zancada = num_pagina - estado[0]
+        confirmada = zancada != 0 and zancada == estado[1]
+        self.estado[proceso_id] = [num_pagina, zancada, confirmada]
+        if not confirmada:
+            return []
+        return [num_pagina + zancada * k for k in range(1, self.grado + 1)]
+    
+    def _predecir_uso(self, proceso_id: int, num_pagina: int) -> list:
+        estado = self.estado.get(proceso_id)
+        if estado is None or not estado[2]:
+            return []
+        ultima, zancada, _ = estado
+        if (num_pagina - ultima) % zancada:
+            return []
+        estado[0] = num_pagina
+        return [num_pagina + zancada * self.grado]
+    
+    def _olvidar(self):
+        self.estado = {}
+
+
+# Registro de precargadores disponibles (nombre -> clase)
+PRECARGAS = {
+    "secuencial": PrecargaSecuencial,
+    "adaptativa": PrecargaAdaptativa,
+    "zancada": PrecargaZancada
+}
+
+def crear_precarga(nombre: str, **opciones) -> PrecargaBase:
+    """
+    Crea un precargador a partir de su nombre
+    
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún precargador
+    """
+    clase = PRECARGAS.get(nombre.lower())
+    if clase is None:
+        raise ValueError(
+            f"Precarga desconocida: {nombre} "
+            f"(disponibles: {', '.join(PRECARGAS)})"
+        )
+    return clase(**opciones)
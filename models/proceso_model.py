@@ -3,104 +3,213 @@ MODELO: Gestión de procesos y tablas de páginas
 Lógica de negocio para procesos
 """
 
-from typing import Optional, Dict
-from dataclasses import dataclass
+from itertools import islice
+from typing import Optional
+from .tabla_paginas_model import TablaPaginas, EntradaTablaPaginas
 
-@dataclass
-class EntradaTablaPaginas:
-    """Entrada en la tabla de páginas"""
-    numero_pagina: int
-    marco_fisico: Optional[int] = None
-    presente: bool = False
-    modificada: bool = False
-    referenciada: bool = False
-    
-    def obtener_info(self) -> dict:
-        """Retorna información para la vista"""
-        return {
-            'numero_pagina': self.numero_pagina,
-            'marco_fisico': self.marco_fisico if self.presente else None,
-            'presente': self.presente,
-            'modificada': self.modificada,
-            'referenciada': self.referenciada
-        }
+# Una referencia es el número de página con el bit alto encendido si el
+# acceso es una escritura; así cabe en un uint32 y las trazas (listas,
+# arreglos o archivos mapeados) no necesitan una columna aparte
+BIT_ESCRITURA = 1 << 31
+MASCARA_PAGINA = BIT_ESCRITURA - 1
 
-class TablaPaginas:
-    """Tabla de páginas de un proceso"""
+class FlujoReferencias:
+    """
+    Fuente de referencias consumida en flujo, sin materializar la traza
     
-    def __init__(self, num_paginas: int):
-        self.num_paginas = num_paginas
-        self.entradas: Dict[int, EntradaTablaPaginas] = {
-            i: EntradaTablaPaginas(i) for i in range(num_paginas)
-        }
+    Lee la fuente por bloques y mantiene una ventana de anticipación de
+    entre ventana/2 y ventana referencias ya leídas pero no consumidas.
+    Si la fuente es una función que crea un iterador nuevo en cada llamada
+    (p. ej. lambda: iterar_traza(ruta)), el flujo se puede rebobinar.
+    """
+    
+    def __init__(self, fuente, ventana: int = 4096):
+        self.fuente = fuente
+        self.ventana = max(2, ventana)
+        self.rebobinable = callable(fuente)
+        self.aperturas = 0
+        self._abrir()
+    
+    def _abrir(self):
+        """Inicia (o reinicia) la lectura de la fuente"""
+        origen = self.fuente() if self.rebobinable else self.fuente
+        self._iterador = iter(origen)
+        self.aperturas += 1
+        self._datos = []
+        self._cabeza = 0
+        self.base = 0
+        self.agotado = False
+    
+    def _rellenar(self):
+        """Lee un bloque si la anticipación cayó por debajo de la mitad"""
+        disponibles = len(self._datos) - self._cabeza
+        if self.agotado or disponibles >= self.ventana // 2:
+            return
+        faltan = self.ventana - disponibles
+        bloque = list(islice(self._iterador, faltan))
+        if len(bloque) < faltan:
+            self.agotado = True
+        if self._cabeza:
+            del self._datos[:self._cabeza]
+            self.base += self._cabeza
+            self._cabeza = 0
+        self._datos.extend(bloque)
+    
+    def siguiente(self) -> Optional[int]:
+        """Consume y retorna la siguiente referencia (None al terminar)"""
+        self._rellenar()
+        if self._cabeza >= len(self._datos):
+            return None
+        valor = self._datos[self._cabeza]
+        self._cabeza += 1
+        return valor
+    
+    def hay_mas(self) -> bool:
+        """Verifica si quedan referencias por consumir"""
+        self._rellenar()
+        return self._cabeza < len(self._datos)
+    
+    @property
+    def consumidas(self) -> int:
+        """Cantidad de referencias consumidas desde la última apertura"""
+        return self.base + self._cabeza
     
-    def actualizar_entrada(self, num_pagina: int, marco: Optional[int], 
-                          presente: bool, modificada: bool = False):
-        """Actualiza una entrada de la tabla"""
-        if num_pagina in self.entradas:
-            entrada = self.entradas[num_pagina]
-            entrada.marco_fisico = marco
-            entrada.presente = presente
-            entrada.modificada = modificada
-    
-    def marcar_referenciada(self, num_pagina: int):
-        """Marca una página como referenciada"""
-        if num_pagina in self.entradas:
-            self.entradas[num_pagina].referenciada = True
-    
-    def limpiar_bits_referencia(self):
-        """Limpia todos los bits de referencia"""
-        for entrada in self.entradas.values():
-            entrada.referenciada = False
-    
-    def obtener_entrada(self, num_pagina: int) -> Optional[EntradaTablaPaginas]:
-        """Obtiene una entrada específica"""
-        return self.entradas.get(num_pagina)
-    
-    def obtener_todas_entradas(self) -> list:
-        """Retorna todas las entradas para la vista"""
-        return [entrada.obtener_info() for entrada in self.entradas.values()]
+    def fin_leido(self) -> int:
+        """Posición absoluta siguiente a la última referencia leída"""
+        return self.base + len(self._datos)
+    
+    def obtener(self, posicion: int) -> int:
+        """Referencia en una posición absoluta aún no consumida"""
+        return self._datos[posicion - self.base]
+    
+    def __iter__(self):
+        """Consume las referencias restantes"""
+        while True:
+            valor = self.siguiente()
+            if valor is None:
+                return
+            yield valor
+    
+    def rebobinar(self):
+        """Vuelve al inicio de la fuente"""
+        if not self.rebobinable:
+            raise ValueError("La fuente de referencias no se puede rebobinar")
+        self._abrir()
 
 class Proceso:
     """Representa un proceso del sistema"""
     
-    def __init__(self, proceso_id: int, num_paginas_virtuales: int, color: str = "#3498db"):
+    def __init__(self, proceso_id: int, num_paginas_virtuales: int, color: str = "#3498db",
+                 tabla_paginas=None, prioridad: int = 1):
+        """
+        Args:
+            proceso_id: Identificador del proceso
+            num_paginas_virtuales: Tamaño del espacio virtual en páginas
+            color: Color del proceso en la vista
+            tabla_paginas: Tabla de páginas a usar (ver TABLAS_PAGINAS);
+                por defecto, una TablaPaginas lineal
+            prioridad: Peso del proceso en AsignacionPrioridad (mayor =
+                más marcos)
+        """
         self.id = proceso_id
         self.num_paginas_virtuales = num_paginas_virtuales
         self.color = color
-        self.tabla_paginas = TablaPaginas(num_paginas_virtuales)
+        self.prioridad = prioridad
+        if tabla_paginas is None:
+            tabla_paginas = TablaPaginas(num_paginas_virtuales)
+        self.tabla_paginas = tabla_paginas
         self.secuencia_accesos = []
+        self.flujo: Optional[FlujoReferencias] = None
         self.indice_acceso_actual = 0
+        self.ultimo_acceso_escritura = False
+        # Marca de tiempo de cada referencia (ver PlanificadorMarcas)
+        self.marcas_tiempo = None
+        # Conjunto de trabajo (ver ConjuntoTrabajo) y control de carga
+        self.conjunto_trabajo = None
+        self.suspendido = False
         
         # Estadísticas
         self.total_accesos = 0
         self.page_faults = 0
         self.page_hits = 0
+        self.escrituras = 0
+        self.write_backs = 0
+        
+    def generar_secuencia_aleatoria(self, longitud: int,
+                                    modelo: str = "uniforme",
+                                    semilla: Optional[int] = None,
+                                    **parametros) -> int:
+        """
+        Genera una secuencia sintética de accesos (ver GeneradorCarga)
         
-    def generar_secuencia_aleatoria(self, longitud: int):
-        """Genera secuencia aleatoria de accesos"""
-        import random
-        self.secuencia_accesos = [
-            random.randint(0, self.num_paginas_virtuales - 1) 
-            for _ in range(longitud)
-        ]
+        Returns:
+            La semilla usada, para poder reproducir la secuencia
+        """
+        from .generador_model import GeneradorCarga
+        generador = GeneradorCarga(self.num_paginas_virtuales, modelo,
+                                   semilla, **parametros)
+        self.secuencia_accesos = generador.generar(longitud).tolist()
+        self.flujo = None
+        self.marcas_tiempo = None
         self.indice_acceso_actual = 0
+        return generador.semilla
         
-    def establecer_secuencia(self, secuencia: list):
-        """Establece una secuencia específica de accesos"""
-        self.secuencia_accesos = secuencia
+    def establecer_secuencia(self, secuencia, marcas_tiempo=None):
+        """
+        Establece una secuencia específica de accesos
+        
+        Acepta una lista o cualquier secuencia indexable (array, memoryview
+        sobre un archivo mapeado); un arreglo NumPy int32 se lee como
+        uint32. Un iterador, generador o FlujoReferencias se consume en
+        flujo, sin guardar la traza completa en memoria.
+        marcas_tiempo, indexable y paralela a la secuencia, ordena las
+        referencias entre procesos con PlanificadorMarcas.
+        """
+        self.marcas_tiempo = marcas_tiempo
+        if isinstance(secuencia, FlujoReferencias):
+            self.flujo = secuencia
+            self.secuencia_accesos = []
+        elif hasattr(secuencia, "__getitem__") and hasattr(secuencia, "__len__"):
+            self.flujo = None
+            dtype = getattr(secuencia, "dtype", None)
+            if dtype is not None and dtype.kind == "i" and dtype.itemsize == 4:
+                # En int32 BIT_ESCRITURA es el signo: se reinterpreta como
+                # uint32 (sin copiar) para poder probarlo y quitarlo
+                secuencia = secuencia.view("u4")
+            self.secuencia_accesos = secuencia
+        else:
+            self.flujo = FlujoReferencias(secuencia)
+            self.secuencia_accesos = []
         self.indice_acceso_actual = 0
         
     def obtener_siguiente_acceso(self) -> Optional[int]:
-        """Obtiene el siguiente acceso de la secuencia"""
-        if self.indice_acceso_actual < len(self.secuencia_accesos):
+        """
+        Obtiene el número de página del siguiente acceso de la secuencia
+        
+        Si la referencia es una escritura, se quita BIT_ESCRITURA y queda
+        ultimo_acceso_escritura en True.
+        """
+        if self.flujo is not None:
+            acceso = self.flujo.siguiente()
+            if acceso is None:
+                return None
+            self.indice_acceso_actual += 1
+        elif self.indice_acceso_actual < len(self.secuencia_accesos):
             acceso = self.secuencia_accesos[self.indice_acceso_actual]
             self.indice_acceso_actual += 1
-            return acceso
-        return None
+        else:
+            return None
+        if acceso & BIT_ESCRITURA:
+            self.ultimo_acceso_escritura = True
+            self.escrituras += 1
+            return acceso & MASCARA_PAGINA
+        self.ultimo_acceso_escritura = False
+        return acceso
     
     def tiene_mas_accesos(self) -> bool:
         """Verifica si quedan más accesos en la secuencia"""
+        if self.flujo is not None:
+            return self.flujo.hay_mas()
         return self.indice_acceso_actual < len(self.secuencia_accesos)
     
     def registrar_hit(self):
@@ -126,7 +235,9 @@ class Proceso:
             'total_accesos': self.total_accesos,
             'page_faults': self.page_faults,
             'page_hits': self.page_hits,
-            'tasa_fallos': self.obtener_tasa_fallos()
+            'tasa_fallos': self.obtener_tasa_fallos(),
+            'escrituras': self.escrituras,
+            'write_backs': self.write_backs
         }
     
     def resetear_estadisticas(self):
@@ -134,7 +245,17 @@ class Proceso:
         self.total_accesos = 0
         self.page_faults = 0
         self.page_hits = 0
-        self.indice_acceso_actual = 0
+        self.escrituras = 0
+        self.write_backs = 0
+        self.ultimo_acceso_escritura = False
+        self.suspendido = False
+        if self.conjunto_trabajo is not None:
+            self.conjunto_trabajo.resetear()
+        # Un flujo no rebobinable continúa desde donde quedó
+        if self.flujo is None or self.flujo.rebobinable:
+            self.indice_acceso_actual = 0
+            if self.flujo is not None:
+                self.flujo.rebobinar()
         
     def obtener_info_completa(self) -> dict:
         """Retorna información completa para la vista"""
@@ -142,6 +263,7 @@ class Proceso:
             'id': self.id,
             'color': self.color,
             'num_paginas': self.num_paginas_virtuales,
+            'prioridad': self.prioridad,
             'secuencia': self.secuencia_accesos,
             'indice_actual': self.indice_acceso_actual,
             'estadisticas': self.obtener_estadisticas()
@@ -3,21 +3,71 @@ MODELO: Motor de simulación del sistema de memoria virtual
 Lógica de negocio para la simulación
 """
 
+import asyncio
+from array import array
+from bisect import bisect_right
+from collections import deque
 from typing import Optional
-from .memoria_model import Pagina
-from .algoritmos_model import OPT
+from .memoria_model import BIT_MODIFICADO
+from .almacen_model import BucleVirtual, NS_POR_SEGUNDO
+from .planificador_model import PlanificadorSecuencial
+from .asignacion_model import (ALCANCE_LOCAL, ALCANCE_GLOBAL,
+                               ALCANCES_REEMPLAZO)
+from .conjunto_trabajo_model import ConjuntoTrabajo
+
+# Modos de registro de eventos del simulador
+MODO_NINGUNO = "ninguno"          # Sin registro (solo estadísticas de procesos)
+MODO_CONTADORES = "contadores"    # Conteo por tipo de evento, sin objetos
+MODO_COLUMNAR = "columnar"        # Historial compacto en arreglos tipados
+MODO_COMPLETO = "completo"        # Un EventoSimulacion por paso
+MODOS_EVENTOS = (MODO_NINGUNO, MODO_CONTADORES, MODO_COLUMNAR, MODO_COMPLETO)
+
+# Tipos de evento y su código compacto
+TIPOS_EVENTO = ("HIT", "CARGA", "REEMPLAZO")
+CODIGO_HIT, CODIGO_CARGA, CODIGO_REEMPLAZO = 0, 1, 2
+
+def formatear_mensaje(tipo: str, proceso_id: int, num_pagina: int, marco: int,
+                      victima_proceso: int = -1, victima_pagina: int = -1,
+                      algoritmo: str = "") -> str:
+    """Construye el mensaje de log de un evento"""
+    if tipo == "HIT":
+        return f"✓ HIT: P{proceso_id} accede a página {num_pagina} en marco {marco}"
+    if tipo == "CARGA":
+        return f"⚠ FAULT: P{proceso_id} página {num_pagina} → Cargada en marco {marco}"
+    return (f"⚠ FAULT: P{proceso_id} página {num_pagina} → "
+            f"Reemplaza P{victima_proceso}-Pág{victima_pagina} "
+            f"en marco {marco} ({algoritmo})")
 
 class EventoSimulacion:
     """Representa un evento durante la simulación"""
     
     def __init__(self, tipo: str, proceso_id: int, num_pagina: int, 
-                 marco: Optional[int] = None, mensaje: str = ""):
+                 marco: Optional[int] = None, mensaje: Optional[str] = None,
+                 victima_proceso: int = -1, victima_pagina: int = -1,
+                 algoritmo: str = ""):
         self.tipo = tipo  # "HIT", "FAULT", "CARGA", "REEMPLAZO"
         self.proceso_id = proceso_id
         self.num_pagina = num_pagina
         self.marco = marco
-        self.mensaje = mensaje
+        self.victima_proceso = victima_proceso
+        self.victima_pagina = victima_pagina
+        self.algoritmo = algoritmo
+        self._mensaje = mensaje
         self.timestamp = 0
+    
+    @property
+    def mensaje(self) -> str:
+        """Mensaje de log; se construye la primera vez que se pide"""
+        if self._mensaje is None:
+            self._mensaje = formatear_mensaje(
+                self.tipo, self.proceso_id, self.num_pagina, self.marco,
+                self.victima_proceso, self.victima_pagina, self.algoritmo
+            )
+        return self._mensaje
+    
+    @mensaje.setter
+    def mensaje(self, valor: str):
+        self._mensaje = valor
         
     def obtener_info(self) -> dict:
         """Retorna información del evento para la vista"""
@@ -33,153 +83,858 @@ class EventoSimulacion:
     def __str__(self):
         return self.mensaje
 
+class RegistroEventos:
+    """
+    Historial de eventos en columnas tipadas (array)
+    
+    Cada evento ocupa 25 bytes en siete columnas paralelas; el algoritmo se
+    guarda por tramos (cambia pocas veces). El EventoSimulacion y su mensaje
+    solo se construyen al pedirlos con obtener() o por índice.
+    
+    Con capacidad > 0 funciona como buffer circular: conserva los últimos
+    'capacidad' eventos y cuenta los descartados.
+    """
+    
+    COLUMNAS = (
+        ('tipos', 'b'),
+        ('procesos', 'i'),
+        ('paginas', 'i'),
+        ('marcos', 'i'),
+        ('timestamps', 'I'),
+        ('victimas_proceso', 'i'),
+        ('victimas_pagina', 'i'),
+    )
+    
+    def __init__(self, capacidad: int = 0):
+        """
+        Args:
+            capacidad: Máximo de eventos retenidos; 0 = sin límite
+        """
+        if capacidad < 0:
+            raise ValueError("La capacidad del registro no puede ser negativa")
+        self.capacidad = capacidad
+        self.limpiar()
+    
+    def limpiar(self):
+        """Descarta todo el historial"""
+        for nombre, codigo in self.COLUMNAS:
+            columna = array(codigo)
+            if self.capacidad:
+                columna.frombytes(bytes(columna.itemsize * self.capacidad))
+            setattr(self, nombre, columna)
+        self.inicio = 0          # Posición física del evento más antiguo
+        self.cantidad = 0
+        self.descartados = 0     # Eventos sobrescritos por el buffer circular
+        # Tramos de algoritmo: número absoluto del primer evento y nombre
+        self.inicios_tramo = []
+        self.nombres_tramo = []
+    
+    def agregar(self, codigo: int, proceso_id: int, num_pagina: int,
+                marco: int, timestamp: int, victima_proceso: int = -1,
+                victima_pagina: int = -1, algoritmo: str = ""):
+        """Agrega un evento al historial"""
+        total = self.descartados + self.cantidad
+        if not self.nombres_tramo or self.nombres_tramo[-1] != algoritmo:
+            self.inicios_tramo.append(total)
+            self.nombres_tramo.append(algoritmo)
+        
+        if not self.capacidad:
+            self.tipos.append(codigo)
+            self.procesos.append(proceso_id)
+            self.paginas.append(num_pagina)
+            self.marcos.append(marco)
+            self.timestamps.append(timestamp)
+            self.victimas_proceso.append(victima_proceso)
+            self.victimas_pagina.append(victima_pagina)
+            self.cantidad += 1
+            return
+        
+        if self.cantidad < self.capacidad:
+            posicion = (self.inicio + self.cantidad) % self.capacidad
+            self.cantidad += 1
+        else:
+            # Buffer lleno: se sobrescribe el más antiguo
+            posicion = self.inicio
+            self.inicio = (self.inicio + 1) % self.capacidad
+            self.descartados += 1
+            self._podar_tramos()
+        self.tipos[posicion] = codigo
+        self.procesos[posicion] = proceso_id
+        self.paginas[posicion] = num_pagina
+        self.marcos[posicion] = marco
+        self.timestamps[posicion] = timestamp
+        self.victimas_proceso[posicion] = victima_proceso
+        self.victimas_pagina[posicion] = victima_pagina
+    
+    def _podar_tramos(self):
+        """Elimina los tramos de algoritmo que ya no tienen eventos"""
+        while (len(self.inicios_tramo) > 1
+               and self.inicios_tramo[1] <= self.descartados):
+            del self.inicios_tramo[0]
+            del self.nombres_tramo[0]
+    
+    def _algoritmo_de(self, absoluto: int) -> str:
+        """Nombre del algoritmo vigente en el evento número 'absoluto'"""
+        indice = bisect_right(self.inicios_tramo, absoluto) - 1
+        return self.nombres_tramo[max(indice, 0)]
+    
+    def obtener(self, indice: int) -> EventoSimulacion:
+        """Construye el EventoSimulacion de la posición indicada (0 = más antiguo)"""
+        posicion = indice
+        if self.capacidad:
+            posicion = (self.inicio + indice) % self.capacidad
+        evento = EventoSimulacion(
+            TIPOS_EVENTO[self.tipos[posicion]],
+            self.procesos[posicion],
+            self.paginas[posicion],
+            self.marcos[posicion],
+            victima_proceso=self.victimas_proceso[posicion],
+            victima_pagina=self.victimas_pagina[posicion],
+            algoritmo=self._algoritmo_de(self.descartados + indice)
+        )
+        evento.timestamp = self.timestamps[posicion]
+        return evento
+    
+    def obtener_mensajes(self, inicio: int = 0, fin: Optional[int] = None) -> list:
+        """Mensajes de log de los eventos en [inicio, fin), para la vista o exportar"""
+        return [evento.mensaje for evento in self[inicio:fin]]
+    
+    def __len__(self):
+        return self.cantidad
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self.obtener(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de evento fuera de rango")
+        return self.obtener(indice)
+    
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self.obtener(indice)
+
 class Simulador:
     """Simulador del sistema de memoria virtual"""
     
-    def __init__(self, num_marcos: int, algoritmo):
+    def __init__(self, num_marcos: int, algoritmo,
+                 periodo_reset_referencia: int = 0,
+                 modo_eventos: str = MODO_COMPLETO,
+                 capacidad_eventos: int = 0, tlb=None, costos=None,
+                 almacen=None, precarga=None, planificador=None,
+                 asignador=None, alcance_reemplazo: str = ALCANCE_LOCAL,
+                 ventana_conjunto: int = 0, control_carga: bool = False):
+        """
+        Args:
+            num_marcos: Cantidad de marcos físicos
+            algoritmo: Algoritmo de reemplazo
+            periodo_reset_referencia: Cada cuántos ticks se limpian los
+                bits R (interrupción de reloj); 0 la desactiva
+            modo_eventos: Registro de eventos (ver MODOS_EVENTOS). Por
+                defecto "completo": ejecutar_todo retorna la lista de
+                eventos. Los modos "ninguno" y "contadores" no crean
+                objetos por paso; "columnar" guarda el historial en
+                arreglos tipados.
+            capacidad_eventos: En modo columnar, máximo de eventos
+                retenidos (buffer circular); 0 = sin límite
+            tlb: TLB consultada antes de la tabla de páginas (opcional)
+            costos: ModeloCostos que acumula la latencia de cada acceso
+                (opcional)
+            almacen: AlmacenRespaldo; si se indica, ejecutar_todo ejecuta
+                los procesos en paralelo con E/S de fallos simulada (allí
+                solo se aplica el quantum del planificador)
+            precarga: Precargador (ver PRECARGAS) que agrega páginas
+                predichas en cada fallo (opcional)
+            planificador: Decide qué proceso ejecuta cada referencia (ver
+                PLANIFICADORES); por defecto, orden de llegada sin
+                expropiación
+            asignador: Política de asignación de marcos (ver
+                ASIGNACIONES) que fija una cuota por proceso (opcional;
+                sin ella los marcos libres se toman por orden de llegada)
+            alcance_reemplazo: "local" (la víctima es del proceso que
+                falla, o de cualquiera si no tiene marcos) o "global"
+            ventana_conjunto: Con Δ > 0, sigue el conjunto de trabajo de
+                cada proceso (ver ConjuntoTrabajo) y la demanda total
+            control_carga: Suspende procesos mientras la suma de los
+                conjuntos de trabajo supere los marcos (requiere
+                ventana_conjunto)
+        """
         from .memoria_model import MemoriaFisica
+        if modo_eventos not in MODOS_EVENTOS:
+            raise ValueError(f"Modo de eventos desconocido: {modo_eventos}")
+        if control_carga and not ventana_conjunto:
+            raise ValueError("El control de carga requiere ventana_conjunto")
+        if alcance_reemplazo not in ALCANCES_REEMPLAZO:
+            raise ValueError(
+                f"Alcance de reemplazo desconocido: {alcance_reemplazo}"
+            )
         self.memoria = MemoriaFisica(num_marcos)
+        self._algoritmo = None
         self.algoritmo = algoritmo
         self.procesos = {}
         self.tiempo_actual = 0
-        self.eventos = []
+        self.modo_eventos = modo_eventos
+        self.capacidad_eventos = capacidad_eventos
+        self.tlb = tlb
+        if tlb is not None:
+            tlb.vincular(self.memoria)
+        self.costos = costos
+        self.almacen = almacen
+        self.precarga = precarga
+        if precarga is not None:
+            precarga.vincular(self.memoria)
+        self.planificador = planificador or PlanificadorSecuencial()
+        self.asignador = asignador
+        if asignador is not None:
+            asignador.establecer_marcos(num_marcos)
+        self.alcance_reemplazo = alcance_reemplazo
+        self.ventana_conjunto = ventana_conjunto
+        self.control_carga = control_carga
+        self.suspendidos = deque()
+        self._eventos_reanudacion = {}
+        self._reiniciar_carga()
+        self.eventos = self._crear_historial()
+        self.conteo_eventos = [0] * len(TIPOS_EVENTO)
+        self.periodo_reset_referencia = periodo_reset_referencia
+        self.interrupciones_reloj = 0
+        
+        # Datos del último paso (evitan crear objetos en modos sin eventos)
+        self.ultimo_proceso_id = -1
+        self.ultima_pagina = -1
+        self.ultimo_marco = -1
+        self.ultima_victima_proceso = -1
+        self.ultima_victima_pagina = -1
+        self.ultima_victima_sucia = False
+    
+    @property
+    def algoritmo(self):
+        """Algoritmo de reemplazo activo"""
+        return self._algoritmo
+    
+    @algoritmo.setter
+    def algoritmo(self, algoritmo):
+        """Cambia el algoritmo y lo vincula a la memoria actual"""
+        if self._algoritmo is not None:
+            self._algoritmo.desvincular()
+        self._algoritmo = algoritmo
+        algoritmo.vincular(self.memoria)
         
     def agregar_proceso(self, proceso):
         """Agrega un proceso al simulador"""
         self.procesos[proceso.id] = proceso
+        proceso.tabla_paginas.vincular_memoria(self.memoria, proceso.id)
+        if self.ventana_conjunto and proceso.conjunto_trabajo is None:
+            proceso.conjunto_trabajo = ConjuntoTrabajo(self.ventana_conjunto)
+        self.planificador.agregar(proceso)
+        if self.asignador is not None:
+            self.asignador.agregar(proceso)
+        self._sumar_demanda(proceso)
         
-    def ejecutar_paso(self) -> Optional[EventoSimulacion]:
-        """Ejecuta un paso de la simulación"""
-        proceso_activo = None
+    def limpiar_bits_referencia(self):
+        """Interrupción de reloj: limpia los bits R en memoria y tablas"""
+        self.memoria.limpiar_bits_referencia()
         for proceso in self.procesos.values():
-            if proceso.tiene_mas_accesos():
-                proceso_activo = proceso
-                break
+            proceso.tabla_paginas.limpiar_bits_referencia()
+        self.interrupciones_reloj += 1
         
-        if not proceso_activo:
-            return None
+    def _paso(self) -> int:
+        """
+        Procesa la siguiente referencia sin registrar el evento
+        
+        Returns:
+            Código del tipo de evento, o -1 si no quedan accesos. Los datos
+            del paso quedan en los atributos ultimo_* / ultima_*.
+        """
+        planificador = self.planificador
+        proceso_activo = planificador.siguiente()
+        if proceso_activo is None:
+            # Procesos que recibieron una secuencia nueva tras terminar
+            for proceso in self.procesos.values():
+                if proceso.tiene_mas_accesos() and not proceso.suspendido:
+                    planificador.agregar(proceso)
+                    self._sumar_demanda(proceso)
+            proceso_activo = planificador.siguiente()
+            if proceso_activo is None and self.suspendidos:
+                # Solo quedan procesos suspendidos: vuelve el primero
+                self._reanudar(forzar=True)
+                proceso_activo = planificador.siguiente()
+            if proceso_activo is None:
+                return -1
         
+        if proceso_activo is not planificador.ultimo_proceso:
+            planificador.despachar(proceso_activo)
+        codigo = self._paso_proceso(proceso_activo)
+        planificador.registrar_resultado(codigo)
+        if self._en_demanda or self.suspendidos:
+            self._controlar_carga(proceso_activo)
+        return codigo
+    
+    def _paso_proceso(self, proceso_activo) -> int:
+        """Procesa la siguiente referencia de un proceso dado (ver _paso)"""
         num_pagina = proceso_activo.obtener_siguiente_acceso()
         if num_pagina is None:
-            return None
+            return -1
+        if not 0 <= num_pagina < proceso_activo.tabla_paginas.num_paginas:
+            # Sin entrada en la tabla, cada referencia cargaría otra copia
+            raise ValueError(
+                f"Página {num_pagina} fuera del espacio virtual del proceso "
+                f"{proceso_activo.id} "
+                f"({proceso_activo.tabla_paginas.num_paginas} páginas)"
+            )
         
         self.tiempo_actual += 1
+        if (self.periodo_reset_referencia
+                and self.tiempo_actual % self.periodo_reset_referencia == 0):
+            self.limpiar_bits_referencia()
+        self.algoritmo.notificar_referencia(
+            proceso_activo, proceso_activo.indice_acceso_actual - 1, num_pagina
+        )
+        conjunto = proceso_activo.conjunto_trabajo
+        if conjunto is not None:
+            cambio = conjunto.registrar(num_pagina)
+            if cambio and proceso_activo.id in self._en_demanda:
+                self.demanda += cambio
         
-        marco = self.memoria.buscar_pagina(proceso_activo.id, num_pagina)
+        self.ultimo_proceso_id = proceso_activo.id
+        self.ultima_pagina = num_pagina
+        self.ultima_victima_proceso = -1
+        self.ultima_victima_pagina = -1
+        self.ultima_victima_sucia = False
+        memoria = self.memoria
+        tlb = self.tlb
+        tabla = proceso_activo.tabla_paginas
+        costos = self.costos
+        if costos is not None:
+            accesos_tabla = tabla.accesos_memoria
+        if tlb is None:
+            marco = tabla.traducir(num_pagina)
+        else:
+            tlb.cambiar_contexto(proceso_activo.id)
+            marco = tlb.buscar(proceso_activo.id, num_pagina)
+            if marco < 0:
+                marco = tabla.traducir(num_pagina)
+                if marco >= 0:
+                    tlb.insertar(proceso_activo.id, num_pagina, marco)
+        if costos is not None:
+            accesos_tabla = tabla.accesos_memoria - accesos_tabla
         
-        if marco:
+        if marco >= 0:
             # PAGE HIT
-            marco.acceder(self.tiempo_actual)
+            memoria.acceder(marco, self.tiempo_actual,
+                            proceso_activo.ultimo_acceso_escritura)
             proceso_activo.registrar_hit()
-            proceso_activo.tabla_paginas.marcar_referenciada(num_pagina)
+            tabla.marcar_referenciada(num_pagina)
+            
+            if costos is not None:
+                costos.registrar(False, accesos_tabla, tlb is not None)
+            self.ultimo_marco = marco
+            precarga = self.precarga
+            if precarga is not None and precarga.pendientes:
+                paginas = precarga.al_usar(proceso_activo.id, num_pagina)
+                if paginas:
+                    self._precargar(proceso_activo, paginas, marco)
+            return CODIGO_HIT
+        
+        # PAGE FAULT
+        proceso_activo.registrar_fault()
+        if self.asignador is not None:
+            self.asignador.registrar_fallo(proceso_activo)
+        
+        marco_libre = self._buscar_marco_libre(proceso_activo.id)
+        
+        if marco_libre >= 0:
+            # Hay espacio disponible
+            memoria.cargar(marco_libre, proceso_activo.id, num_pagina,
+                           self.tiempo_actual,
+                           proceso_activo.ultimo_acceso_escritura)
             
-            evento = EventoSimulacion(
-                "HIT",
-                proceso_activo.id,
-                num_pagina,
-                marco.numero,
-                f"✓ HIT: P{proceso_activo.id} accede a página {num_pagina} en marco {marco.numero}"
+            proceso_activo.tabla_paginas.actualizar_entrada(
+                num_pagina, marco_libre, True, proceso_activo.ultimo_acceso_escritura
             )
-            evento.timestamp = self.tiempo_actual
-            self.eventos.append(evento)
-            return evento
-        else:
-            # PAGE FAULT
-            proceso_activo.registrar_fault()
             
-            marco_libre = self.memoria.obtener_marco_libre()
+            if tlb is not None:
+                tlb.insertar(proceso_activo.id, num_pagina, marco_libre)
             
-            if marco_libre:
-                # Hay espacio disponible
-                nueva_pagina = Pagina(num_pagina, proceso_activo.id)
-                marco_libre.cargar_pagina(nueva_pagina, self.tiempo_actual)
-                
-                proceso_activo.tabla_paginas.actualizar_entrada(
-                    num_pagina, marco_libre.numero, True
-                )
-                
-                evento = EventoSimulacion(
-                    "CARGA",
-                    proceso_activo.id,
-                    num_pagina,
-                    marco_libre.numero,
-                    f"⚠ FAULT: P{proceso_activo.id} página {num_pagina} → Cargada en marco {marco_libre.numero}"
-                )
-                evento.timestamp = self.tiempo_actual
-                self.eventos.append(evento)
-                return evento
-            else:
-                # Necesitamos reemplazar
-                if isinstance(self.algoritmo, OPT):
-                    self.algoritmo.establecer_secuencia(
-                        proceso_activo.secuencia_accesos,
-                        proceso_activo.indice_acceso_actual
-                    )
-                
-                marco_victima = self.algoritmo.seleccionar_victima(
-                    self.memoria, proceso_activo.id
-                )
-                
-                pagina_antigua = marco_victima.pagina
-                proceso_antiguo = self.procesos[pagina_antigua.proceso_id]
-                
-                proceso_antiguo.tabla_paginas.actualizar_entrada(
-                    pagina_antigua.numero, None, False
-                )
-                
-                nueva_pagina = Pagina(num_pagina, proceso_activo.id)
-                marco_victima.cargar_pagina(nueva_pagina, self.tiempo_actual)
-                
-                proceso_activo.tabla_paginas.actualizar_entrada(
-                    num_pagina, marco_victima.numero, True
-                )
-                
-                evento = EventoSimulacion(
-                    "REEMPLAZO",
-                    proceso_activo.id,
-                    num_pagina,
-                    marco_victima.numero,
-                    f"⚠ FAULT: P{proceso_activo.id} página {num_pagina} → "
-                    f"Reemplaza P{pagina_antigua.proceso_id}-Pág{pagina_antigua.numero} "
-                    f"en marco {marco_victima.numero} ({self.algoritmo.nombre})"
-                )
-                evento.timestamp = self.tiempo_actual
-                self.eventos.append(evento)
-                return evento
+            if costos is not None:
+                costos.registrar(True, accesos_tabla, tlb is not None)
+            self.ultimo_marco = marco_libre
+            if self.precarga is not None:
+                self._precargar_fallo(proceso_activo, num_pagina, marco_libre)
+            return CODIGO_CARGA
+        
+        # Necesitamos reemplazar
+        victima = self._seleccionar_victima(proceso_activo.id)
+        proceso_antiguo_id = memoria.procesos[victima]
+        pagina_antigua = memoria.paginas[victima]
+        victima_sucia = self._desalojar(victima)
+        self.ultima_victima_sucia = victima_sucia
+        
+        memoria.cargar(victima, proceso_activo.id, num_pagina,
+                       self.tiempo_actual,
+                       proceso_activo.ultimo_acceso_escritura)
+        
+        proceso_activo.tabla_paginas.actualizar_entrada(
+            num_pagina, victima, True, proceso_activo.ultimo_acceso_escritura
+        )
+        
+        if tlb is not None:
+            tlb.insertar(proceso_activo.id, num_pagina, victima)
+        
+        if costos is not None:
+            costos.registrar(True, accesos_tabla, tlb is not None,
+                             victima_sucia)
+        self.ultimo_marco = victima
+        self.ultima_victima_proceso = proceso_antiguo_id
+        self.ultima_victima_pagina = pagina_antigua
+        if self.precarga is not None:
+            self._precargar_fallo(proceso_activo, num_pagina, victima)
+        return CODIGO_REEMPLAZO
+    
+    def _buscar_marco_libre(self, proceso_id: int) -> int:
+        """Marco libre para el proceso (-1 si no hay o agotó su cuota)"""
+        asignador = self.asignador
+        if asignador is not None and not asignador.admite_libre(
+                proceso_id, self.memoria, self.alcance_reemplazo):
+            return -1
+        return self.memoria.buscar_marco_libre()
+    
+    def _seleccionar_victima(self, proceso_id: int) -> int:
+        """Marco víctima para un fallo del proceso"""
+        memoria = self.memoria
+        algoritmo = self.algoritmo
+        asignador = self.asignador
+        if asignador is not None:
+            dueno = asignador.elegir_dueno(proceso_id, memoria,
+                                           self.alcance_reemplazo)
+        elif self.alcance_reemplazo == ALCANCE_GLOBAL:
+            dueno = None
+        else:
+            dueno = proceso_id
+        
+        if dueno is not None:
+            try:
+                return algoritmo.seleccionar_victima(memoria, dueno).numero
+            except ValueError:
+                # El proceso no tiene marcos propios: reemplazo global
+                pass
+        victima = algoritmo.seleccionar_victima(memoria).numero
+        if asignador is not None:
+            # La víctima global no debe dejar a su dueño bajo el mínimo
+            donante = asignador.proteger(proceso_id, memoria.procesos[victima],
+                                         memoria)
+            if donante is not None:
+                victima = algoritmo.seleccionar_victima(memoria, donante).numero
+        return victima
+    
+    def _desalojar(self, victima: int) -> bool:
+        """
+        Invalida la página del marco en la tabla de su dueño
+        
+        Returns:
+            True si estaba modificada (se cuenta el write-back)
+        """
+        memoria = self.memoria
+        dueno = self.procesos[memoria.procesos[victima]]
+        sucia = bool(memoria.bits[victima] & BIT_MODIFICADO)
+        if sucia:
+            # La página modificada se escribe en disco antes de reutilizar el marco
+            dueno.write_backs += 1
+        dueno.tabla_paginas.actualizar_entrada(
+            memoria.paginas[victima], None, False
+        )
+        return sucia
+    
+    def _precargar_fallo(self, proceso, num_pagina: int, marco: int):
+        """Consulta al precargador tras el fallo de la página en 'marco'"""
+        paginas = self.precarga.al_fallar(proceso.id, num_pagina)
+        if paginas:
+            self._precargar(proceso, paginas, marco)
+    
+    def _precargar(self, proceso, paginas: list, protegido: int):
+        """
+        Carga las páginas predichas que no están residentes en marcos
+        libres o de víctimas
+        
+        Entran con el bit R apagado, igual que una página cargada por
+        fallo: nadie las usó todavía, y el bit se enciende en su primer
+        acierto. Se detiene antes de desalojar el marco 'protegido' (la
+        página que se acaba de usar) u otra página precargada aún sin usar.
+        """
+        memoria = self.memoria
+        precarga = self.precarga
+        tabla = proceso.tabla_paginas
+        proceso_id = proceso.id
+        limite = proceso.num_paginas_virtuales
+        for pagina in paginas:
+            if not 0 <= pagina < limite or memoria.buscar_marco(proceso_id, pagina) >= 0:
+                continue
+            marco = self._buscar_marco_libre(proceso_id)
+            if marco < 0:
+                marco = self._seleccionar_victima(proceso_id)
+                clave = (memoria.procesos[marco], memoria.paginas[marco])
+                if marco == protegido or clave in precarga.pendientes:
+                    break
+                if self._desalojar(marco):
+                    precarga.write_backs += 1
+            memoria.cargar(marco, proceso_id, pagina, self.tiempo_actual)
+            tabla.actualizar_entrada(pagina, marco, True)
+            precarga.registrar_carga(proceso_id, pagina)
+    
+    # ========== CONTROL DE CARGA ==========
+    
+    def _reiniciar_carga(self):
+        self.demanda = 0                  # Suma de los conjuntos de trabajo
+        self.demanda_maxima = 0
+        self.referencias_sobrecarga = 0   # Referencias con demanda > marcos
+        self.suspensiones = 0
+        self.reanudaciones = 0
+        # Procesos activos cuyo conjunto de trabajo suma a la demanda
+        self._en_demanda = set()
+    
+    def _sumar_demanda(self, proceso):
+        conjunto = proceso.conjunto_trabajo
+        if (conjunto is not None and proceso.id not in self._en_demanda
+                and proceso.tiene_mas_accesos()):
+            self._en_demanda.add(proceso.id)
+            self.demanda += len(conjunto)
+    
+    def _retirar_demanda(self, proceso):
+        if proceso.id in self._en_demanda:
+            self._en_demanda.remove(proceso.id)
+            self.demanda -= len(proceso.conjunto_trabajo)
+    
+    def _controlar_carga(self, proceso):
+        """Tras cada referencia: demanda total, suspensiones y reanudaciones"""
+        if not proceso.tiene_mas_accesos():
+            self._retirar_demanda(proceso)
+        if self.demanda > self.demanda_maxima:
+            self.demanda_maxima = self.demanda
+        if self.demanda > self.memoria.num_marcos:
+            # Hiperpaginación: los conjuntos de trabajo no caben en memoria
+            self.referencias_sobrecarga += 1
+            if self.control_carga:
+                self._suspender()
+        elif self.suspendidos:
+            self._reanudar()
+    
+    def _suspender(self):
+        """Suspende procesos hasta que la demanda quepa (queda al menos uno)"""
+        num_marcos = self.memoria.num_marcos
+        while self.demanda > num_marcos:
+            candidatos = [proceso for proceso in self.procesos.values()
+                          if proceso.id in self._en_demanda]
+            if len(candidatos) < 2:
+                return
+            # Menor prioridad; entre iguales, el conjunto más grande y,
+            # si empatan, el último en llegar
+            victima = min(reversed(candidatos), key=lambda proceso: (
+                proceso.prioridad, -len(proceso.conjunto_trabajo)
+            ))
+            self._suspender_proceso(victima)
+    
+    def _suspender_proceso(self, proceso):
+        """Saca al proceso de la planificación y libera sus marcos"""
+        proceso.suspendido = True
+        self.suspensiones += 1
+        self._retirar_demanda(proceso)
+        self.planificador.quitar(proceso)
+        self.suspendidos.append(proceso)
+        # Sus páginas salen de memoria (las modificadas se escriben)
+        memoria = self.memoria
+        procesos = memoria.procesos
+        for numero in range(memoria.num_marcos):
+            if procesos[numero] == proceso.id:
+                self._desalojar(numero)
+                memoria.liberar(numero)
+    
+    def _reanudar(self, forzar: bool = False):
+        """
+        Reanuda, por orden de suspensión, los procesos cuyo conjunto de
+        trabajo cabe en la memoria (con forzar, al menos el primero)
+        """
+        num_marcos = self.memoria.num_marcos
+        while self.suspendidos:
+            proceso = self.suspendidos[0]
+            if (not forzar
+                    and self.demanda + len(proceso.conjunto_trabajo) > num_marcos):
+                break
+            self.suspendidos.popleft()
+            forzar = False
+            proceso.suspendido = False
+            self.reanudaciones += 1
+            self.planificador.agregar(proceso)
+            self._sumar_demanda(proceso)
+            evento = self._eventos_reanudacion.get(proceso.id)
+            if evento is not None:
+                evento.set()
+    
+    async def _esperar_reanudacion(self, proceso):
+        """Bloquea la tarea del proceso mientras esté suspendido"""
+        evento = asyncio.Event()
+        self._eventos_reanudacion[proceso.id] = evento
+        try:
+            await evento.wait()
+        finally:
+            del self._eventos_reanudacion[proceso.id]
+    
+    def _crear_historial(self):
+        """Contenedor de eventos según el modo"""
+        if self.modo_eventos == MODO_COLUMNAR:
+            return RegistroEventos(self.capacidad_eventos)
+        return []
+    
+    def _crear_evento(self, codigo: int) -> EventoSimulacion:
+        """Construye el EventoSimulacion del último paso (mensaje diferido)"""
+        evento = EventoSimulacion(
+            TIPOS_EVENTO[codigo],
+            self.ultimo_proceso_id,
+            self.ultima_pagina,
+            self.ultimo_marco,
+            victima_proceso=self.ultima_victima_proceso,
+            victima_pagina=self.ultima_victima_pagina,
+            algoritmo=self.algoritmo.nombre
+        )
+        evento.timestamp = self.tiempo_actual
+        return evento
+    
+    def _registrar(self, codigo: int):
+        """Registra el último paso según el modo de eventos"""
+        modo = self.modo_eventos
+        if modo == MODO_NINGUNO:
+            return
+        self.conteo_eventos[codigo] += 1
+        if modo == MODO_COLUMNAR:
+            self.eventos.agregar(
+                codigo, self.ultimo_proceso_id, self.ultima_pagina,
+                self.ultimo_marco, self.tiempo_actual,
+                self.ultima_victima_proceso, self.ultima_victima_pagina,
+                self.algoritmo.nombre
+            )
+    
+    def _anotar(self, codigo: int):
+        """Registra el último paso, creando el evento en modo completo"""
+        if self.modo_eventos == MODO_COMPLETO:
+            self.conteo_eventos[codigo] += 1
+            self.eventos.append(self._crear_evento(codigo))
+        else:
+            self._registrar(codigo)
+    
+    def ejecutar_paso(self) -> Optional[EventoSimulacion]:
+        """
+        Ejecuta un paso de la simulación
+        
+        Returns:
+            En los modos "columnar" y "completo", el EventoSimulacion del
+            paso (su mensaje se arma al leerlo). En "ninguno" y
+            "contadores", solo el tipo ("HIT", "CARGA", "REEMPLAZO"), sin
+            crear objetos. None si no quedan accesos.
+        """
+        codigo = self._paso()
+        if codigo < 0:
+            return None
+        
+        if self.modo_eventos == MODO_COMPLETO:
+            self.conteo_eventos[codigo] += 1
+            evento = self._crear_evento(codigo)
+            self.eventos.append(evento)
+            return evento
+        
+        self._registrar(codigo)
+        if self.modo_eventos == MODO_COLUMNAR:
+            return self._crear_evento(codigo)
+        return TIPOS_EVENTO[codigo]
     
     def ejecutar_todo(self) -> list:
-        """Ejecuta toda la simulación"""
-        eventos = []
+        """
+        Ejecuta toda la simulación
+        
+        Returns:
+            Los eventos generados en modo "completo"; en modo "columnar",
+            el RegistroEventos (sin materializar eventos); en los demás,
+            una lista vacía (ver conteo_eventos)
+        """
+        if self.almacen is not None:
+            inicio = len(self.eventos)
+            bucle = BucleVirtual()
+            try:
+                bucle.run_until_complete(self._ejecutar_con_almacen())
+            finally:
+                bucle.close()
+            if self.modo_eventos == MODO_COMPLETO:
+                return self.eventos[inicio:]
+        elif self.modo_eventos == MODO_COMPLETO:
+            inicio = len(self.eventos)
+            while self.ejecutar_paso() is not None:
+                pass
+            return self.eventos[inicio:]
+        elif self.modo_eventos == MODO_NINGUNO:
+            paso = self._paso
+            while paso() >= 0:
+                pass
+        else:
+            paso = self._paso
+            registrar = self._registrar
+            while True:
+                codigo = paso()
+                if codigo < 0:
+                    break
+                registrar(codigo)
+        if self.modo_eventos == MODO_COLUMNAR:
+            return self.eventos
+        return []
+    
+    async def _ejecutar_con_almacen(self):
+        """Un proceso por tarea; la CPU se asigna por orden de llegada"""
+        self.almacen.iniciar()
+        cpu = asyncio.Lock()
+        await asyncio.gather(*(
+            self._ejecutar_proceso(proceso, cpu)
+            for proceso in list(self.procesos.values())
+        ))
+        await self.almacen.drenar()
+        self.almacen.finalizar()
+    
+    async def _ejecutar_proceso(self, proceso, cpu: asyncio.Lock):
+        """Ráfaga de CPU hasta el próximo fallo, luego bloqueo por la E/S"""
+        segundos_referencia = self.almacen.tiempo_referencia_ns / NS_POR_SEGUNDO
+        precarga = self.precarga
+        planificador = self.planificador
+        algoritmo = self.algoritmo
+        quantum = planificador.quantum
         while True:
-            evento = self.ejecutar_paso()
-            if evento is None:
-                break
-            eventos.append(evento)
-        return eventos
+            if proceso.suspendido:
+                await self._esperar_reanudacion(proceso)
+            async with cpu:
+                programadas = algoritmo.escrituras_programadas
+                if precarga is not None:
+                    precargadas = precarga.precargadas
+                    escrituras = precarga.write_backs
+                planificador.despachar(proceso)
+                referencias = 0
+                while True:
+                    codigo = self._paso_proceso(proceso)
+                    if codigo < 0:
+                        break
+                    self._anotar(codigo)
+                    referencias += 1
+                    if self._en_demanda or self.suspendidos:
+                        self._controlar_carga(proceso)
+                    # Un fallo, el fin del quantum o la suspensión
+                    # terminan la ráfaga
+                    if (codigo != CODIGO_HIT or referencias == quantum
+                            or proceso.suspendido):
+                        break
+                victima_sucia = self.ultima_victima_sucia
+                # Las escrituras programadas por el algoritmo (WSClock) y la
+                # lectura anticipada no bloquean al proceso
+                programadas = algoritmo.escrituras_programadas - programadas
+                if precarga is not None:
+                    self.almacen.en_segundo_plano(
+                        precarga.precargadas - precargadas,
+                        precarga.write_backs - escrituras + programadas
+                    )
+                elif programadas:
+                    self.almacen.en_segundo_plano(0, programadas)
+                await asyncio.sleep(referencias * segundos_referencia)
+            if codigo < 0:
+                if self.suspendidos and not self._en_demanda:
+                    # Solo quedan procesos suspendidos: vuelve el primero
+                    self._reanudar(forzar=True)
+                return
+            if codigo != CODIGO_HIT:
+                await self.almacen.atender_fallo(proceso.id, victima_sucia)
     
     def resetear(self):
         """Resetea el simulador"""
         self.memoria.resetear()
         self.tiempo_actual = 0
-        self.eventos = []
+        self.eventos = self._crear_historial()
+        self.conteo_eventos = [0] * len(TIPOS_EVENTO)
+        self.interrupciones_reloj = 0
         self.algoritmo.resetear()
+        if self.tlb is not None:
+            self.tlb.resetear()
+        if self.costos is not None:
+            self.costos.resetear()
+        if self.almacen is not None:
+            self.almacen.resetear()
+        if self.precarga is not None:
+            self.precarga.resetear()
+        if self.asignador is not None:
+            self.asignador.resetear()
         
         for proceso in self.procesos.values():
+            proceso.tabla_paginas.resetear()
             proceso.resetear_estadisticas()
+        self.planificador.resetear(self.procesos.values())
+        self.suspendidos.clear()
+        self._reiniciar_carga()
+        for proceso in self.procesos.values():
+            self._sumar_demanda(proceso)
     
     def obtener_estadisticas(self) -> dict:
         """Obtiene estadísticas generales"""
         total_accesos = sum(p.total_accesos for p in self.procesos.values())
         total_faults = sum(p.page_faults for p in self.procesos.values())
         total_hits = sum(p.page_hits for p in self.procesos.values())
+        total_escrituras = sum(p.escrituras for p in self.procesos.values())
+        total_write_backs = sum(p.write_backs for p in self.procesos.values())
         
         tasa_fallos = (total_faults / total_accesos * 100) if total_accesos > 0 else 0
         
-        return {
+        estadisticas = {
             "accesos_totales": total_accesos,
             "page_faults": total_faults,
             "page_hits": total_hits,
             "tasa_fallos": tasa_fallos,
-            "marcos_usados": len(self.memoria.obtener_marcos_ocupados()),
-            "marcos_totales": self.memoria.num_marcos
+            "marcos_usados": self.memoria.contar_marcos_ocupados(),
+            "marcos_totales": self.memoria.num_marcos,
+            "cargas": self.conteo_eventos[CODIGO_CARGA],
+            "reemplazos": self.conteo_eventos[CODIGO_REEMPLAZO],
+            "escrituras": total_escrituras,
+            "write_backs": total_write_backs,
+            "interrupciones_reloj": self.interrupciones_reloj,
+            "algoritmo": self.algoritmo.nombre,
+            "alcance_reemplazo": self.alcance_reemplazo,
+            "costo_algoritmo": self.algoritmo.obtener_estadisticas(),
+            "tablas_paginas": {
+                pid: proceso.tabla_paginas.obtener_costos()
+                for pid, proceso in self.procesos.items()
+            }
+        }
+        if self.tlb is not None:
+            estadisticas["tlb"] = self.tlb.obtener_estadisticas()
+        if self.costos is not None:
+            estadisticas["costos"] = self.costos.obtener_estadisticas()
+        if self.almacen is not None:
+            estadisticas["almacen"] = self.almacen.obtener_estadisticas()
+        if self.precarga is not None:
+            estadisticas["precarga"] = self.precarga.obtener_estadisticas()
+        conjuntos = {
+            pid: proceso.conjunto_trabajo.obtener_estadisticas()
+            for pid, proceso in self.procesos.items()
+            if proceso.conjunto_trabajo is not None
+        }
+        if conjuntos:
+            estadisticas["conjunto_trabajo"] = {
+                "demanda": self.demanda,
+                "demanda_maxima": self.demanda_maxima,
+                "referencias_sobrecarga": self.referencias_sobrecarga,
+                "control_carga": self.control_carga,
+                "suspensiones": self.suspensiones,
+                "reanudaciones": self.reanudaciones,
+                "suspendidos": [proceso.id for proceso in self.suspendidos],
+                "procesos": conjuntos
+            }
+        if self.asignador is not None:
+            estadisticas["asignacion"] = \
+                self.asignador.obtener_estadisticas(self.memoria)
+        planificador = self.planificador.obtener_estadisticas()
+        # Tasa de fallos de cada proceso con la memoria compartida
+        planificador["tasa_fallos"] = {
+            pid: proceso.obtener_tasa_fallos()
+            for pid, proceso in self.procesos.items()
         }
+        estadisticas["planificador"] = planificador
+        return estadisticas
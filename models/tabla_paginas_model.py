@@ -0,0 +1,588 @@
+"""
+MODELO: Tablas de páginas
+Tabla lineal, multinivel (radix), hash e invertida con una interfaz común
+(traducir, actualizar_entrada, obtener_entrada, ...) y métricas de costo:
+memoria ocupada por la estructura y accesos a memoria por traducción
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import Optional, Dict, Iterator, Tuple
+from .memoria_model import BIT_REFERENCIADO, BIT_MODIFICADO
+
+# Tamaños (bytes) usados para estimar la memoria de cada estructura
+TAMANO_PTE = 8                  # Entrada de tabla lineal o multinivel
+TAMANO_ENTRADA_HASH = 24        # Número de página + PTE + enlace
+TAMANO_ENTRADA_INVERTIDA = 16   # Proceso + página + bits + enlace
+TAMANO_PUNTERO = 8              # Cubeta de tabla hash / ancla
+
+def dispersar(clave: int, num_cubetas: int) -> int:
+    """Cubeta de una clave entera (hash multiplicativo de Fibonacci)"""
+    return (((clave * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % num_cubetas
+
+class EntradaTablaPaginas:
+    """
+    Entrada en la tabla de páginas
+    
+    Mientras la página está presente, los bits R y M se leen y escriben en
+    la tabla de marcos de la memoria vinculada (una sola copia); fuera de
+    memoria, o sin memoria vinculada, se guardan en la propia entrada.
+    """
+    
+    __slots__ = ('numero_pagina', 'marco_fisico', 'presente',
+                 '_modificada', '_referenciada', 'tabla')
+    
+    def __init__(self, numero_pagina: int, marco_fisico: Optional[int] = None,
+                 presente: bool = False, modificada: bool = False,
+                 referenciada: bool = False,
+                 tabla: Optional["TablaPaginasBase"] = None):
+        self.numero_pagina = numero_pagina
+        self.marco_fisico = marco_fisico
+        self.presente = presente
+        self._modificada = modificada
+        self._referenciada = referenciada
+        self.tabla = tabla
+    
+    def _marco_residente(self) -> int:
+        """Marco de la tabla de marcos que contiene esta página (-1 si no hay)"""
+        tabla = self.tabla
+        if (tabla is None or tabla.memoria is None or not self.presente
+                or self.marco_fisico is None):
+            return -1
+        memoria = tabla.memoria
+        marco = self.marco_fisico
+        if (memoria.procesos[marco] != tabla.proceso_id
+                or memoria.paginas[marco] != self.numero_pagina):
+            return -1
+        return marco
+    
+    @property
+    def referenciada(self) -> bool:
+        marco = self._marco_residente()
+        if marco < 0:
+            return self._referenciada
+        return bool(self.tabla.memoria.bits[marco] & BIT_REFERENCIADO)
+    
+    @referenciada.setter
+    def referenciada(self, valor: bool):
+        marco = self._marco_residente()
+        if marco < 0:
+            self._referenciada = valor
+        else:
+            self.tabla.memoria.escribir_bit(marco, BIT_REFERENCIADO, valor)
+    
+    @property
+    def modificada(self) -> bool:
+        marco = self._marco_residente()
+        if marco < 0:
+            return self._modificada
+        return bool(self.tabla.memoria.bits[marco] & BIT_MODIFICADO)
+    
+    @modificada.setter
+    def modificada(self, valor: bool):
+        marco = self._marco_residente()
+        if marco < 0:
+            self._modificada = valor
+        else:
+            self.tabla.memoria.escribir_bit(marco, BIT_MODIFICADO, valor)
+    
+    def obtener_info(self) -> dict:
+        """Retorna información para la vista"""
+        return {
+            'numero_pagina': self.numero_pagina,
+            'marco_fisico': self.marco_fisico if self.presente else None,
+            'presente': self.presente,
+            'modificada': self.modificada,
+            'referenciada': self.referenciada
+        }
+
+class TablaPaginasBase(ABC):
+    """
+    Clase base de las tablas de páginas de un proceso
+    
+    Las subclases definen cómo se ubica una entrada (_recorrer), cómo se
+    crea bajo demanda (_asignar) y cuánta memoria ocupa la estructura.
+    Solo traducir() cuenta búsquedas y accesos: es el recorrido que haría
+    la MMU; el mantenimiento del sistema operativo no se cobra.
+    """
+    
+    tipo = "base"
+    
+    def __init__(self, num_paginas: int):
+        self.num_paginas = num_paginas
+        self.memoria = None
+        self.proceso_id = None
+        self.busquedas = 0
+        self.accesos_memoria = 0
+        self._referenciadas = set()
+    
+    def vincular_memoria(self, memoria, proceso_id: int):
+        """Toma los bits R/M de las páginas presentes de la tabla de marcos"""
+        self.memoria = memoria
+        self.proceso_id = proceso_id
+    
+    # ========== ESTRUCTURA (SUBCLASES) ==========
+    
+    @abstractmethod
+    def _recorrer(self, num_pagina: int) -> Tuple[Optional[EntradaTablaPaginas], int]:
+        """Busca la entrada sin crearla; retorna (entrada o None, accesos)"""
+        pass
+    
+    @abstractmethod
+    def _asignar(self, num_pagina: int) -> EntradaTablaPaginas:
+        """Retorna la entrada de la página, creándola si no existe"""
+        pass
+    
+    def _liberar(self, entrada: EntradaTablaPaginas):
+        """La página dejó de estar presente (las estructuras dispersas la quitan)"""
+        pass
+    
+    @abstractmethod
+    def iterar_entradas(self) -> Iterator[EntradaTablaPaginas]:
+        """Entradas existentes, en orden de número de página"""
+        pass
+    
+    @abstractmethod
+    def contar_entradas(self) -> int:
+        """Cantidad de entradas creadas"""
+        pass
+    
+    @abstractmethod
+    def calcular_bytes(self) -> int:
+        """Memoria estimada que ocupa la estructura"""
+        pass
+    
+    @abstractmethod
+    def _vaciar(self):
+        """Descarta todas las entradas"""
+        pass
+    
+    # ========== INTERFAZ COMÚN ==========
+    
+    def traducir(self, num_pagina: int) -> int:
+        """
+        Traduce una página a su marco físico
+        
+        Returns:
+            Número de marco, o -1 si la página no está presente o está
+            fuera del espacio virtual (el simulador rechaza esas referencias)
+        """
+        if not 0 <= num_pagina < self.num_paginas:
+            return -1
+        entrada, accesos = self._recorrer(num_pagina)
+        self.busquedas += 1
+        self.accesos_memoria += accesos
+        if entrada is None or not entrada.presente:
+            return -1
+        return entrada.marco_fisico
+    
+    def actualizar_entrada(self, num_pagina: int, marco: Optional[int], 
+                          presente: bool, modificada: bool = False):
+        """Actualiza una entrada de la tabla"""
+        if not 0 <= num_pagina < self.num_paginas:
+            return
+        if presente:
+            entrada = self._asignar(num_pagina)
+        else:
+            entrada = self._recorrer(num_pagina)[0]
+            if entrada is None:
+                return
+        entrada.marco_fisico = marco
+        entrada.presente = presente
+        entrada.modificada = modificada
+        if not presente:
+            self._liberar(entrada)
+    
+    def marcar_referenciada(self, num_pagina: int):
+        """Marca una página como referenciada"""
+        if 0 <= num_pagina < self.num_paginas:
+            self._asignar(num_pagina).referenciada = True
+            self._referenciadas.add(num_pagina)
+    
+    def limpiar_bits_referencia(self):
+        """Limpia todos los bits de referencia (solo las entradas marcadas)"""
+        for num_pagina in self._referenciadas:
+            entrada = self._recorrer(num_pagina)[0]
+            if entrada is not None:
+                entrada.referenciada = False
+        self._referenciadas.clear()
+    
+    def obtener_entrada(self, num_pagina: int) -> Optional[EntradaTablaPaginas]:
+        """Obtiene una entrada específica (una vacía si aún no existe)"""
+        if not 0 <= num_pagina < self.num_paginas:
+            return None
+        entrada = self._recorrer(num_pagina)[0]
+        if entrada is None:
+            entrada = EntradaTablaPaginas(num_pagina, tabla=self)
+        return entrada
+    
+    def obtener_todas_entradas(self) -> list:
+        """Retorna todas las entradas existentes para la vista"""
+        return [entrada.obtener_info() for entrada in self.iterar_entradas()]
+    
+    def resetear(self):
+        """Descarta las traducciones y los contadores de costo"""
+        self._vaciar()
+        self._referenciadas.clear()
+        self.busquedas = 0
+        self.accesos_memoria = 0
+    
+    def obtener_costos(self) -> dict:
+        """Memoria ocupada y costo de las traducciones"""
+        return {
+            'tipo': self.tipo,
+            'entradas': self.contar_entradas(),
+            'bytes': self.calcular_bytes(),
+            'busquedas': self.busquedas,
+            'accesos_memoria': self.accesos_memoria,
+            'accesos_por_busqueda': (self.accesos_memoria / self.busquedas
+                                     if self.busquedas else 0.0)
+        }
+
+class TablaPaginas(TablaPaginasBase):
+    """Tabla de páginas lineal: una entrada por página virtual, creadas al inicio"""
+    
+    tipo = "lineal"
+    
+    def __init__(self, num_paginas: int):
+        super().__init__(num_paginas)
+        self.entradas: Dict[int, EntradaTablaPaginas] = {}
+        self._vaciar()
+    
+    def _vaciar(self):
+        self.entradas = {
+            i: EntradaTablaPaginas(i, tabla=self) for i in range(self.num_paginas)
+        }
+    
+    def _recorrer(self, num_pagina: int):
+        return self.entradas.get(num_pagina), 1
+    
+    def _asignar(self, num_pagina: int) -> EntradaTablaPaginas:
+        return self.entradas[num_pagina]
+    
+    def iterar_entradas(self):
+        return iter(self.entradas.values())
+    
+    def contar_entradas(self) -> int:
+        return len(self.entradas)
+    
+    def calcular_bytes(self) -> int:
+        return self.num_paginas * TAMANO_PTE
+
+class TablaPaginasMultinivel(TablaPaginasBase):
+    """
+    Tabla de páginas multinivel (radix) dispersa
+    
+    El número de página se divide en 'niveles' campos de bits; cada nivel
+    es un arreglo de 2^bits punteros que se crea al escribir la primera
+    página que cae en él. Una traducción lee un puntero por nivel (menos
+    si encuentra un nivel sin crear).
+    """
+    
+    tipo = "multinivel"
+    
+    def __init__(self, num_paginas: int, niveles: int = 2):
+        super().__init__(num_paginas)
+        if niveles < 1:
+            raise ValueError("La tabla multinivel necesita al menos un nivel")
+        self.niveles = niveles
+        bits_totales = max(1, (num_paginas - 1).bit_length())
+        base, resto = divmod(bits_totales, niveles)
+        # Los niveles superiores se quedan con los bits sobrantes
+        self.bits_nivel = [base + (1 if i < resto else 0) for i in range(niveles)]
+        self.desplazamientos = [sum(self.bits_nivel[i + 1:]) for i in range(niveles)]
+        self.mascaras = [(1 << bits) - 1 for bits in self.bits_nivel]
+        self._vaciar()
+    
+    def _vaciar(self):
+        self.raiz = [None] * (1 << self.bits_nivel[0])
+        self.tablas_por_nivel = [1] + [0] * (self.niveles - 1)
+        self.num_entradas = 0
+    
+    def _recorrer(self, num_pagina: int):
+        nodo = self.raiz
+        accesos = 0
+        for desplazamiento, mascara in zip(self.desplazamientos, self.mascaras):
+            accesos += 1
+            nodo = nodo[(num_pagina >> desplazamiento) & mascara]
+            if nodo is None:
+                return None, accesos
+        return nodo, accesos
+    
+    def _asignar(self, num_pagina: int) -> EntradaTablaPaginas:
+        nodo = self.raiz
+        ultimo = self.niveles - 1
+        for nivel in range(ultimo):
+            indice = (num_pagina >> self.desplazamientos[nivel]) & self.mascaras[nivel]
+            hijo = nodo[indice]
+            if hijo is None:
+                hijo = [None] * (1 << self.bits_nivel[nivel + 1])
+                nodo[indice] = hijo
+                self.tablas_por_nivel[nivel + 1] += 1
+            nodo = hijo
+        indice = (num_pagina >> self.desplazamientos[ultimo]) & self.mascaras[ultimo]
+        entrada = nodo[indice]
+        if entrada is None:
+            entrada = EntradaTablaPaginas(num_pagina, tabla=self)
+            nodo[indice] = entrada
+            self.num_entradas += 1
+        return entrada
+    
+    def iterar_entradas(self):
+        def recorrer(nodo, nivel):
+            for hijo in nodo:
+                if hijo is None:
+                    continue
+                if nivel == self.niveles - 1:
+                    yield hijo
+                else:
+                    yield from recorrer(hijo, nivel + 1)
+        return recorrer(self.raiz, 0)
+    
+    def contar_entradas(self) -> int:
+        return self.num_entradas
+    
+    def calcular_bytes(self) -> int:
+        return sum(tablas * (1 << bits) * TAMANO_PTE
+                   for tablas, bits in zip(self.tablas_por_nivel, self.bits_nivel))
+    
+    def obtener_costos(self) -> dict:
+        costos = super().obtener_costos()
+        costos['tablas_por_nivel'] = list(self.tablas_por_nivel)
+        return costos
+
+class TablaPaginasHash(TablaPaginasBase):
+    """
+    Tabla de páginas hash con encadenamiento
+    
+    Solo guarda las páginas presentes. Una traducción lee la cubeta y
+    recorre su cadena hasta encontrar el número de página.
+    """
+    
+    tipo = "hash"
+    
+    def __init__(self, num_paginas: int, num_cubetas: int = 1024):
+        super().__init__(num_paginas)
+        if num_cubetas < 1:
+            raise ValueError("La tabla hash necesita al menos una cubeta")
+        self.num_cubetas = num_cubetas
+        self._vaciar()
+    
+    def _vaciar(self):
+        self.cubetas = [[] for _ in range(self.num_cubetas)]
+        self.num_entradas = 0
+    
+    def _recorrer(self, num_pagina: int):
+        accesos = 1
+        for entrada in self.cubetas[dispersar(num_pagina, self.num_cubetas)]:
+            if entrada.numero_pagina == num_pagina:
+                return entrada, accesos
+            accesos += 1
+        return None, accesos
+    
+    def _asignar(self, num_pagina: int) -> EntradaTablaPaginas:
+        cadena = self.cubetas[dispersar(num_pagina, self.num_cubetas)]
+        for entrada in cadena:
+            if entrada.numero_pagina == num_pagina:
+                return entrada
+        entrada = EntradaTablaPaginas(num_pagina, tabla=self)
+        cadena.append(entrada)
+        self.num_entradas += 1
+        return entrada
+    
+    def _liberar(self, entrada: EntradaTablaPaginas):
+        cadena = self.cubetas[dispersar(entrada.numero_pagina, self.num_cubetas)]
+        if entrada in cadena:
+            cadena.remove(entrada)
+            self.num_entradas -= 1
+            self._referenciadas.discard(entrada.numero_pagina)
+    
+    def iterar_entradas(self):
+        entradas = [entrada for cadena in self.cubetas for entrada in cadena]
+        return iter(sorted(entradas, key=lambda entrada: entrada.numero_pagina))
+    
+    def contar_entradas(self) -> int:
+        return self.num_entradas
+    
+    def calcular_bytes(self) -> int:
+        return (self.num_cubetas * TAMANO_PUNTERO
+                + self.num_entradas * TAMANO_ENTRADA_HASH)
+    
+    def obtener_costos(self) -> dict:
+        costos = super().obtener_costos()
+        costos['cadena_maxima'] = max(map(len, self.cubetas), default=0)
+        return costos
+
+class TablaPaginasInvertida:
+    """
+    Tabla de páginas invertida, única para todo el sistema
+    
+    Tiene una entrada por marco físico (proceso, página) y una tabla de
+    anclas hash (proceso, página) -> primer marco de la cadena. Su tamaño
+    depende de la memoria física, no del espacio virtual. Cada proceso la
+    usa a través de para_proceso(), que da la interfaz de TablaPaginasBase.
+    """
+    
+    tipo = "invertida"
+    
+    def __init__(self, num_marcos: int, num_cubetas: Optional[int] = None):
+        self.num_marcos = num_marcos
+        self.num_cubetas = max(1, num_cubetas or num_marcos)
+        self.vistas: Dict[int, "VistaTablaInvertida"] = {}
+        self.resetear()
+    
+    def resetear(self):
+        """Descarta todas las traducciones"""
+        n = self.num_marcos
+        self.procesos = array('i', [-1]) * n
+        self.paginas = array('i', [-1]) * n
+        self.siguiente = array('i', [-1]) * n
+        self.anclas = array('i', [-1]) * self.num_cubetas
+        self.entradas = [None] * n
+        self.num_entradas = 0
+    
+    def para_proceso(self, proceso_id: int, num_paginas: int) -> "VistaTablaInvertida":
+        """Tabla de páginas del proceso sobre la tabla invertida compartida"""
+        vista = VistaTablaInvertida(self, proceso_id, num_paginas)
+        self.vistas[proceso_id] = vista
+        return vista
+    
+    def _cubeta(self, proceso_id: int, num_pagina: int) -> int:
+        return dispersar((proceso_id << 32) ^ num_pagina, self.num_cubetas)
+    
+    def buscar(self, proceso_id: int, num_pagina: int) -> Tuple[int, int]:
+        """Retorna (marco o -1, accesos): el ancla más un acceso por eslabón"""
+        marco = self.anclas[self._cubeta(proceso_id, num_pagina)]
+        accesos = 1
+        while marco >= 0:
+            accesos += 1
+            if self.procesos[marco] == proceso_id and self.paginas[marco] == num_pagina:
+                return marco, accesos
+            marco = self.siguiente[marco]
+        return -1, accesos
+    
+    def insertar(self, proceso_id: int, num_pagina: int, marco: int,
+                 entrada: EntradaTablaPaginas):
+        """Asocia el marco a la página (desplazando lo que hubiera en él)"""
+        self.quitar_marco(marco)
+        cubeta = self._cubeta(proceso_id, num_pagina)
+        self.procesos[marco] = proceso_id
+        self.paginas[marco] = num_pagina
+        self.siguiente[marco] = self.anclas[cubeta]
+        self.anclas[cubeta] = marco
+        self.entradas[marco] = entrada
+        self.num_entradas += 1
+    
+    def quitar_marco(self, marco: int):
+        """Quita la traducción guardada en el marco, si hay una"""
+        proceso_id = self.procesos[marco]
+        if proceso_id < 0:
+            return
+        cubeta = self._cubeta(proceso_id, self.paginas[marco])
+        actual = self.anclas[cubeta]
+        if actual == marco:
+            self.anclas[cubeta] = self.siguiente[marco]
+        else:
+            while actual >= 0 and self.siguiente[actual] != marco:
+                actual = self.siguiente[actual]
+            if actual >= 0:
+                self.siguiente[actual] = self.siguiente[marco]
+        self.procesos[marco] = -1
+        self.paginas[marco] = -1
+        self.siguiente[marco] = -1
+        self.entradas[marco] = None
+        self.num_entradas -= 1
+    
+    def calcular_bytes(self) -> int:
+        return (self.num_marcos * TAMANO_ENTRADA_INVERTIDA
+                + self.num_cubetas * TAMANO_PUNTERO)
+
+class VistaTablaInvertida(TablaPaginasBase):
+    """Tabla de páginas de un proceso respaldada por la tabla invertida"""
+    
+    tipo = "invertida"
+    
+    def __init__(self, invertida: TablaPaginasInvertida, proceso_id: int,
+                 num_paginas: int):
+        super().__init__(num_paginas)
+        self.invertida = invertida
+        self.proceso_id = proceso_id
+    
+    def _recorrer(self, num_pagina: int):
+        marco, accesos = self.invertida.buscar(self.proceso_id, num_pagina)
+        if marco < 0:
+            return None, accesos
+        return self.invertida.entradas[marco], accesos
+    
+    def _asignar(self, num_pagina: int) -> EntradaTablaPaginas:
+        # Las páginas no presentes no tienen lugar en la tabla invertida
+        entrada = self._recorrer(num_pagina)[0]
+        if entrada is None:
+            entrada = EntradaTablaPaginas(num_pagina, tabla=self)
+        return entrada
+    
+    def actualizar_entrada(self, num_pagina: int, marco: Optional[int], 
+                          presente: bool, modificada: bool = False):
+        """Actualiza una entrada de la tabla"""
+        if not 0 <= num_pagina < self.num_paginas:
+            return
+        actual, _ = self.invertida.buscar(self.proceso_id, num_pagina)
+        if actual >= 0 and (not presente or actual != marco):
+            self.invertida.quitar_marco(actual)
+            self._referenciadas.discard(num_pagina)
+        if presente and marco is not None:
+            entrada = self.invertida.entradas[marco] if actual == marco else None
+            if entrada is None:
+                entrada = EntradaTablaPaginas(num_pagina, marco, True, tabla=self)
+                self.invertida.insertar(self.proceso_id, num_pagina, marco, entrada)
+            entrada.modificada = modificada
+    
+    def iterar_entradas(self):
+        invertida = self.invertida
+        entradas = [invertida.entradas[marco] for marco in range(invertida.num_marcos)
+                    if invertida.procesos[marco] == self.proceso_id]
+        return iter(sorted(entradas, key=lambda entrada: entrada.numero_pagina))
+    
+    def contar_entradas(self) -> int:
+        return sum(1 for dueno in self.invertida.procesos if dueno == self.proceso_id)
+    
+    def calcular_bytes(self) -> int:
+        # La tabla es del sistema: se informa completa en cada proceso
+        return self.invertida.calcular_bytes()
+    
+    def _vaciar(self):
+        invertida = self.invertida
+        for marco in range(invertida.num_marcos):
+            if invertida.procesos[marco] == self.proceso_id:
+                invertida.quitar_marco(marco)
+    
+    def obtener_costos(self) -> dict:
+        costos = super().obtener_costos()
+        costos['compartida'] = True
+        return costos
+
+
+# Registro de tablas de páginas por proceso (nombre -> clase)
+TABLAS_PAGINAS = {
+    "lineal": TablaPaginas,
+    "multinivel": TablaPaginasMultinivel,
+    "hash": TablaPaginasHash
+}
+
+def crear_tabla_paginas(nombre: str, num_paginas: int, **opciones) -> TablaPaginasBase:
+    """
+    Crea la tabla de páginas de un proceso a partir de su nombre
+    
+    La tabla invertida es del sistema: se crea con TablaPaginasInvertida
+    y cada proceso obtiene la suya con para_proceso().
+    
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna tabla
+    """
+    clase = TABLAS_PAGINAS.get(nombre.lower())
+    if clase is None:
+        raise ValueError(
+            f"Tabla de páginas desconocida: {nombre} "
+            f"(disponibles: {', '.join(TABLAS_PAGINAS)})"
+        )
+    return clase(num_paginas, **opciones)
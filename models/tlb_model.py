@@ -0,0 +1,219 @@
+"""
+MODELO: TLB (Translation Lookaside Buffer)
+Caché de traducciones página -> marco consultada antes de la tabla de páginas
+"""
+
+import random
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
+
+REEMPLAZO_LRU = "LRU"
+REEMPLAZO_ALEATORIO = "RANDOM"
+REEMPLAZOS_TLB = (REEMPLAZO_LRU, REEMPLAZO_ALEATORIO)
+
+class ConjuntoTLB:
+    """
+    Un conjunto de la TLB (tantas vías como entradas admite)
+    
+    Las entradas se guardan en un OrderedDict ordenado por recencia, así
+    que buscar, insertar, quitar y elegir víctima LRU son O(1). Para el
+    reemplazo aleatorio se mantiene además una lista de claves con
+    eliminación por intercambio, también O(1).
+    """
+    
+    __slots__ = ('vias', 'entradas', 'claves', 'posiciones')
+    
+    def __init__(self, vias: int):
+        self.vias = vias
+        self.entradas: OrderedDict = OrderedDict()
+        self.claves = []
+        self.posiciones: Dict[Tuple[int, int], int] = {}
+    
+    def quitar(self, clave: Tuple[int, int]):
+        """Quita una clave del conjunto"""
+        del self.entradas[clave]
+        posicion = self.posiciones.pop(clave)
+        ultima = self.claves.pop()
+        if posicion < len(self.claves):
+            self.claves[posicion] = ultima
+            self.posiciones[ultima] = posicion
+    
+    def agregar(self, clave: Tuple[int, int], marco: int):
+        """Agrega una clave nueva (el conjunto debe tener lugar)"""
+        self.entradas[clave] = marco
+        self.posiciones[clave] = len(self.claves)
+        self.claves.append(clave)
+
+class TLB:
+    """
+    TLB asociativa por conjuntos
+    
+    Cada entrada se etiqueta con (proceso_id, num_pagina), de modo que sin
+    vaciado en los cambios de contexto se comporta como una TLB con ASID.
+    Se suscribe como observador de la memoria para invalidar la entrada de
+    un marco cuando su página se reemplaza o se libera.
+    """
+    
+    def __init__(self, num_entradas: int = 16, asociatividad: int = 0,
+                 reemplazo: str = REEMPLAZO_LRU,
+                 vaciar_en_cambio_contexto: bool = True,
+                 semilla: Optional[int] = None):
+        """
+        Args:
+            num_entradas: Capacidad total de la TLB
+            asociatividad: Vías por conjunto; 0 = totalmente asociativa
+            reemplazo: "LRU" o "RANDOM" dentro de cada conjunto
+            vaciar_en_cambio_contexto: Si es True, se vacía al cambiar de
+                proceso; si es False, conserva las entradas (ASID)
+            semilla: Semilla del reemplazo aleatorio
+        """
+        if num_entradas < 1:
+            raise ValueError("La TLB necesita al menos una entrada")
+        vias = asociatividad or num_entradas
+        if vias < 1 or num_entradas % vias:
+            raise ValueError(
+                "La asociatividad debe dividir al número de entradas de la TLB"
+            )
+        reemplazo = reemplazo.upper()
+        if reemplazo not in REEMPLAZOS_TLB:
+            raise ValueError(f"Reemplazo de TLB desconocido: {reemplazo}")
+        
+        self.num_entradas = num_entradas
+        self.vias = vias
+        self.num_conjuntos = num_entradas // vias
+        self.reemplazo = reemplazo
+        self.vaciar_en_cambio_contexto = vaciar_en_cambio_contexto
+        self.aleatorio = random.Random(semilla)
+        self.memoria = None
+        
+        self.conjuntos = [ConjuntoTLB(vias) for _ in range(self.num_conjuntos)]
+        self.por_marco: Dict[int, Tuple[int, int]] = {}
+        self.proceso_actual: Optional[int] = None
+        
+        # Estadísticas
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.vaciados = 0
+    
+    # ========== SEGUIMIENTO DE LA MEMORIA ==========
+    
+    def vincular(self, memoria):
+        """Se suscribe a la memoria para invalidar marcos reemplazados"""
+        if self.memoria is memoria:
+            return
+        self.desvincular()
+        self.memoria = memoria
+        memoria.agregar_observador(self)
+        self.vaciar()
+    
+    def desvincular(self):
+        """Deja de observar la memoria vinculada"""
+        if self.memoria is not None:
+            self.memoria.quitar_observador(self)
+            self.memoria = None
+    
+    def al_cargar(self, marco, pagina_anterior=None):
+        if pagina_anterior is not None:
+            self.invalidar_marco(marco.numero)
+    
+    def al_acceder(self, marco):
+        pass
+    
+    def al_liberar(self, marco, pagina_anterior):
+        self.invalidar_marco(marco.numero)
+    
+    def al_cambiar_bits(self, marco):
+        pass
+    
+    def al_limpiar_referencias(self):
+        pass
+    
+    # ========== OPERACIONES ==========
+    
+    def cambiar_contexto(self, proceso_id: int):
+        """Avisa qué proceso está en ejecución; vacía la TLB si corresponde"""
+        if proceso_id == self.proceso_actual:
+            return
+        if self.proceso_actual is not None and self.vaciar_en_cambio_contexto:
+            self.vaciar()
+        self.proceso_actual = proceso_id
+    
+    def buscar(self, proceso_id: int, num_pagina: int) -> int:
+        """Retorna el marco de la página, o -1 si no está en la TLB"""
+        clave = (proceso_id, num_pagina)
+        entradas = self.conjuntos[num_pagina % self.num_conjuntos].entradas
+        marco = entradas.get(clave)
+        if marco is None:
+            self.fallos += 1
+            return -1
+        self.aciertos += 1
+        if self.reemplazo == REEMPLAZO_LRU:
+            entradas.move_to_end(clave)
+        return marco
+    
+    def insertar(self, proceso_id: int, num_pagina: int, marco: int):
+        """Guarda una traducción, desalojando otra si el conjunto está lleno"""
+        clave = (proceso_id, num_pagina)
+        conjunto = self.conjuntos[num_pagina % self.num_conjuntos]
+        if clave in conjunto.entradas:
+            self.por_marco.pop(conjunto.entradas[clave], None)
+            conjunto.quitar(clave)
+        # Un marco tiene a lo sumo una traducción vigente
+        self.invalidar_marco(marco, contar=False)
+        if len(conjunto.entradas) >= conjunto.vias:
+            if self.reemplazo == REEMPLAZO_LRU:
+                victima = next(iter(conjunto.entradas))
+            else:
+                victima = conjunto.claves[
+                    self.aleatorio.randrange(len(conjunto.claves))
+                ]
+            self.por_marco.pop(conjunto.entradas[victima], None)
+            conjunto.quitar(victima)
+        conjunto.agregar(clave, marco)
+        self.por_marco[marco] = clave
+    
+    def invalidar_marco(self, marco: int, contar: bool = True):
+        """Quita la traducción que apunta al marco, si existe"""
+        clave = self.por_marco.pop(marco, None)
+        if clave is None:
+            return
+        self.conjuntos[clave[1] % self.num_conjuntos].quitar(clave)
+        if contar:
+            self.invalidaciones += 1
+    
+    def vaciar(self):
+        """Invalida todas las entradas"""
+        if not self.por_marco:
+            return
+        self.vaciados += 1
+        # Solo se tocan los conjuntos ocupados
+        for _, num_pagina in self.por_marco.values():
+            conjunto = self.conjuntos[num_pagina % self.num_conjuntos]
+            conjunto.entradas.clear()
+            conjunto.claves.clear()
+            conjunto.posiciones.clear()
+        self.por_marco = {}
+    
+    def obtener_estadisticas(self) -> dict:
+        """Aciertos, fallos y mantenimiento de la TLB"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': self.num_entradas,
+            'asociatividad': self.vias,
+            'reemplazo': self.reemplazo,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': (self.aciertos / consultas * 100) if consultas else 0.0,
+            'invalidaciones': self.invalidaciones,
+            'vaciados': self.vaciados
+        }
+    
+    def resetear(self):
+        """Vacía la TLB y sus contadores"""
+        self.vaciar()
+        self.proceso_actual = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.vaciados = 0
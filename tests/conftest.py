@@ -0,0 +1,51 @@
+"""
+Ayudas compartidas por las pruebas
+"""
+
+import pytest
+
+from models import Simulador, Proceso, FIFO
+from utils import parsear_referencia
+
+
+def secuencia_de(referencias):
+    """
+    Secuencia de accesos: una lista o arreglo se usa tal cual; un texto
+    como "0 1w 2" marca las escrituras con 'w' (ver parsear_referencia)
+    """
+    if isinstance(referencias, str):
+        return [parsear_referencia(referencia)
+                for referencia in referencias.split()]
+    return referencias
+
+
+def construir_simulador(num_marcos, *secuencias, algoritmo=None,
+                        num_paginas=4, prioridades=None, tabla=None,
+                        ejecutar=True, **opciones) -> Simulador:
+    """
+    Simulador con un proceso por secuencia (ids 1, 2, ...)
+
+    Args:
+        algoritmo: Algoritmo de reemplazo (por defecto, FIFO)
+        prioridades: id -> prioridad de los procesos
+        tabla: Función (id, num_paginas) -> tabla de páginas del proceso
+        ejecutar: Si es True, ejecuta la simulación completa
+        **opciones: Argumentos de Simulador (tlb, planificador, ...)
+    """
+    simulador = Simulador(num_marcos, algoritmo or FIFO(), **opciones)
+    for pid, referencias in enumerate(secuencias, start=1):
+        proceso = Proceso(
+            pid, num_paginas,
+            prioridad=(prioridades or {}).get(pid, 1),
+            tabla_paginas=None if tabla is None else tabla(pid, num_paginas)
+        )
+        proceso.establecer_secuencia(secuencia_de(referencias))
+        simulador.agregar_proceso(proceso)
+    if ejecutar:
+        simulador.ejecutar_todo()
+    return simulador
+
+
+@pytest.fixture
+def crear_simulador():
+    return construir_simulador
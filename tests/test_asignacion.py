@@ -0,0 +1,79 @@
+"""
+Pruebas: asignación de marcos y alcance del reemplazo
+"""
+
+from models import (LRU, FIFO, MemoriaFisica, crear_asignador,
+                    crear_planificador)
+
+
+def test_igualitaria_local_respeta_las_cuotas(crear_simulador):
+    asignador = crear_asignador("igualitaria")
+    simulador = crear_simulador(6, list(range(10)), list(range(10)),
+                                algoritmo=LRU(), num_paginas=16,
+                                asignador=asignador, alcance_reemplazo="local")
+
+    memoria = simulador.memoria
+    assert asignador.cuotas == {1: 3, 2: 3}
+    assert memoria.contar_marcos_del_proceso(1) == 3
+    assert memoria.contar_marcos_del_proceso(2) == 3
+
+
+def test_prioridad_reparte_mas_marcos_al_proceso_prioritario(crear_simulador):
+    asignador = crear_asignador("prioridad")
+    crear_simulador(6, [0], [0], algoritmo=LRU(), num_paginas=16,
+                    prioridades={1: 2, 2: 1}, asignador=asignador,
+                    alcance_reemplazo="local", ejecutar=False)
+
+    assert asignador.cuotas[1] == 4
+    assert asignador.cuotas[2] == 2
+
+
+def test_global_no_deja_a_otro_proceso_bajo_su_minimo(crear_simulador):
+    asignador = crear_asignador("igualitaria", minimo=2)
+    simulador = crear_simulador(
+        6, [0, 1] * 10, list(range(2, 16)) * 2, algoritmo=LRU(),
+        num_paginas=16, asignador=asignador, alcance_reemplazo="global",
+        planificador=crear_planificador("rr", quantum=10), ejecutar=False
+    )
+    memoria = simulador.memoria
+
+    # Sin cuotas, los turnos del proceso 2 (que recorre muchas páginas)
+    # desalojarían a todas las del 1; con ellas, el 1 conserva su mínimo
+    for _ in range(2):
+        simulador.ejecutar_paso()
+    while simulador.procesos[1].tiene_mas_accesos():
+        assert memoria.contar_marcos_del_proceso(1) >= 2
+        simulador.ejecutar_paso()
+    assert simulador.procesos[2].page_faults > 6
+
+
+def test_fifo_local_desaloja_la_carga_mas_antigua_del_proceso(crear_simulador):
+    algoritmo = FIFO()
+    simulador = crear_simulador(
+        4, [0, 1, 2], [0, 1, 0], algoritmo=algoritmo,
+        asignador=crear_asignador("igualitaria"), alcance_reemplazo="local",
+        planificador=crear_planificador("rr", quantum=1), ejecutar=False
+    )
+
+    eventos = simulador.ejecutar_todo()
+
+    # Cargas alternadas: marcos 0 y 2 del proceso 1, 1 y 3 del 2; la
+    # página 2 desaloja la carga más antigua del proceso 1 (marco 0)
+    assert [(evento.tipo, evento.marco) for evento in eventos] == [
+        ("CARGA", 0), ("CARGA", 1), ("CARGA", 2), ("CARGA", 3),
+        ("REEMPLAZO", 0), ("HIT", 1)
+    ]
+    assert list(algoritmo.cola_proceso[1]) == [2, 0]
+    assert list(algoritmo.cola) == [1, 2, 3, 0]
+
+
+def test_fifo_desempata_cargas_simultaneas_por_numero_de_marco():
+    memoria = MemoriaFisica(3)
+    algoritmo = FIFO()
+    algoritmo.vincular(memoria)
+    memoria.cargar(2, 1, 0, 5)
+    memoria.cargar(1, 1, 1, 5)
+    memoria.cargar(0, 2, 0, 7)
+
+    assert algoritmo.seleccionar_victima(memoria).numero == 1
+    assert algoritmo.seleccionar_victima(memoria, 2).numero == 0
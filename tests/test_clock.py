@@ -0,0 +1,64 @@
+"""
+Pruebas: CLOCK con manecilla persistente
+"""
+
+from models import CLOCK, crear_asignador, crear_planificador
+
+
+def test_manecilla_y_avances_calculados_a_mano(crear_simulador):
+    algoritmo = CLOCK()
+    simulador = crear_simulador(3, [0, 1, 2, 0, 3, 4, 3, 0, 5],
+                                algoritmo=algoritmo, num_paginas=6,
+                                ejecutar=False)
+
+    eventos = simulador.ejecutar_todo()
+
+    # Las cargas por demanda entran sin bit R. t5: la manecilla limpia el
+    # marco 0 (la 0 se usó en t4) y elige el 1; t6: elige el 2; t9: limpia
+    # los marcos 0 y 1 (aciertos en t7 y t8) y elige el 2 otra vez
+    assert [(evento.tipo, evento.marco) for evento in eventos] == [
+        ("CARGA", 0), ("CARGA", 1), ("CARGA", 2), ("HIT", 0),
+        ("REEMPLAZO", 1), ("REEMPLAZO", 2), ("HIT", 1), ("HIT", 0),
+        ("REEMPLAZO", 2)
+    ]
+    assert algoritmo.puntero == 0
+    assert algoritmo.obtener_estadisticas() == {
+        'fallos_atendidos': 3,
+        'avances_totales': 6,
+        'avances_ultimo_fallo': 3,
+        'avances_por_fallo': 2.0
+    }
+
+
+def test_vuelta_completa_con_todos_los_bits_r(crear_simulador):
+    algoritmo = CLOCK()
+    simulador = crear_simulador(3, [0, 1, 2, 0, 1, 2, 3],
+                                algoritmo=algoritmo, ejecutar=False)
+
+    eventos = simulador.ejecutar_todo()
+
+    # La manecilla limpia los tres marcos y vuelve a elegir el 0
+    assert (eventos[-1].tipo, eventos[-1].marco) == ("REEMPLAZO", 0)
+    assert algoritmo.avances_ultimo_fallo == 4
+    assert algoritmo.puntero == 1
+
+
+def test_manecilla_por_proceso_en_reemplazo_local(crear_simulador):
+    algoritmo = CLOCK(manecilla_por_proceso=True)
+    simulador = crear_simulador(
+        4, [0, 1, 0, 2], [0, 1, 1, 2], algoritmo=algoritmo,
+        asignador=crear_asignador("igualitaria"), alcance_reemplazo="local",
+        planificador=crear_planificador("rr", quantum=1), ejecutar=False
+    )
+
+    eventos = simulador.ejecutar_todo()
+
+    # Anillos {0, 2} y {1, 3}: el proceso 1 limpia el marco 0 y elige el
+    # 2; el 2 elige el 1 sin avanzar más (la 0 no volvió a usarse)
+    assert [(evento.tipo, evento.marco) for evento in eventos] == [
+        ("CARGA", 0), ("CARGA", 1), ("CARGA", 2), ("CARGA", 3),
+        ("HIT", 0), ("HIT", 3), ("REEMPLAZO", 2), ("REEMPLAZO", 1)
+    ]
+    assert algoritmo.avances_totales == 3
+    assert algoritmo.anillos[1]['mano'] == 0
+    assert algoritmo.puntero == 0
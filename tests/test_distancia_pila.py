@@ -0,0 +1,30 @@
+"""
+Pruebas: curvas de fallos en una pasada contra la simulación completa
+"""
+
+import random
+
+import pytest
+
+from models import crear_algoritmo, calcular_curva_fallos
+
+
+@pytest.mark.parametrize("algoritmo", ["LRU", "OPT"])
+def test_curva_coincide_con_la_simulacion(algoritmo, crear_simulador):
+    azar = random.Random(7)
+    secuencia = [azar.randrange(10) for _ in range(300)]
+
+    curva = calcular_curva_fallos(secuencia, algoritmo, 10)
+
+    assert curva == [
+        crear_simulador(marcos, secuencia, algoritmo=crear_algoritmo(algoritmo),
+                        num_paginas=10).procesos[1].page_faults
+        for marcos in range(1, 11)
+    ]
+
+
+def test_curva_opt_acotada_a_max_marcos():
+    secuencia = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+
+    assert calcular_curva_fallos(secuencia, "OPT", 3) == [12, 9, 7]
+    assert calcular_curva_fallos(secuencia, "OPT", 4)[:3] == [12, 9, 7]
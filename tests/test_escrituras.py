@@ -0,0 +1,37 @@
+"""
+Pruebas: referencias de escritura, bit M y write-backs
+"""
+
+import numpy as np
+
+from models.memoria_model import BIT_MODIFICADO
+from models.proceso_model import BIT_ESCRITURA
+
+
+def test_fallo_de_escritura_deja_la_pagina_modificada(crear_simulador):
+    simulador = crear_simulador(2, "0w")
+
+    assert simulador.procesos[1].tabla_paginas.obtener_entrada(0).modificada
+    assert simulador.memoria.bits[0] & BIT_MODIFICADO
+
+
+def test_fallo_de_escritura_y_desalojo_cuenta_write_back(crear_simulador):
+    simulador = crear_simulador(1, "0w 1 0")
+
+    assert simulador.procesos[1].escrituras == 1
+    assert simulador.obtener_estadisticas()["write_backs"] == 1
+
+
+def test_pagina_solo_leida_no_se_escribe(crear_simulador):
+    simulador = crear_simulador(1, "0 1 0")
+
+    assert simulador.obtener_estadisticas()["write_backs"] == 0
+
+
+def test_secuencia_numpy_int32_con_escrituras(crear_simulador):
+    referencias = np.array([0 | BIT_ESCRITURA, 1, 0], dtype=np.uint32)
+    simulador = crear_simulador(1, referencias.view(np.int32))
+
+    assert simulador.procesos[1].escrituras == 1
+    assert simulador.procesos[1].page_faults == 3
+    assert simulador.obtener_estadisticas()["write_backs"] == 1
@@ -0,0 +1,37 @@
+"""
+Pruebas: modos de registro de eventos del simulador
+"""
+
+from models import (EventoSimulacion, RegistroEventos, MODO_COLUMNAR,
+                    MODO_CONTADORES)
+
+
+def test_ejecutar_todo_retorna_lista_de_eventos_por_defecto(crear_simulador):
+    eventos = crear_simulador(2, [0, 1, 0, 2], ejecutar=False).ejecutar_todo()
+
+    assert isinstance(eventos, list)
+    assert all(isinstance(evento, EventoSimulacion) for evento in eventos)
+    assert [evento.tipo for evento in eventos] == [
+        "CARGA", "CARGA", "HIT", "REEMPLAZO"
+    ]
+
+
+def test_modo_columnar_guarda_los_mismos_eventos(crear_simulador):
+    simulador = crear_simulador(2, [0, 1, 0, 2], modo_eventos=MODO_COLUMNAR,
+                                ejecutar=False)
+
+    registro = simulador.ejecutar_todo()
+
+    assert isinstance(registro, RegistroEventos)
+    assert [evento.tipo for evento in registro] == [
+        "CARGA", "CARGA", "HIT", "REEMPLAZO"
+    ]
+    assert registro[3].mensaje
+
+
+def test_modo_contadores_solo_cuenta(crear_simulador):
+    simulador = crear_simulador(2, [0, 1, 0, 2], modo_eventos=MODO_CONTADORES,
+                                ejecutar=False)
+
+    assert simulador.ejecutar_todo() == []
+    assert sum(simulador.conteo_eventos) == 4
@@ -0,0 +1,53 @@
+"""
+Pruebas: LRU con listas de recencia
+"""
+
+from models import LRU, MemoriaFisica
+
+
+def test_victimas_de_una_secuencia_calculada_a_mano(crear_simulador):
+    algoritmo = LRU()
+    simulador = crear_simulador(3, [0, 1, 2, 0, 3, 1, 4, 0], algoritmo=algoritmo,
+                                num_paginas=5, ejecutar=False)
+
+    eventos = simulador.ejecutar_todo()
+
+    # t5: la página 3 desaloja a la 1 (último uso t2; la 0 se usó en t4);
+    # t6: la 1 desaloja a la 2 (t3); t7: la 4 a la 0 (t4); t8: la 0 a la 3
+    assert [(evento.tipo, evento.marco) for evento in eventos] == [
+        ("CARGA", 0), ("CARGA", 1), ("CARGA", 2), ("HIT", 0),
+        ("REEMPLAZO", 1), ("REEMPLAZO", 2), ("REEMPLAZO", 0),
+        ("REEMPLAZO", 1)
+    ]
+    assert simulador.procesos[1].page_faults == 7
+    # Recencia final: 2 (t6, página 1), 0 (t7, página 4), 1 (t8, página 0)
+    assert list(algoritmo.recientes) == [2, 0, 1]
+
+
+def test_empate_en_el_ultimo_acceso_lo_gana_el_marco_menor():
+    memoria = MemoriaFisica(3)
+    algoritmo = LRU()
+    algoritmo.vincular(memoria)
+    memoria.cargar(2, 1, 0, 3)
+    memoria.cargar(0, 1, 1, 3)
+    memoria.cargar(1, 2, 0, 4)
+
+    assert list(algoritmo.recientes) == [0, 2, 1]
+    assert algoritmo.seleccionar_victima(memoria).numero == 0
+
+    memoria.acceder(0, 5)
+
+    assert algoritmo.seleccionar_victima(memoria).numero == 2
+    assert algoritmo.seleccionar_victima(memoria, 1).numero == 2
+    assert algoritmo.seleccionar_victima(memoria, 2).numero == 1
+
+
+def test_preferir_limpias_salta_la_menos_reciente_modificada():
+    memoria = MemoriaFisica(3)
+    algoritmo = LRU(preferir_limpias=True)
+    algoritmo.vincular(memoria)
+    memoria.cargar(0, 1, 0, 1, modificada=True)
+    memoria.cargar(1, 1, 1, 2)
+    memoria.cargar(2, 1, 2, 3)
+
+    assert algoritmo.seleccionar_victima(memoria).numero == 1
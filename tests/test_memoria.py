@@ -0,0 +1,71 @@
+"""
+Pruebas: tabla de marcos por columnas y vistas Marco
+"""
+
+import pytest
+
+from models import MemoriaFisica
+from models.memoria_model import (SIN_PROCESO, BIT_REFERENCIADO,
+                                  BIT_MODIFICADO, Marco, Pagina)
+
+
+def test_columnas_tras_cargar_acceder_y_liberar():
+    memoria = MemoriaFisica(3)
+    memoria.cargar(1, 7, 4, 10)
+    memoria.acceder(1, 12, escritura=True)
+    memoria.cargar(0, 8, 2, 11, referenciada=True)
+    memoria.liberar(0)
+
+    assert list(memoria.procesos) == [SIN_PROCESO, 7, SIN_PROCESO]
+    assert list(memoria.paginas) == [-1, 4, -1]
+    assert list(memoria.tiempos_carga) == [0, 10, 0]
+    assert list(memoria.tiempos_acceso) == [0, 12, 0]
+    assert list(memoria.bits) == [0, BIT_REFERENCIADO | BIT_MODIFICADO, 0]
+    assert memoria.buscar_marco(7, 4) == 1
+    assert memoria.buscar_marco(8, 2) == -1
+    assert memoria.contar_marcos_ocupados() == 1
+    assert memoria.contar_marcos_del_proceso(8) == 0
+    # El marco liberado vuelve a ser el primero libre
+    assert memoria.buscar_marco_libre() == 0
+
+
+def test_la_vista_marco_lee_y_escribe_la_fila():
+    memoria = MemoriaFisica(2)
+    memoria.cargar(1, 3, 5, 6)
+    marco = memoria.marcos[-1]
+
+    assert marco == Marco(1, memoria)
+    assert hash(marco) == hash(memoria.marcos[1])
+    assert marco.obtener_info() == {
+        'numero': 1, 'libre': False, 'proceso_id': 3, 'num_pagina': 5,
+        'tiempo_carga': 6, 'tiempo_acceso': 6
+    }
+
+    marco.pagina.modificada = True
+    assert memoria.bits[1] == BIT_MODIFICADO
+
+    memoria.bits[1] = BIT_REFERENCIADO
+    assert marco.pagina.referenciada and not marco.pagina.modificada
+
+    marco.liberar()
+    assert marco.esta_libre()
+    assert marco.pagina is None and marco.proceso_id is None
+
+
+def test_cargar_pagina_desde_la_vista_reemplaza_la_anterior():
+    memoria = MemoriaFisica(1)
+    memoria.cargar(0, 1, 0, 1)
+    memoria.marcos[0].cargar_pagina(Pagina(3, 2, modificada=True), 4)
+
+    assert memoria.buscar_marco(1, 0) == -1
+    assert memoria.buscar_marco(2, 3) == 0
+    assert memoria.residentes == {1: 0, 2: 1}
+    assert memoria.bits[0] == BIT_MODIFICADO
+
+
+def test_vista_de_marcos_con_cortes_y_fuera_de_rango():
+    memoria = MemoriaFisica(2)
+
+    assert [marco.numero for marco in memoria.marcos[::-1]] == [1, 0]
+    with pytest.raises(IndexError):
+        memoria.marcos[2]
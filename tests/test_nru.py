@@ -0,0 +1,44 @@
+"""
+Pruebas: NRU por clases con reemplazo local y global
+"""
+
+from models import NRU, crear_asignador, crear_planificador
+from models.memoria_model import BIT_MODIFICADO
+
+
+def test_cubetas_recreadas_durante_la_busqueda(crear_simulador):
+    algoritmo = NRU()
+    simulador = crear_simulador(2, "0r 0r", "0r", algoritmo=algoritmo,
+                                num_paginas=3, alcance_reemplazo="global")
+
+    # Bits cambiados sin notificación (p. ej. por otro algoritmo): al
+    # reubicar el único marco del proceso se recrean sus cubetas
+    simulador.memoria.bits[0] = BIT_MODIFICADO
+
+    assert algoritmo.seleccionar_victima(simulador.memoria, 1).numero == 0
+
+
+def test_reemplazo_global_con_cuotas_y_turnos(crear_simulador):
+    simulador = crear_simulador(
+        2, "0r 1w 0w 2r 1r 2r", "0r 1r 1r 1r 1r 0w", algoritmo=NRU(),
+        num_paginas=3, asignador=crear_asignador("igualitaria"),
+        alcance_reemplazo="global",
+        planificador=crear_planificador("rr", quantum=1)
+    )
+
+    assert simulador.obtener_estadisticas()["accesos_totales"] == 12
+
+
+def test_cambio_de_bits_desde_la_tabla_reubica_el_marco(crear_simulador):
+    algoritmo = NRU()
+    simulador = crear_simulador(2, "0w 1r 0r 1r", algoritmo=algoritmo,
+                                num_paginas=3)
+    nuevo = simulador.procesos[1]
+
+    # La página 0 (clase 3) pasa a la clase 0 sin acceder al marco; la
+    # página 1 sigue en la clase 2
+    entrada = nuevo.tabla_paginas.obtener_entrada(0)
+    entrada.referenciada = False
+    entrada.modificada = False
+
+    assert algoritmo.seleccionar_victima(simulador.memoria).numero == 0
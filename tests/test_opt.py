@@ -0,0 +1,53 @@
+"""
+Pruebas: OPT con índice de próximo uso y montículos
+"""
+
+from models import OPT, crear_planificador
+
+SECUENCIA = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+
+
+def test_siguiente_aparicion_de_cada_posicion():
+    algoritmo = OPT()
+    algoritmo.establecer_secuencia(SECUENCIA, proceso_id=1)
+
+    assert list(algoritmo.siguientes[1]) == [4, 5, 9, 10, 7, 8, 11,
+                                             -1, -1, -1, -1, -1]
+    assert algoritmo.proximas[1] == {1: 0, 2: 1, 3: 2, 4: 3, 5: 6}
+
+
+def test_victimas_de_una_secuencia_calculada_a_mano(crear_simulador):
+    simulador = crear_simulador(3, SECUENCIA, algoritmo=OPT(), num_paginas=6,
+                                ejecutar=False)
+
+    eventos = simulador.ejecutar_todo()
+
+    # t4: la 4 desaloja a la 3 (próximo uso en la posición 9, la más
+    # lejana); t7: la 5 a la 4 (posición 10). En t10 y t11 las páginas 1
+    # y 2 (o 3 y 2) no vuelven a usarse: el empate lo gana el marco 0
+    assert [(evento.tipo, evento.marco) for evento in eventos] == [
+        ("CARGA", 0), ("CARGA", 1), ("CARGA", 2), ("REEMPLAZO", 2),
+        ("HIT", 0), ("HIT", 1), ("REEMPLAZO", 2), ("HIT", 0), ("HIT", 1),
+        ("REEMPLAZO", 0), ("REEMPLAZO", 0), ("HIT", 2)
+    ]
+    assert simulador.procesos[1].page_faults == 7
+
+
+def test_reemplazo_local_usa_el_monticulo_del_proceso(crear_simulador):
+    algoritmo = OPT()
+    simulador = crear_simulador(
+        4, [0, 1, 0, 1], [0, 1, 1, 0], algoritmo=algoritmo,
+        planificador=crear_planificador("rr", quantum=1), ejecutar=False
+    )
+    for _ in range(4):
+        simulador.ejecutar_paso()
+
+    # Tras las cuatro cargas alternadas, el proceso 1 usa antes la 0 (posición 2)
+    # que la 1 (posición 3); el proceso 2, antes la 1 que la 0
+    marcos_1 = {simulador.memoria.buscar_marco(1, pagina): pagina
+                for pagina in (0, 1)}
+    marcos_2 = {simulador.memoria.buscar_marco(2, pagina): pagina
+                for pagina in (0, 1)}
+    memoria = simulador.memoria
+    assert marcos_1[algoritmo.seleccionar_victima(memoria, 1).numero] == 1
+    assert marcos_2[algoritmo.seleccionar_victima(memoria, 2).numero] == 0
@@ -0,0 +1,41 @@
+"""
+Pruebas: planificación de varios procesos
+"""
+
+from models import crear_planificador
+
+
+def orden_de(eventos):
+    return [evento.proceso_id for evento in eventos]
+
+
+def test_secuencial_ejecuta_cada_proceso_completo(crear_simulador):
+    simulador = crear_simulador(8, [0, 1], [0, 1], num_paginas=8,
+                                planificador=crear_planificador("secuencial"),
+                                ejecutar=False)
+
+    assert orden_de(simulador.ejecutar_todo()) == [1, 1, 2, 2]
+
+
+def test_round_robin_rota_cada_quantum(crear_simulador):
+    simulador = crear_simulador(8, [0, 1, 2], [0, 1, 2], num_paginas=8,
+                                planificador=crear_planificador("rr", quantum=2),
+                                ejecutar=False)
+
+    assert orden_de(simulador.ejecutar_todo()) == [1, 1, 2, 2, 1, 2]
+    assert simulador.planificador.cambios_contexto == 3
+
+
+def test_aleatorio_es_reproducible_con_semilla(crear_simulador):
+    secuencias = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 2, 4, 6]]
+
+    primero, segundo = (
+        orden_de(crear_simulador(
+            8, *secuencias, num_paginas=8, ejecutar=False,
+            planificador=crear_planificador("aleatorio", semilla=5)
+        ).ejecutar_todo())
+        for _ in range(2)
+    )
+
+    assert primero == segundo
+    assert sorted(primero) == [1] * 4 + [2] * 4 + [3] * 4
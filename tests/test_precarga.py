@@ -0,0 +1,29 @@
+"""
+Pruebas: precarga de páginas y bit de referencia
+"""
+
+from models import CLOCK, MemoriaFisica, crear_precarga
+from models.memoria_model import BIT_REFERENCIADO
+
+
+def test_pagina_precargada_entra_sin_bit_r(crear_simulador):
+    simulador = crear_simulador(
+        8, [0], algoritmo=CLOCK(), num_paginas=8,
+        precarga=crear_precarga("secuencial", ventana=2)
+    )
+
+    memoria = simulador.memoria
+    for pagina in (1, 2):
+        marco = memoria.buscar_marco(1, pagina)
+        assert marco >= 0
+        assert not memoria.bits[marco] & BIT_REFERENCIADO
+    assert simulador.precarga.precargadas == 2
+
+
+def test_carga_referenciada_se_limpia_en_la_interrupcion_de_reloj():
+    memoria = MemoriaFisica(2)
+    memoria.cargar(0, 1, 0, 0, referenciada=True)
+
+    memoria.limpiar_bits_referencia()
+
+    assert not memoria.bits[0] & BIT_REFERENCIADO
@@ -0,0 +1,50 @@
+"""
+Pruebas: tablas de páginas intercambiables
+"""
+
+import pytest
+
+from models import TablaPaginasInvertida, crear_tabla_paginas
+
+
+def fabrica_de_tablas(nombre):
+    """Función (id, num_paginas) -> tabla del tipo indicado"""
+    if nombre == "invertida":
+        return TablaPaginasInvertida(4).para_proceso
+    return lambda _, num_paginas: crear_tabla_paginas(nombre, num_paginas)
+
+
+@pytest.mark.parametrize("nombre", ["lineal", "multinivel", "hash",
+                                    "invertida"])
+def test_traduccion_tras_cargar_y_desalojar(nombre, crear_simulador):
+    simulador = crear_simulador(2, [3, 40, 3, 63, 40], num_paginas=64,
+                                tabla=fabrica_de_tablas(nombre))
+    proceso = simulador.procesos[1]
+
+    paginas = proceso.tabla_paginas
+    assert proceso.page_faults == 3
+    assert paginas.traducir(3) == -1
+    assert paginas.traducir(63) == simulador.memoria.buscar_marco(1, 63)
+    assert paginas.traducir(40) == simulador.memoria.buscar_marco(1, 40)
+
+
+@pytest.mark.parametrize("nombre", ["lineal", "multinivel", "hash",
+                                    "invertida"])
+def test_pagina_fuera_del_espacio_virtual_es_un_fallo(nombre):
+    paginas = fabrica_de_tablas(nombre)(1, 8)
+
+    assert paginas.traducir(8) == -1
+    assert paginas.traducir(-1) == -1
+
+
+def test_referencia_fuera_del_espacio_virtual_se_rechaza(crear_simulador):
+    simulador = crear_simulador(4, [0, 5, 5, 5], ejecutar=False)
+
+    simulador.ejecutar_paso()
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            simulador.ejecutar_paso()
+
+    # La página 5 no llegó a cargarse: no hay copias en memoria
+    assert simulador.memoria.buscar_marco(1, 5) == -1
+    assert simulador.memoria.contar_marcos_del_proceso(1) == 1
@@ -0,0 +1,19 @@
+"""
+Pruebas: TLB delante de la tabla de páginas
+"""
+
+from models import TLB
+
+
+def test_aciertos_e_invalidacion_al_reemplazar(crear_simulador):
+    tlb = TLB(4)
+    # 0 y 1 se cargan; 0 acierta en la TLB; 2 desaloja a 0, que vuelve
+    # a fallar aunque la TLB la tenía
+    simulador = crear_simulador(2, [0, 1, 0, 2, 0], tlb=tlb)
+    proceso = simulador.procesos[1]
+
+    assert proceso.page_faults == 4
+    assert tlb.aciertos == 1
+    assert tlb.invalidaciones >= 1
+    assert tlb.buscar(1, 1) < 0
+    assert tlb.buscar(1, 0) == simulador.memoria.buscar_marco(1, 0)
@@ -4,8 +4,24 @@ utils/__init__.py
 
 from .helpers import generar_color_aleatorio, formatear_secuencia
 from .json_manager import guardar_escenario, cargar_escenario
+from .trace_manager import (EXTENSION_BINARIA, parsear_referencia,
+                            formatear_referencia, parsear_traza, cargar_traza,
+                            iterar_traza, mapear_traza_binaria,
+                            es_traza_binaria, guardar_traza_binaria,
+                            cargar_traza_binaria)
+from .direcciones_manager import (EXTENSION_DIRECCIONES, FORMATOS_DIRECCIONES,
+                                  descomponer_direcciones, parsear_direcciones,
+                                  iterar_bloques_direcciones,
+                                  cargar_traza_direcciones)
 
 __all__ = [
     'generar_color_aleatorio', 'formatear_secuencia',
-    'guardar_escenario', 'cargar_escenario'
+    'guardar_escenario', 'cargar_escenario',
+    'parsear_referencia', 'formatear_referencia',
+    'parsear_traza', 'cargar_traza', 'iterar_traza', 'mapear_traza_binaria',
+    'es_traza_binaria', 'guardar_traza_binaria', 'cargar_traza_binaria',
+    'EXTENSION_BINARIA',
+    'EXTENSION_DIRECCIONES', 'FORMATOS_DIRECCIONES', 'descomponer_direcciones',
+    'parsear_direcciones', 'iterar_bloques_direcciones',
+    'cargar_traza_direcciones'
 ]
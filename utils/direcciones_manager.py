@@ -0,0 +1,239 @@
+"""
+Trazas de direcciones virtuales (bytes) en lugar de números de página
+
+Formatos:
+    texto: direcciones separadas por comas, espacios o saltos de línea,
+        en hexadecimal (con o sin "0x") o decimal, con sufijo opcional
+        r/w como en las trazas de páginas; '#' inicia un comentario
+    u32 / u64: arreglo crudo de direcciones little-endian
+
+Todo el procesamiento es vectorizado con NumPy sobre bloques del archivo:
+ni el análisis del texto ni la división en página y desplazamiento
+recorren las direcciones una por una en Python.
+"""
+
+import numpy as np
+
+from models.proceso_model import BIT_ESCRITURA
+
+EXTENSION_DIRECCIONES = ".addr"
+FORMATOS_DIRECCIONES = ("texto", "u32", "u64")
+_BLOQUE_BYTES = 1 << 24
+_BLOQUE_DIRECCIONES = 1 << 22
+_SEPARADORES = b" \t\r\n,rR"
+
+def _tabla_digitos(base: int) -> np.ndarray:
+    """Valor de cada byte como dígito de la base (-1 si no lo es)"""
+    tabla = np.full(256, -1, dtype=np.int8)
+    tabla[ord("0"):ord("9") + 1] = np.arange(10)
+    if base == 16:
+        tabla[ord("a"):ord("f") + 1] = np.arange(10, 16)
+        tabla[ord("A"):ord("F") + 1] = np.arange(10, 16)
+    return tabla
+
+def _tabla_permitidos(base: int) -> np.ndarray:
+    """Bytes válidos fuera de los comentarios"""
+    tabla = _tabla_digitos(base) >= 0
+    tabla[np.frombuffer(_SEPARADORES + b"wW#", dtype=np.uint8)] = True
+    if base == 16:
+        tabla[[ord("x"), ord("X")]] = True
+    return tabla
+
+def descomponer_direcciones(direcciones: np.ndarray,
+                            tamano_pagina: int = 4096) -> tuple:
+    """
+    Divide direcciones virtuales en número de página y desplazamiento
+    
+    Returns:
+        (páginas, desplazamientos) como arreglos uint64
+    
+    Raises:
+        ValueError: Si el tamaño de página no es una potencia de 2
+    """
+    if tamano_pagina <= 0 or tamano_pagina & (tamano_pagina - 1):
+        raise ValueError("El tamaño de página debe ser una potencia de 2")
+    direcciones = np.asarray(direcciones, dtype=np.uint64)
+    bits = np.uint64(tamano_pagina.bit_length() - 1)
+    return (direcciones >> bits,
+            direcciones & np.uint64(tamano_pagina - 1))
+
+def parsear_direcciones(datos: bytes, base: int = 16) -> tuple:
+    """
+    Analiza un bloque de texto completo (sin cortar tokens)
+    
+    Returns:
+        (direcciones uint64, escrituras bool) con un elemento por token
+    
+    Raises:
+        ValueError: Si el texto tiene caracteres que no son direcciones
+    """
+    if base not in (10, 16):
+        raise ValueError("La base debe ser 10 o 16")
+    texto = np.frombuffer(datos, dtype=np.uint8)
+    if not len(texto):
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=bool)
+    
+    # Lo que sigue a '#' hasta el fin de línea es comentario
+    if b"#" in datos:
+        almohadillas = np.cumsum(texto == ord("#"), dtype=np.int32)
+        inicio_linea = np.where(texto == ord("\n"), almohadillas, 0)
+        np.maximum.accumulate(inicio_linea, out=inicio_linea)
+        codigo = almohadillas <= inicio_linea
+    else:
+        codigo = np.ones(len(texto), dtype=bool)
+    
+    invalidos = ~_tabla_permitidos(base)[texto] & codigo
+    if invalidos.any():
+        posicion = int(np.flatnonzero(invalidos)[0])
+        raise ValueError(
+            f"Carácter inválido en la traza de direcciones: "
+            f"{chr(texto[posicion])!r} (byte {posicion})"
+        )
+    
+    valores = _tabla_digitos(base)[texto]
+    valores[~codigo] = -1
+    if base == 16:
+        # El prefijo "0x" no forma parte del número
+        equis = np.flatnonzero(((texto == ord("x")) | (texto == ord("X")))
+                               & codigo)
+        valores[equis[equis > 0] - 1] = -1
+    
+    digito = valores >= 0
+    anterior = np.concatenate(([False], digito[:-1]))
+    siguiente = np.concatenate((digito[1:], [False]))
+    inicios = np.flatnonzero(digito & ~anterior)
+    finales = np.flatnonzero(digito & ~siguiente)
+    if not len(inicios):
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=bool)
+    
+    # Cada dígito aporta valor × base^(distancia al final del token)
+    posiciones = np.flatnonzero(digito)
+    largos = finales - inicios + 1
+    exponente = (np.repeat(finales, largos) - posiciones).astype(np.uint64)
+    cifras = valores[posiciones].astype(np.uint64)
+    if base == 16:
+        aportes = cifras << (exponente * np.uint64(4))
+    else:
+        aportes = cifras * np.uint64(10) ** exponente
+    primeros = np.cumsum(largos) - largos
+    direcciones = np.add.reduceat(aportes, primeros, dtype=np.uint64)
+    
+    # Un sufijo 'w' pegado al token marca una escritura
+    escrituras = np.zeros(len(inicios), dtype=bool)
+    sufijos = np.flatnonzero(((texto == ord("w")) | (texto == ord("W")))
+                             & codigo)
+    sufijos = sufijos[sufijos > 0]
+    sufijos = sufijos[digito[sufijos - 1]]
+    escrituras[np.searchsorted(finales, sufijos - 1)] = True
+    return direcciones, escrituras
+
+def iterar_bloques_direcciones(ruta, formato: str = "texto", base: int = 16):
+    """
+    Recorre una traza de direcciones por bloques
+    
+    Yields:
+        (direcciones uint64, escrituras bool o None si el formato no las marca)
+    """
+    if formato == "texto":
+        with open(ruta, "rb") as f:
+            resto = b""
+            while True:
+                bloque = f.read(_BLOQUE_BYTES)
+                if not bloque:
+                    break
+                datos = resto + bloque
+                # Corta en el último salto de línea para no partir tokens
+                # ni comentarios
+                corte = datos.rfind(b"\n") + 1
+                resto = datos[corte:]
+                if corte:
+                    yield parsear_direcciones(datos[:corte], base)
+            if resto:
+                yield parsear_direcciones(resto, base)
+    elif formato in ("u32", "u64"):
+        tipo = np.dtype("<u4" if formato == "u32" else "<u8")
+        direcciones = np.memmap(ruta, dtype=tipo, mode="r")
+        for inicio in range(0, len(direcciones), _BLOQUE_DIRECCIONES):
+            yield direcciones[inicio:inicio + _BLOQUE_DIRECCIONES], None
+    else:
+        raise ValueError(
+            f"Formato de direcciones desconocido: {formato} "
+            f"(disponibles: {', '.join(FORMATOS_DIRECCIONES)})"
+        )
+
+def _renumerar(paginas: np.ndarray, unicas: np.ndarray) -> np.ndarray:
+    """Índice de cada página en 'unicas' (ordenado), como uint32"""
+    minima = unicas[0]
+    rango = int(unicas[-1] - minima) + 1
+    if rango <= max(4 * len(unicas), _BLOQUE_DIRECCIONES):
+        # Huella densa: una tabla directa evita la búsqueda binaria
+        tabla = np.zeros(rango, dtype=np.uint32)
+        tabla[unicas - minima] = np.arange(len(unicas), dtype=np.uint32)
+        return tabla[paginas - minima]
+    return np.searchsorted(unicas, paginas).astype(np.uint32)
+
+def cargar_traza_direcciones(ruta, tamano_pagina: int = 4096,
+                             formato: str = "texto", base: int = 16,
+                             compactar: bool = True) -> dict:
+    """
+    Carga una traza de direcciones como escenario de un proceso
+    
+    La huella (páginas distintas tocadas) se detecta al leer. Con
+    compactar, las páginas se renumeran 0..huella-1 en orden de
+    dirección, de modo que un espacio de 64 bits disperso se simula con
+    una tabla del tamaño de la huella; páginas contiguas siguen siendo
+    contiguas. Sin compactar se conservan los números reales.
+    
+    Returns:
+        Diccionario de escenario como el de cargar_traza_binaria, con
+        la secuencia en un memoryview uint32, más huella (páginas
+        distintas) y pagina_minima / pagina_maxima (números reales)
+    
+    Raises:
+        ValueError: Si el formato es inválido, o si sin compactar alguna
+            página no cabe en una referencia (ver MASCARA_PAGINA)
+    """
+    bloques = []
+    marcas = []
+    unicas = np.empty(0, dtype=np.uint64)
+    for direcciones, escrituras in iterar_bloques_direcciones(ruta, formato, base):
+        paginas, _ = descomponer_direcciones(direcciones, tamano_pagina)
+        unicas = np.union1d(unicas, np.unique(paginas))
+        bloques.append(paginas)
+        marcas.append(escrituras if escrituras is not None
+                      else np.zeros(len(paginas), dtype=bool))
+    
+    paginas = (np.concatenate(bloques) if bloques
+               else np.empty(0, dtype=np.uint64))
+    escrituras = (np.concatenate(marcas) if marcas
+                  else np.empty(0, dtype=bool))
+    del bloques, marcas
+    
+    if compactar:
+        referencias = (_renumerar(paginas, unicas) if len(unicas)
+                       else np.empty(0, dtype=np.uint32))
+        paginas_virtuales = len(unicas)
+    else:
+        if len(unicas) and unicas[-1] >= BIT_ESCRITURA:
+            raise ValueError(
+                f"La página {int(unicas[-1])} no cabe en una referencia; "
+                f"use compactar o un tamaño de página mayor"
+            )
+        referencias = paginas.astype(np.uint32)
+        paginas_virtuales = int(unicas[-1]) + 1 if len(unicas) else 0
+    del paginas
+    referencias[escrituras] |= np.uint32(BIT_ESCRITURA)
+    
+    secuencia = memoryview(referencias).cast("B").cast("I")
+    return {
+        "marcos_fisicos": None,
+        "algoritmo": None,
+        "paginas_virtuales": paginas_virtuales or None,
+        "tamano_pagina": tamano_pagina,
+        "procesos": {1: secuencia},
+        "secuencia": secuencia,
+        "escrituras": bool(escrituras.any()),
+        "huella": len(unicas),
+        "pagina_minima": int(unicas[0]) if len(unicas) else None,
+        "pagina_maxima": int(unicas[-1]) if len(unicas) else None
+    }
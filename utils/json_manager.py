@@ -1,19 +1,67 @@
 """
-Gestión de escenarios en formato JSON
+Gestión de escenarios en formato JSON (y binario para trazas grandes)
 """
 
 import json
 
+from .trace_manager import (EXTENSION_BINARIA, es_traza_binaria,
+                            guardar_traza_binaria, cargar_traza_binaria,
+                            parsear_referencia, formatear_referencia)
+
+def _a_json(secuencia) -> list:
+    """Referencias para JSON: enteros, y "<página>w" en las escrituras"""
+    return [formatear_referencia(referencia) for referencia in secuencia]
+
+def _desde_json(secuencia) -> list:
+    """Inverso de _a_json (acepta también "<página>r")"""
+    return [referencia if isinstance(referencia, int)
+            else parsear_referencia(referencia)
+            for referencia in secuencia]
+
 def guardar_escenario(ruta, datos):
     """
     Guarda un escenario en un archivo JSON
+    
+    Si la ruta termina en .mvt se usa el formato binario compacto,
+    pensado para trazas grandes; el JSON queda para escenarios didácticos.
+    En JSON las escrituras se guardan como "<página>w".
     """
+    if str(ruta).lower().endswith(EXTENSION_BINARIA):
+        procesos = datos.get("procesos") or {1: datos["secuencia"]}
+        guardar_traza_binaria(
+            ruta, procesos,
+            tamano_pagina=datos.get("tamano_pagina", 4096),
+            marcos_fisicos=datos.get("marcos_fisicos") or 0,
+            paginas_virtuales=datos.get("paginas_virtuales") or 0,
+            algoritmo=datos.get("algoritmo") or ""
+        )
+        return
+    
+    if "secuencia" in datos:
+        datos = dict(datos, secuencia=_a_json(datos["secuencia"]))
+    if "procesos" in datos:
+        datos = dict(datos, procesos={
+            proceso_id: _a_json(secuencia)
+            for proceso_id, secuencia in datos["procesos"].items()
+        })
     with open(ruta, "w", encoding="utf-8") as f:
         json.dump(datos, f, indent=4)
 
 def cargar_escenario(ruta):
     """
-    Carga un escenario desde un archivo JSON
+    Carga un escenario desde un archivo JSON o una traza binaria
+    
+    El formato se detecta por la firma del archivo.
     """
+    if es_traza_binaria(ruta):
+        return cargar_traza_binaria(ruta)
     with open(ruta, "r", encoding="utf-8") as f:
-        return json.load(f)
+        datos = json.load(f)
+    if "secuencia" in datos:
+        datos["secuencia"] = _desde_json(datos["secuencia"])
+    if "procesos" in datos:
+        datos["procesos"] = {
+            proceso_id: _desde_json(secuencia)
+            for proceso_id, secuencia in datos["procesos"].items()
+        }
+    return datos
@@ -0,0 +1,210 @@
+"""
+Gestión de trazas de referencias en formato texto y binario
+
+Formato binario (.mvt, little-endian):
+    Cabecera (32 bytes): magia "MVTR", versión (u16), banderas (u16),
+        tamaño de página, marcos físicos, páginas virtuales y cantidad
+        de procesos (u32 cada uno), algoritmo (8 bytes ASCII)
+    Índice: por proceso, id (u32), reservado (u32), longitud (u64) y
+        desplazamiento en bytes (u64)
+    Datos: un arreglo uint32 empaquetado por proceso, alineado a 8 bytes;
+        en las escrituras el bit 31 está encendido (BIT_ESCRITURA), y la
+        bandera BANDERA_ESCRITURAS de la cabecera indica que hay alguna
+
+Cada arreglo se puede abrir sin copias con el memoryview que retorna
+cargar_traza_binaria, con array.array.frombytes o con numpy.memmap
+(dtype '<u4', offset = desplazamiento).
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+
+from models.proceso_model import BIT_ESCRITURA, MASCARA_PAGINA
+
+MAGIA_BINARIA = b"MVTR"
+VERSION_BINARIA = 1
+BANDERA_ESCRITURAS = 1
+EXTENSION_BINARIA = ".mvt"
+_CABECERA = struct.Struct("<4sHHIIII8s")
+_ENTRADA = struct.Struct("<IIQQ")
+_BLOQUE_ESCRITURA = 1 << 16
+
+def parsear_referencia(token: str) -> int:
+    """
+    Convierte una referencia de texto ("5", "5r" o "5w") en su valor
+    
+    Las escrituras ("w") se codifican con BIT_ESCRITURA encendido.
+    """
+    sufijo = token[-1]
+    if sufijo in "wW":
+        return int(token[:-1]) | BIT_ESCRITURA
+    if sufijo in "rR":
+        return int(token[:-1])
+    return int(token)
+
+def formatear_referencia(referencia: int):
+    """Inverso de parsear_referencia: la página, o "<página>w" si es escritura"""
+    if referencia & BIT_ESCRITURA:
+        return f"{referencia & MASCARA_PAGINA}w"
+    return referencia
+
+def parsear_traza(texto: str) -> list:
+    """
+    Convierte el texto de una traza en una lista de referencias
+    
+    Las referencias pueden separarse por comas, espacios o saltos de
+    línea, con un sufijo opcional r/w (lectura por defecto). Todo lo que
+    sigue a '#' en una línea se ignora.
+    """
+    secuencia = []
+    for linea in texto.splitlines():
+        linea = linea.split("#", 1)[0]
+        for token in linea.replace(",", " ").split():
+            secuencia.append(parsear_referencia(token))
+    return secuencia
+
+def cargar_traza(ruta):
+    """
+    Carga una traza de referencias desde un archivo de texto
+    """
+    with open(ruta, "r", encoding="utf-8") as f:
+        return parsear_traza(f.read())
+
+def iterar_traza(ruta):
+    """
+    Recorre una traza de texto línea por línea sin cargarla completa
+    
+    Útil junto con FlujoReferencias:
+        FlujoReferencias(lambda: iterar_traza(ruta))
+    """
+    with open(ruta, "r", encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.split("#", 1)[0]
+            for token in linea.replace(",", " ").split():
+                yield parsear_referencia(token)
+
+def mapear_traza_binaria(ruta, desplazamiento: int = 0) -> memoryview:
+    """
+    Mapea en memoria un archivo de enteros uint32 (orden de bytes nativo)
+    
+    Retorna un memoryview indexable que el sistema operativo pagina bajo
+    demanda, por lo que no se copia la traza a la memoria del proceso.
+    """
+    with open(ruta, "rb") as f:
+        if f.seek(0, 2) <= desplazamiento:
+            return memoryview(b"").cast("I")
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    datos = memoryview(mapa)[desplazamiento:]
+    return datos[:len(datos) - len(datos) % 4].cast("I")
+
+def es_traza_binaria(ruta) -> bool:
+    """Verifica si el archivo comienza con la firma del formato binario"""
+    with open(ruta, "rb") as f:
+        return f.read(len(MAGIA_BINARIA)) == MAGIA_BINARIA
+
+def _escribir_uint32(f, secuencia) -> tuple:
+    """
+    Escribe una secuencia como uint32 little-endian, por bloques
+    
+    Returns:
+        (cantidad escrita, si alguna referencia es una escritura)
+    """
+    tipo = getattr(secuencia, "typecode", None) or getattr(secuencia, "format", None)
+    if (isinstance(secuencia, (array, memoryview)) and tipo == "I"
+            and secuencia.itemsize == 4 and sys.byteorder == "little"):
+        f.write(secuencia)
+        escrituras = len(secuencia) > 0 and max(secuencia) >= BIT_ESCRITURA
+        return len(secuencia), escrituras
+    
+    total = 0
+    escrituras = False
+    iterador = iter(secuencia)
+    while True:
+        bloque = array("I", islice(iterador, _BLOQUE_ESCRITURA))
+        if not bloque:
+            return total, escrituras
+        escrituras = escrituras or max(bloque) >= BIT_ESCRITURA
+        if sys.byteorder != "little":
+            bloque.byteswap()
+        f.write(bloque)
+        total += len(bloque)
+
+def guardar_traza_binaria(ruta, procesos: dict, tamano_pagina: int = 4096,
+                          marcos_fisicos: int = 0, paginas_virtuales: int = 0,
+                          algoritmo: str = ""):
+    """
+    Guarda una o más secuencias en el formato binario
+    
+    Args:
+        procesos: proceso_id -> secuencia (lista, array, memoryview o
+            cualquier iterable de referencias, ver parsear_referencia)
+    """
+    with open(ruta, "wb") as f:
+        inicio_datos = _CABECERA.size + _ENTRADA.size * len(procesos)
+        f.write(b"\0" * inicio_datos)
+        
+        entradas = []
+        banderas = 0
+        for proceso_id, secuencia in procesos.items():
+            relleno = -f.tell() % 8
+            f.write(b"\0" * relleno)
+            desplazamiento = f.tell()
+            longitud, escrituras = _escribir_uint32(f, secuencia)
+            if escrituras:
+                banderas |= BANDERA_ESCRITURAS
+            entradas.append(_ENTRADA.pack(proceso_id, 0, longitud, desplazamiento))
+        
+        f.seek(0)
+        f.write(_CABECERA.pack(
+            MAGIA_BINARIA, VERSION_BINARIA, banderas, tamano_pagina,
+            marcos_fisicos, paginas_virtuales, len(procesos),
+            algoritmo.encode("ascii")[:8]
+        ))
+        f.write(b"".join(entradas))
+
+def cargar_traza_binaria(ruta) -> dict:
+    """
+    Carga una traza binaria mapeándola en memoria (sin copiar los datos)
+    
+    Returns:
+        Diccionario de escenario: marcos_fisicos, algoritmo,
+        paginas_virtuales, tamano_pagina, procesos (id -> memoryview
+        uint32), secuencia (la del primer proceso) y escrituras (si la
+        traza marca accesos de escritura)
+    """
+    with open(ruta, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    (magia, version, banderas, tamano_pagina, marcos, paginas,
+     num_procesos, algoritmo) = _CABECERA.unpack_from(mapa, 0)
+    if magia != MAGIA_BINARIA:
+        raise ValueError(f"{ruta} no es una traza binaria")
+    if version != VERSION_BINARIA:
+        raise ValueError(f"Versión de traza binaria no soportada: {version}")
+    
+    datos = memoryview(mapa)
+    procesos = {}
+    for i in range(num_procesos):
+        proceso_id, _, longitud, desplazamiento = _ENTRADA.unpack_from(
+            mapa, _CABECERA.size + i * _ENTRADA.size
+        )
+        vista = datos[desplazamiento:desplazamiento + longitud * 4]
+        if sys.byteorder == "little":
+            procesos[proceso_id] = vista.cast("I")
+        else:
+            copia = array("I", vista.tobytes())
+            copia.byteswap()
+            procesos[proceso_id] = copia
+    
+    return {
+        "marcos_fisicos": marcos or None,
+        "algoritmo": algoritmo.rstrip(b"\0").decode("ascii") or None,
+        "paginas_virtuales": paginas or None,
+        "tamano_pagina": tamano_pagina,
+        "procesos": procesos,
+        "secuencia": next(iter(procesos.values()), []),
+        "escrituras": bool(banderas & BANDERA_ESCRITURAS)
+    }
@@ -96,7 +96,7 @@ class MainView(QMainWindow):
         algoritmo_layout.addWidget(lbl_algoritmo)
 
         self.combo_algoritmo = QComboBox()
-        self.combo_algoritmo.addItems(["FIFO", "LRU", "NRU", "CLOCK", "OPT"])
+        self.combo_algoritmo.addItems(["FIFO", "LRU", "NRU", "CLOCK", "WSCLOCK", "OPT"])
         self.combo_algoritmo.setFixedWidth(160)
         algoritmo_layout.addWidget(self.combo_algoritmo)
 
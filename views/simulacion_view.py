@@ -5,7 +5,7 @@ VISTA: Componentes visuales para simulación y estadísticas
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QPushButton, QSpinBox, QLineEdit,
-    QTextEdit
+    QTextEdit, QComboBox
 )
 from PyQt6.QtCore import Qt
 
@@ -120,17 +120,54 @@ class SimulacionView(QWidget):
         self.txt_secuencia.setFixedHeight(36)
         self.txt_secuencia.setToolTip(
             "Secuencia de accesos a memoria\n"
-            "separada por comas."
+            "separada por comas. Un sufijo 'w'\n"
+            "marca una escritura (p. ej. 5w)."
         )
 
         box_seq_layout.addWidget(self.txt_secuencia)
         box_secuencia.setLayout(box_seq_layout)
         layout_proceso.addWidget(box_secuencia)
 
+        # Carga sintética
+        box_carga = QGroupBox("🧪 Carga Sintética")
+        box_carga_layout = QHBoxLayout()
+
+        self.combo_modelo = QComboBox()
+        self.combo_modelo.addItems(
+            ["uniforme", "zipf", "fases", "secuencial", "bucle", "mixto"]
+        )
+        self.combo_modelo.setFixedHeight(36)
+        self.combo_modelo.setToolTip(
+            "Modelo de localidad de la secuencia generada:\n"
+            "uniforme, Zipf, fases de conjunto de trabajo,\n"
+            "recorridos secuenciales, bucle o una mezcla."
+        )
+
+        self.spin_longitud = QSpinBox()
+        self.spin_longitud.setRange(1, 10000)
+        self.spin_longitud.setValue(20)
+        self.spin_longitud.setFixedHeight(36)
+        self.spin_longitud.setToolTip("Cantidad de referencias a generar")
+
+        self.spin_semilla = QSpinBox()
+        self.spin_semilla.setRange(0, 2**31 - 1)
+        self.spin_semilla.setSpecialValueText("Semilla al azar")
+        self.spin_semilla.setFixedHeight(36)
+        self.spin_semilla.setToolTip(
+            "Semilla del generador. La misma semilla\n"
+            "reproduce la misma secuencia."
+        )
+
+        box_carga_layout.addWidget(self.combo_modelo)
+        box_carga_layout.addWidget(self.spin_longitud)
+        box_carga_layout.addWidget(self.spin_semilla)
+        box_carga.setLayout(box_carga_layout)
+        layout_proceso.addWidget(box_carga)
+
         # Botones de carga de secuencia
         self.btn_generar = QPushButton("🎲 Generar secuencia")
         self.btn_generar.setFixedHeight(36)
-        self.btn_generar.setToolTip("Genera una secuencia aleatoria")
+        self.btn_generar.setToolTip("Genera una secuencia con el modelo elegido")
         layout_proceso.addWidget(self.btn_generar)
 
         self.btn_cargar = QPushButton("📥 Usar secuencia manual")
@@ -212,6 +249,9 @@ class SimulacionView(QWidget):
         return {
             'spin_paginas': self.spin_paginas,
             'txt_secuencia': self.txt_secuencia,
+            'combo_modelo': self.combo_modelo,
+            'spin_longitud': self.spin_longitud,
+            'spin_semilla': self.spin_semilla,
             'btn_generar': self.btn_generar,
             'btn_cargar': self.btn_cargar,
             'btn_ejecutar': self.btn_ejecutar,